@@ -0,0 +1,159 @@
+"""Measure GET /api/v1/contacts?search=... latency on a large tenant.
+
+Runs the ASGI app in-process against the database configured by DATABASE_URL (and
+Redis from REDIS_URL). A fresh organization is seeded with ``--contacts`` rows using
+set-based SQL, so existing data is untouched::
+
+    python benchmarks/contact_search.py --contacts 1000000 --iterations 50
+
+Search terms are chosen to match very different numbers of contacts; with the pg_trgm
+GIN indexes latency should follow the match count, not the size of the tenant. The
+query plan of each search is printed so index usage can be confirmed.
+
+Reference run: PostgreSQL 18.6 with stock pg_trgm 1.6, 1M contacts, 1 CPU,
+shared_buffers=512MB, 20 iterations. The seq scan column is EXPLAIN ANALYZE of the
+same query with bitmap and index scans disabled::
+
+    term            matches   p50 ms   p95 ms   seq scan ms
+    user123457@           1     68.6     87.3          1313
+    kowalczyk        100000    918.8   1098.0          2050
+    mail42.example     1000     78.4    101.3          1623
+    anna             125000    727.6    856.5          2247
+
+Every term is a BitmapAnd of ix_contacts_organization_id with a BitmapOr over
+ix_contacts_name_trgm and ix_contacts_email_trgm. Broad terms spend their time
+rechecking and ranking every match (14k heap blocks), not in the index scans.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select, text
+
+from mini_crm.app.main import app
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.db import Base, get_engine, get_session_factory
+from mini_crm.core.security import create_access_token
+from mini_crm.modules import load_model_modules
+from mini_crm.modules.auth.models import OrganizationMember, User
+from mini_crm.modules.contacts.models import Contact
+from mini_crm.modules.contacts.repositories.sqlalchemy import _apply_filters, _ordering
+from mini_crm.modules.organizations.models import Organization
+from mini_crm.shared.enums import UserRole
+
+# From a single match to an eighth of the tenant
+SEARCH_TERMS = ["user123457@", "kowalczyk", "mail42.example", "anna"]
+
+SEED_SQL = text(
+    """
+    INSERT INTO contacts (organization_id, owner_id, name, email, phone, created_at)
+    SELECT
+        :organization_id,
+        :owner_id,
+        (ARRAY['Anna', 'Boris', 'Chen', 'Dana', 'Emil', 'Fatima', 'Goran', 'Hiro'])[1 + g % 8]
+            || ' '
+            || (ARRAY['Smith', 'Kowalczyk', 'Nguyen', 'Garcia', 'Okafor', 'Ivanova',
+                      'Tanaka', 'Muller', 'Rossi', 'Haddad'])[1 + (g / 8) % 10]
+            || ' ' || g,
+        'user' || g || '@mail' || (g % 1000) || '.example.com',
+        '+1' || lpad(g::text, 10, '0'),
+        now()
+    FROM generate_series(1, :count) AS g
+    """
+)
+
+
+async def seed(contact_count: int) -> tuple[int, int]:
+    """Create an isolated organization with one owner and ``contact_count`` contacts."""
+    suffix = uuid.uuid4().hex[:12]
+    now = datetime.now(tz=UTC)
+    async with get_session_factory()() as session:
+        organization = Organization(name=f"bench-{suffix}", created_at=now)
+        user = User(
+            email=f"bench-{suffix}@example.com",
+            hashed_password="unused",
+            name="Benchmark",
+            created_at=now,
+        )
+        session.add_all([organization, user])
+        await session.flush()
+        session.add(
+            OrganizationMember(
+                organization_id=organization.id, user_id=user.id, role=UserRole.OWNER
+            )
+        )
+        await session.execute(
+            SEED_SQL,
+            {"organization_id": organization.id, "owner_id": user.id, "count": contact_count},
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE contacts"))
+        return organization.id, user.id
+
+
+async def explain(organization_id: int, term: str) -> str:
+    stmt = _apply_filters(select(Contact), organization_id, term, None)
+    stmt = stmt.order_by(*_ordering(term)).limit(50)
+    compiled = stmt.compile(get_engine().sync_engine, compile_kwargs={"literal_binds": True})
+    async with get_session_factory()() as session:
+        rows = await session.execute(text(f"EXPLAIN (ANALYZE, COSTS OFF) {compiled}"))
+        return "\n".join(f"    {row[0]}" for row in rows)
+
+
+async def run(contact_count: int, iterations: int, show_plans: bool) -> None:
+    load_model_modules()
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    organization_id, user_id = await seed(contact_count)
+    print(f"seeded {contact_count} contacts in {time.perf_counter() - started:.1f}s")
+    headers = {
+        "Authorization": f"Bearer {create_access_token(user_id)}",
+        "X-Organization-Id": str(organization_id),
+    }
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'term':<18} {'matches':>9} {'p50 ms':>9} {'p95 ms':>9}")
+        for term in SEARCH_TERMS:
+            latencies: list[float] = []
+            total = 0
+            for _ in range(iterations):
+                request_started = time.perf_counter()
+                response = await client.get(
+                    "/api/v1/contacts", params={"search": term}, headers=headers
+                )
+                latencies.append((time.perf_counter() - request_started) * 1000)
+                response.raise_for_status()
+                total = response.json()["meta"]["total"]
+            latencies.sort()
+            p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+            print(f"{term:<18} {total:>9} {statistics.median(latencies):>9.2f} {p95:>9.2f}")
+            if show_plans:
+                print(await explain(organization_id, term))
+
+    await RedisCache.get_instance().close()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--plans", action="store_true", help="print EXPLAIN ANALYZE output")
+    args = parser.parse_args()
+    asyncio.run(run(args.contacts, args.iterations, args.plans))
+
+
+if __name__ == "__main__":
+    main()
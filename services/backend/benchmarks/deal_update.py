@@ -0,0 +1,139 @@
+"""Measure PATCH /api/v1/deals/{id} latency and SQL statements per request.
+
+Runs the ASGI app in-process against the database configured by DATABASE_URL (and
+Redis from REDIS_URL), seeding a fresh organization so existing data is untouched::
+
+    python benchmarks/deal_update.py --deals 50 --iterations 1000
+
+Each iteration flips one deal between ``new`` and ``in_progress``, so every request
+also writes a STATUS_CHANGED activity.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from mini_crm.app.main import app
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.db import Base, get_engine, get_session_factory
+from mini_crm.core.security import create_access_token
+from mini_crm.modules import load_model_modules
+from mini_crm.modules.auth.models import OrganizationMember, User
+from mini_crm.modules.contacts.models import Contact
+from mini_crm.modules.deals.models import Deal
+from mini_crm.modules.organizations.models import Organization
+from mini_crm.shared.enums import DealStatus, UserRole
+
+
+async def seed(deal_count: int) -> tuple[int, int, list[int]]:
+    """Create an isolated organization with one owner and ``deal_count`` deals."""
+    suffix = uuid.uuid4().hex[:12]
+    now = datetime.now(tz=UTC)
+    async with get_session_factory()() as session:
+        organization = Organization(name=f"bench-{suffix}", created_at=now)
+        user = User(
+            email=f"bench-{suffix}@example.com",
+            hashed_password="unused",
+            name="Benchmark",
+            created_at=now,
+        )
+        session.add_all([organization, user])
+        await session.flush()
+        session.add(
+            OrganizationMember(
+                organization_id=organization.id, user_id=user.id, role=UserRole.OWNER
+            )
+        )
+        contact = Contact(
+            organization_id=organization.id, owner_id=user.id, name="Contact", created_at=now
+        )
+        session.add(contact)
+        await session.flush()
+        deals = [
+            Deal(
+                organization_id=organization.id,
+                contact_id=contact.id,
+                owner_id=user.id,
+                title=f"Deal {index}",
+                amount=Decimal("100.00"),
+                status=DealStatus.NEW,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(deal_count)
+        ]
+        session.add_all(deals)
+        await session.commit()
+        return organization.id, user.id, [deal.id for deal in deals]
+
+
+async def run(deal_count: int, iterations: int, warmup: int) -> None:
+    load_model_modules()
+    engine = get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    organization_id, user_id, deal_ids = await seed(deal_count)
+    headers = {
+        "Authorization": f"Bearer {create_access_token(user_id)}",
+        "X-Organization-Id": str(organization_id),
+    }
+
+    statements = 0
+
+    def count_statement(*_args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    latencies: list[float] = []
+    statuses = [DealStatus.IN_PROGRESS.value, DealStatus.NEW.value]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        for iteration in range(warmup + iterations):
+            deal_id = deal_ids[iteration % len(deal_ids)]
+            payload = {"status": statuses[(iteration // len(deal_ids)) % 2]}
+            if iteration == warmup:
+                statements = 0
+            started = time.perf_counter()
+            response = await client.patch(f"/api/v1/deals/{deal_id}", json=payload, headers=headers)
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            if iteration >= warmup:
+                latencies.append(elapsed * 1000)
+
+    event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+    await RedisCache.get_instance().close()
+    await engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    print(f"requests:            {len(latencies)}")
+    print(f"mean latency (ms):   {statistics.fmean(latencies):.2f}")
+    print(f"p50 latency (ms):    {statistics.median(latencies):.2f}")
+    print(f"p95 latency (ms):    {p95:.2f}")
+    print(f"statements/request:  {statements / len(latencies):.2f} (including auth)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deals", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.deals, args.iterations, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Secondary indexes matching list, filter and analytics queries
+
+Revision ID: 0002_query_indexes
+Revises: 0001_initial
+Create Date: 2026-10-19 00:00:00
+
+Indexes are built with CREATE INDEX CONCURRENTLY outside the migration transaction,
+so the migration can be applied to a live database without blocking writes. If a
+concurrent build fails it leaves an INVALID index behind; drop it and rerun.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0002_query_indexes"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+INDEXES: list[tuple[str, str, list[str]]] = [
+    # Foreign keys declared with index=True on the models
+    ("ix_contacts_organization_id", "contacts", ["organization_id"]),
+    ("ix_contacts_owner_id", "contacts", ["owner_id"]),
+    ("ix_deals_contact_id", "deals", ["contact_id"]),
+    ("ix_deals_owner_id", "deals", ["owner_id"]),
+    ("ix_organization_members_user_id", "organization_members", ["user_id"]),
+    # Organization-scoped deal filters and sorts
+    ("ix_deals_org_status", "deals", ["organization_id", "status"]),
+    ("ix_deals_org_stage", "deals", ["organization_id", "stage"]),
+    ("ix_deals_org_created_at", "deals", ["organization_id", "created_at", "id"]),
+    ("ix_deals_org_amount", "deals", ["organization_id", "amount", "id"]),
+    # Open tasks of a deal ordered by due date
+    ("ix_tasks_deal_done_due", "tasks", ["deal_id", "is_done", "due_date"]),
+    # Deal timeline
+    ("ix_activities_deal_created_at", "activities", ["deal_id", "created_at"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,37 @@
+"""Case-insensitive contact email index for import de-duplication
+
+Revision ID: 0003_contact_email_index
+Revises: 0002_query_indexes
+Create Date: 2026-10-19 00:00:00
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0003_contact_email_index"
+down_revision = "0002_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_org_email_lower",
+            "contacts",
+            ["organization_id", sa.text("lower(email)")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_org_email_lower",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,51 @@
+"""Trigram GIN indexes for contact search
+
+Revision ID: 0004_contact_trigram_search
+Revises: 0003_contact_email_index
+Create Date: 2026-10-19 00:00:00
+
+Contact search filters with ILIKE '%term%', which a B-tree cannot serve. pg_trgm GIN
+indexes answer those predicates (and similarity ranking) from the index instead of
+scanning every contact of the organization.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0004_contact_trigram_search"
+down_revision = "0003_contact_email_index"
+branch_labels = None
+depends_on = None
+
+
+INDEXES: list[tuple[str, str]] = [
+    ("ix_contacts_name_trgm", "name"),
+    ("ix_contacts_email_trgm", "email"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name,
+                "contacts",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _column in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
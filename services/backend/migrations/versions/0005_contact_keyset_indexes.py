@@ -0,0 +1,47 @@
+"""Composite indexes for keyset pagination of contacts
+
+Revision ID: 0005_contact_keyset_indexes
+Revises: 0004_contact_trigram_search
+Create Date: 2026-10-19 00:00:00
+
+Cursor pages read ``WHERE organization_id = ? [AND owner_id = ?] AND id > ? ORDER BY
+id LIMIT n``; these indexes answer that with a short range scan at any depth.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0005_contact_keyset_indexes"
+down_revision = "0004_contact_trigram_search"
+branch_labels = None
+depends_on = None
+
+
+INDEXES: list[tuple[str, list[str]]] = [
+    ("ix_contacts_org_id", ["organization_id", "id"]),
+    ("ix_contacts_org_owner_id", ["organization_id", "owner_id", "id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "contacts",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,50 @@
+"""Covering indexes for keyset pagination of tasks
+
+Revision ID: 0006_task_keyset_indexes
+Revises: 0005_contact_keyset_indexes
+Create Date: 2026-10-19 00:00:00
+
+Task pages read ``ORDER BY created_at DESC, id DESC`` or ``ORDER BY due_date, id``
+after a cursor position. Both indexes include ``deal_id`` and ``is_done``, so the
+organization join and the open filter are evaluated on index entries and the scan
+stops after one page.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0006_task_keyset_indexes"
+down_revision = "0005_contact_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+INDEXES: list[tuple[str, list[str]]] = [
+    ("ix_tasks_created_at_id", ["created_at", "id"]),
+    ("ix_tasks_due_date_id", ["due_date", "id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_include=["deal_id", "is_done"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,139 @@
+"""Denormalized organization_id on tasks and activities
+
+Revision ID: 0007_task_activity_organization
+Revises: 0006_task_keyset_indexes
+Create Date: 2026-10-19 00:00:00
+
+Tenant-scoped task and activity reads joined deals only to learn the organization.
+The column is added nullable and backfilled from deals in id ranges, each committed
+on its own, so no long transaction or table lock is held. It is then made NOT NULL
+through a CHECK constraint added NOT VALID and validated in a later transaction, so
+the validating scan does not block writes and SET NOT NULL can skip its own scan.
+Indexes are built concurrently; the organization-scoped task indexes replace the
+table-wide keyset indexes from 0006.
+
+Once the constraint is added, writes that leave organization_id NULL are rejected:
+the previous release, which does not set the column, must be stopped before this
+revision runs. Rows it inserted during the backfill are filled in just before the
+constraint is validated.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0007_task_activity_organization"
+down_revision = "0006_task_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ["tasks", "activities"]
+
+BACKFILL_BATCH_SIZE = 10_000
+
+INDEXES: list[tuple[str, str, list[str], list[str]]] = [
+    ("ix_tasks_org_created_at_id", "tasks", ["organization_id", "created_at", "id"], ["is_done"]),
+    ("ix_tasks_org_due_date_id", "tasks", ["organization_id", "due_date", "id"], ["is_done"]),
+    (
+        "ix_activities_org_deal_created_at",
+        "activities",
+        ["organization_id", "deal_id", "created_at"],
+        [],
+    ),
+]
+
+REPLACED_INDEXES: list[tuple[str, list[str]]] = [
+    ("ix_tasks_created_at_id", ["created_at", "id"]),
+    ("ix_tasks_due_date_id", ["due_date", "id"]),
+]
+
+
+def _fill_range(table: str, start: int, stop: int) -> None:
+    op.get_bind().execute(
+        sa.text(
+            f"UPDATE {table} AS t SET organization_id = d.organization_id FROM deals AS d "
+            "WHERE d.id = t.deal_id AND t.organization_id IS NULL "
+            "AND t.id > :start AND t.id <= :stop"
+        ),
+        {"start": start, "stop": stop},
+    )
+
+
+def _backfill(table: str) -> int:
+    """Fill the column in id ranges and return the highest id covered."""
+    max_id: int = op.get_bind().scalar(sa.text(f"SELECT coalesce(max(id), 0) FROM {table}"))
+    for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+        _fill_range(table, start, start + BACKFILL_BATCH_SIZE)
+    return max_id
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "organization_id",
+                sa.Integer(),
+                sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+                nullable=True,
+            ),
+        )
+
+    # Each statement below commits on its own, so the brief ACCESS EXCLUSIVE lock taken
+    # by ADD CONSTRAINT is released before VALIDATE scans the table
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            covered = _backfill(table)
+            constraint = f"{table}_organization_id_not_null"
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+                "CHECK (organization_id IS NOT NULL) NOT VALID"
+            )
+            # Rows written by the previous release while the ranges were being filled
+            _fill_range(table, covered, 2**31 - 1)
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
+            op.alter_column(table, "organization_id", nullable=False)
+            op.drop_constraint(constraint, table, type_="check")
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _columns in REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                "tasks",
+                columns,
+                postgresql_include=["deal_id", "is_done"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _columns, _include in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    for table in reversed(TABLES):
+        op.drop_column(table, "organization_id")
@@ -0,0 +1,47 @@
+"""Task due reminders
+
+Revision ID: 0008_task_reminders
+Revises: 0007_task_activity_organization
+Create Date: 2026-10-19 00:00:00
+
+The reminder worker claims open tasks that fell due and stamps reminded_at on them.
+Its scan reads a partial index holding only open, not yet reminded tasks by due date,
+so the index stays small as reminders are sent. The nullable column is added without
+a table rewrite and the index is built concurrently.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0008_task_reminders"
+down_revision = "0007_task_activity_organization"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("reminded_at", sa.DateTime(timezone=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_due_reminders",
+            "tasks",
+            ["due_date"],
+            postgresql_where=sa.text("is_done = false AND reminded_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_due_reminders",
+            table_name="tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.drop_column("tasks", "reminded_at")
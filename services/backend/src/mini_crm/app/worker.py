@@ -0,0 +1,218 @@
+"""Background workers: analytics cache warming, contact duplicate scans and task reminders.
+
+Run with ``python -m mini_crm.app.worker``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from mini_crm.config.logging import configure_logging
+from mini_crm.config.settings import Settings, get_settings
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.db import get_engine, get_session_factory
+from mini_crm.modules.activities.repositories.sqlalchemy import SQLAlchemyActivityRepository
+from mini_crm.modules.analytics.application.tracking import AnalyticsActivityTracker
+from mini_crm.modules.analytics.application.use_cases import (
+    GetDealsFunnelUseCase,
+    GetDealsSummaryUseCase,
+)
+from mini_crm.modules.analytics.repositories.sqlalchemy import SQLAlchemyAnalyticsRepository
+from mini_crm.modules.contacts.application.duplicates import ContactDuplicateScanQueue
+from mini_crm.modules.contacts.application.use_cases import ScanContactDuplicatesUseCase
+from mini_crm.modules.contacts.repositories.sqlalchemy import SQLAlchemyContactRepository
+from mini_crm.modules.tasks.application.use_cases import SendTaskRemindersUseCase
+from mini_crm.modules.tasks.repositories.sqlalchemy import SQLAlchemyTaskRepository
+
+logger = structlog.get_logger(__name__)
+
+
+class AnalyticsWorker:
+    """Recomputes summary and funnel caches for organizations that are being watched."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: RedisCache,
+        settings: Settings | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.cache = cache
+        self.tracker = AnalyticsActivityTracker(cache)
+        self.settings = settings or get_settings()
+        # Caps concurrent DB work so the worker never competes with the API for the pool
+        self._semaphore = asyncio.Semaphore(self.settings.analytics_worker_concurrency)
+
+    async def run_once(self, refresh_all: bool = False) -> list[int]:
+        """Refresh dirty active organizations, or every active one when ``refresh_all``."""
+        active = set(
+            await self.tracker.active_organizations(self.settings.analytics_active_window_seconds)
+        )
+        dirty = set(await self.tracker.pop_dirty_organizations())
+        targets = sorted(active if refresh_all else active & dirty)
+
+        await asyncio.gather(*(self._refresh(organization_id) for organization_id in targets))
+        return targets
+
+    async def run_forever(self) -> None:
+        """Poll for dirty organizations and periodically refresh all active ones."""
+        last_full_refresh = 0.0
+        while True:
+            now = time.monotonic()
+            refresh_all = (
+                now - last_full_refresh >= self.settings.analytics_worker_refresh_interval_seconds
+            )
+            try:
+                refreshed = await self.run_once(refresh_all=refresh_all)
+            except Exception:
+                logger.exception("analytics_worker_iteration_failed")
+            else:
+                if refresh_all:
+                    last_full_refresh = now
+                if refreshed:
+                    logger.info(
+                        "analytics_worker_refreshed",
+                        organizations=len(refreshed),
+                        full=refresh_all,
+                    )
+            await asyncio.sleep(self.settings.analytics_worker_poll_interval_seconds)
+
+    async def _refresh(self, organization_id: int) -> None:
+        async with self._semaphore:
+            try:
+                async with self.session_factory() as session:
+                    repository = SQLAlchemyAnalyticsRepository(session=session)
+                    await GetDealsSummaryUseCase(repository, self.cache).refresh(organization_id)
+                    await GetDealsFunnelUseCase(repository, self.cache).refresh(organization_id)
+            except Exception:
+                logger.exception("analytics_refresh_failed", organization_id=organization_id)
+
+
+class ContactDuplicateWorker:
+    """Runs queued contact duplicate scans one organization at a time."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: RedisCache,
+        settings: Settings | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.settings = settings or get_settings()
+        self.queue = ContactDuplicateScanQueue(
+            cache, self.settings.contact_dedup_report_ttl_seconds
+        )
+
+    async def run_once(self) -> list[int]:
+        """Scan every organization that requested it since the last run."""
+        scanned = await self.queue.pop_pending()
+        # Scans read a whole organization; running them in turn keeps the load bounded
+        for organization_id in scanned:
+            await self._scan(organization_id)
+        return scanned
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                scanned = await self.run_once()
+            except Exception:
+                logger.exception("contact_duplicate_worker_iteration_failed")
+            else:
+                if scanned:
+                    logger.info("contact_duplicate_worker_scanned", organizations=len(scanned))
+            await asyncio.sleep(self.settings.contact_dedup_poll_interval_seconds)
+
+    async def _scan(self, organization_id: int) -> None:
+        started = time.perf_counter()
+        try:
+            async with self.session_factory() as session:
+                use_case = ScanContactDuplicatesUseCase(
+                    SQLAlchemyContactRepository(session=session), self.queue
+                )
+                report = await use_case.refresh(organization_id)
+        except Exception:
+            logger.exception("contact_duplicate_scan_failed", organization_id=organization_id)
+        else:
+            logger.info(
+                "contact_duplicate_scan_finished",
+                organization_id=organization_id,
+                groups=report.total_groups,
+                seconds=round(time.perf_counter() - started, 3),
+            )
+
+
+class TaskReminderWorker:
+    """Sends reminders for tasks that fell due; any number of replicas may run it."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        cache: RedisCache,  # noqa: ARG002 - same signature as the other workers
+        settings: Settings | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.settings = settings or get_settings()
+
+    async def run_once(self) -> int:
+        """Remind about every task due so far, batch by batch; return how many were sent."""
+        sent = 0
+        while True:
+            batch = await self._send_batch()
+            sent += batch
+            # A short batch means the backlog is drained; an empty one always stops
+            if not batch or batch < self.settings.task_reminder_batch_size:
+                return sent
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                sent = await self.run_once()
+            except Exception:
+                logger.exception("task_reminder_worker_iteration_failed")
+            else:
+                if sent:
+                    logger.info("task_reminder_worker_sent", reminders=sent)
+            await asyncio.sleep(self.settings.task_reminder_poll_interval_seconds)
+
+    async def _send_batch(self) -> int:
+        # The claim and its activities commit together, so a failed batch is retried
+        async with self.session_factory() as session, session.begin():
+            use_case = SendTaskRemindersUseCase(
+                SQLAlchemyTaskRepository(session=session),
+                SQLAlchemyActivityRepository(session=session),
+                batch_size=self.settings.task_reminder_batch_size,
+                lookback_seconds=self.settings.task_reminder_lookback_seconds,
+            )
+            tasks = await use_case.execute()
+        for task in tasks:
+            logger.info("task_reminder_sent", task_id=task.id, deal_id=task.deal_id)
+        return len(tasks)
+
+
+async def run() -> None:
+    settings = get_settings()
+    cache = RedisCache.get_instance()
+    session_factory = get_session_factory()
+    analytics = AnalyticsWorker(session_factory, cache, settings)
+    duplicates = ContactDuplicateWorker(session_factory, cache, settings)
+    reminders = TaskReminderWorker(session_factory, cache, settings)
+    try:
+        await asyncio.gather(
+            analytics.run_forever(), duplicates.run_forever(), reminders.run_forever()
+        )
+    finally:
+        await cache.close()
+        await get_engine().dispose()
+
+
+def main() -> None:
+    configure_logging(get_settings())
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,49 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
     analytics_cache_ttl_seconds: int = Field(default=60, alias="ANALYTICS_CACHE_TTL_SECONDS")
+    analytics_active_window_seconds: int = Field(
+        default=900, alias="ANALYTICS_ACTIVE_WINDOW_SECONDS"
+    )
+    analytics_worker_poll_interval_seconds: float = Field(
+        default=5.0, alias="ANALYTICS_WORKER_POLL_INTERVAL_SECONDS"
+    )
+    analytics_worker_refresh_interval_seconds: float = Field(
+        default=45.0, alias="ANALYTICS_WORKER_REFRESH_INTERVAL_SECONDS"
+    )
+    analytics_worker_concurrency: int = Field(default=4, alias="ANALYTICS_WORKER_CONCURRENCY")
+
+    list_total_cache_ttl_seconds: int = Field(default=30, alias="LIST_TOTAL_CACHE_TTL_SECONDS")
+
+    contact_suggest_max_entries: int = Field(default=2_000_000, alias="CONTACT_SUGGEST_MAX_ENTRIES")
+    contact_suggest_max_contacts_per_organization: int = Field(
+        default=50_000, alias="CONTACT_SUGGEST_MAX_CONTACTS_PER_ORGANIZATION"
+    )
+    contact_suggest_idle_seconds: int = Field(default=900, alias="CONTACT_SUGGEST_IDLE_SECONDS")
+    contact_suggest_max_age_seconds: int = Field(
+        default=300, alias="CONTACT_SUGGEST_MAX_AGE_SECONDS"
+    )
+
+    contact_dedup_min_name_similarity: float = Field(
+        default=0.4, alias="CONTACT_DEDUP_MIN_NAME_SIMILARITY"
+    )
+    contact_dedup_max_block_size: int = Field(default=50, alias="CONTACT_DEDUP_MAX_BLOCK_SIZE")
+    contact_dedup_report_ttl_seconds: int = Field(
+        default=86_400, alias="CONTACT_DEDUP_REPORT_TTL_SECONDS"
+    )
+    contact_dedup_poll_interval_seconds: float = Field(
+        default=5.0, alias="CONTACT_DEDUP_POLL_INTERVAL_SECONDS"
+    )
+
+    task_reminder_batch_size: int = Field(default=500, ge=1, alias="TASK_REMINDER_BATCH_SIZE")
+    task_reminder_lookback_seconds: int = Field(
+        default=86_400, alias="TASK_REMINDER_LOOKBACK_SECONDS"
+    )
+    task_reminder_poll_interval_seconds: float = Field(
+        default=30.0, alias="TASK_REMINDER_POLL_INTERVAL_SECONDS"
+    )
+
+    fx_rates_file: str | None = Field(default=None, alias="FX_RATES_FILE")
+    fx_base_currency: str = Field(default="USD", alias="FX_BASE_CURRENCY")
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False
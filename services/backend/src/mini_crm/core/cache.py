@@ -60,6 +60,51 @@ class RedisCache:
             return
         await self._redis.delete(key)
 
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer key and return the new value."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return 0
+        result = await self._redis.incr(key)
+        return int(result)
+
+    async def zadd(self, key: str, member: str, score: float) -> None:
+        """Add member to sorted set or update its score."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return
+        await self._redis.zadd(key, {member: score})
+
+    async def zrangebyscore(self, key: str, min_score: float, max_score: float) -> list[bytes]:
+        """Get sorted set members with scores in the given range."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return []
+        result = await self._redis.zrangebyscore(key, min_score, max_score)
+        return cast(list[bytes], result)
+
+    async def zremrangebyscore(self, key: str, min_score: float, max_score: float) -> None:
+        """Remove sorted set members with scores in the given range."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return
+        await self._redis.zremrangebyscore(key, min_score, max_score)
+
+    async def sadd(self, key: str, member: str) -> None:
+        """Add member to set."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return
+        await self._redis.sadd(key, member)
+
+    async def spop(self, key: str, count: int) -> list[bytes]:
+        """Remove and return up to count random members of set."""
+        await self._ensure_initialized()
+        if self._redis is None:
+            return []
+        result = await self._redis.spop(key, count)
+        return cast(list[bytes], result or [])
+
     async def close(self) -> None:
         """Close Redis connection."""
         if self._redis is not None:
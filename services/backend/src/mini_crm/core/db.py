@@ -15,9 +15,14 @@ from mini_crm.config.settings import get_settings
 
 
 class Base(DeclarativeBase):
-    pass
+    # Fetch server-generated columns with RETURNING on INSERT and UPDATE instead of
+    # a follow-up SELECT, so writes never need session.refresh()
+    __mapper_args__ = {"eager_defaults": True}
 
 
+# Rows fetched per round-trip when iterating a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
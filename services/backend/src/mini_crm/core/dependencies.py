@@ -3,9 +3,10 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 
 from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from mini_crm.core.db import get_session
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.db import get_session, get_session_factory
 from mini_crm.core.security import InvalidTokenError, decode_access_token
 from mini_crm.modules.auth.repositories.sqlalchemy import SQLAlchemyAuthRepository
 from mini_crm.modules.common.context import OrganizationContext, RequestContext, RequestUser
@@ -25,6 +26,23 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
             raise
 
 
+def get_cache() -> RedisCache:
+    """Get Redis cache instance."""
+    return RedisCache.get_instance()
+
+
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for work that outlives the request scope, such as streamed bodies."""
+    return get_session_factory()
+
+
+def get_streaming_session(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+) -> AsyncSession:
+    """Session owned by a streamed response body, which must close it when done."""
+    return session_factory()
+
+
 async def get_request_user(
     authorization: str | None = Header(default=None, alias="Authorization"),
     session: AsyncSession = Depends(get_db_session),
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_NDJSON = "ndjson"
+
+EXPORT_MEDIA_TYPES = {
+    EXPORT_FORMAT_CSV: "text/csv; charset=utf-8",
+    EXPORT_FORMAT_NDJSON: "application/x-ndjson",
+}
+
+# Rows are buffered into chunks of roughly this size before being written to the socket
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+async def encode_rows(
+    rows: AsyncIterable[BaseModel], export_format: str, fields: list[str]
+) -> AsyncIterator[str]:
+    """Encode rows as CSV (with a header line) or NDJSON, yielding bounded chunks."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if export_format == EXPORT_FORMAT_CSV:
+        writer.writerow(fields)
+
+    async for row in rows:
+        if export_format == EXPORT_FORMAT_CSV:
+            values = row.model_dump(mode="json", include=set(fields))
+            writer.writerow("" if values[field] is None else values[field] for field in fields)
+        else:
+            buffer.write(row.model_dump_json(include=set(fields)))
+            buffer.write("\n")
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@asynccontextmanager
+async def close_on_error(session: AsyncSession) -> AsyncIterator[None]:
+    """Close a streaming session if preparing the export fails before a response owns it."""
+    try:
+        yield
+    except BaseException:
+        await session.close()
+        raise
+
+
+def export_response(
+    chunks: AsyncIterator[str], export_format: str, filename: str, session: AsyncSession
+) -> StreamingResponse:
+    """Stream an export, closing the session that feeds it once the body is sent.
+
+    The session must not come from ``get_db_session``: dependencies with ``yield`` are
+    torn down before a streaming body is iterated.
+    """
+
+    async def body() -> AsyncIterator[str]:
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await session.close()
+
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
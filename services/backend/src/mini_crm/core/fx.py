@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from mini_crm.config.settings import get_settings
+
+
+class FxRatesError(ValueError):
+    """Raised when an FX rate table is invalid or cannot convert a currency."""
+
+
+@dataclass(frozen=True)
+class FxConversion:
+    """Factors converting every known currency into a single target currency."""
+
+    currency: str
+    version: str
+    factors: dict[str, Decimal]
+
+
+@dataclass(frozen=True)
+class FxRateTable:
+    """Immutable FX snapshot: value of one unit of each currency in the base currency."""
+
+    base_currency: str
+    rates: dict[str, Decimal]
+    version: str
+
+    @classmethod
+    def build(
+        cls, base_currency: str, rates: Mapping[str, Decimal | str | int | float]
+    ) -> FxRateTable:
+        """Validate raw rates and derive a content-based version."""
+        base = base_currency.strip().upper()
+        if not base:
+            raise FxRatesError("Base currency cannot be empty")
+
+        normalized: dict[str, Decimal] = {}
+        for currency, raw_rate in rates.items():
+            code = currency.strip().upper()
+            try:
+                rate = Decimal(str(raw_rate))
+            except InvalidOperation as exc:
+                raise FxRatesError(f"Invalid rate for {code}: {raw_rate!r}") from exc
+            if not code or not rate.is_finite() or rate <= 0:
+                raise FxRatesError(f"Rate for {code or '<empty>'} must be a positive number")
+            normalized[code] = rate
+        normalized[base] = Decimal("1")
+
+        canonical = json.dumps(
+            {"base": base, "rates": {code: str(normalized[code]) for code in sorted(normalized)}},
+            separators=(",", ":"),
+        )
+        version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+        return cls(base_currency=base, rates=normalized, version=version)
+
+    def conversion_to(self, target_currency: str) -> FxConversion:
+        """Return per-currency factors for normalizing amounts into ``target_currency``."""
+        target = target_currency.strip().upper()
+        target_rate = self.rates.get(target)
+        if target_rate is None:
+            raise FxRatesError(f"No FX rate configured for {target}")
+        factors = {code: rate / target_rate for code, rate in self.rates.items()}
+        return FxConversion(currency=target, version=self.version, factors=factors)
+
+
+class FxRateRegistry:
+    """Process-wide holder of the current FX rate table.
+
+    Rates are read from ``FX_RATES_FILE`` (``{"base": "USD", "rates": {"EUR": "1.08"}}``)
+    and reloaded whenever the file changes, so every worker on a host converges on the
+    same table version. The table is shared by every organization, so it is maintained
+    by operators through the file and cannot be changed through the API.
+    """
+
+    _instance: FxRateRegistry | None = None
+
+    def __init__(self) -> None:
+        if FxRateRegistry._instance is not None:
+            raise RuntimeError("FxRateRegistry is a singleton. Use get_instance() instead.")
+        self._table: FxRateTable | None = None
+        self._file_mtime_ns: int | None = None
+
+    @classmethod
+    def get_instance(cls) -> FxRateRegistry:
+        """Get singleton instance of FxRateRegistry."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_table(self) -> FxRateTable:
+        """Return the current table, reloading it if the backing file has changed."""
+        path = self._file_path()
+        if path is not None and path.exists():
+            mtime_ns = path.stat().st_mtime_ns
+            if self._table is None or mtime_ns != self._file_mtime_ns:
+                self._table = self._read_file(path)
+                self._file_mtime_ns = mtime_ns
+        if self._table is None:
+            self._table = FxRateTable.build(get_settings().fx_base_currency, {})
+        return self._table
+
+    def reset(self) -> None:
+        """Drop the cached table so the next access reloads it."""
+        self._table = None
+        self._file_mtime_ns = None
+
+    @staticmethod
+    def _file_path() -> Path | None:
+        rates_file = get_settings().fx_rates_file
+        return Path(rates_file) if rates_file else None
+
+    @staticmethod
+    def _read_file(path: Path) -> FxRateTable:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return FxRateTable.build(data["base"], data.get("rates", {}))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            raise FxRatesError(f"Cannot load FX rates from {path}: {exc}") from exc
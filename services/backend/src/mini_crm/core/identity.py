@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+_SESSION_INFO_KEY = "verified_aggregates"
+
+
+class VerifiedAggregates:
+    """Aggregates known to belong to an organization within the current transaction.
+
+    Repositories sharing a session record every aggregate they have read or written for
+    an organization, so later writes in the same unit of work can skip re-checking it.
+    The record is dropped when the outermost transaction ends, since another
+    transaction may then have moved or deleted the aggregates.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple[type[Any], int], set[int]] = {}
+
+    def add(self, model: type[Any], organization_id: int, ids: Iterable[int]) -> None:
+        self._ids.setdefault((model, organization_id), set()).update(ids)
+
+    def contains(self, model: type[Any], organization_id: int, ids: Iterable[int]) -> bool:
+        """Whether every one of ``ids`` is known to belong to the organization."""
+        known = self._ids.get((model, organization_id), set())
+        return all(aggregate_id in known for aggregate_id in ids)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+def verified_aggregates(session: AsyncSession) -> VerifiedAggregates:
+    """Return the session's record of verified aggregates, creating it on first use."""
+    verified: VerifiedAggregates | None = session.info.get(_SESSION_INFO_KEY)
+    if verified is None:
+        verified = session.info[_SESSION_INFO_KEY] = VerifiedAggregates()
+
+        def _forget(_session: Session, transaction: SessionTransaction) -> None:
+            if transaction.parent is None:
+                verified.clear()
+
+        event.listen(session.sync_session, "after_transaction_end", _forget)
+    return verified
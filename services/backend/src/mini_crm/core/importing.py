@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+
+MAX_CSV_RECORD_CHARS = 1024 * 1024
+
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+# The rest of a quoted field on one line: anything but a lone quote, which closes it
+_QUOTED_TEXT = re.compile(r'(?:[^"]|"")*')
+
+
+class CsvRecordTooLargeError(ValueError):
+    """Raised when a CSV record grows past the size limit without ending."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(f"A CSV record is longer than {limit} characters")
+        self.limit = limit
+
+
+async def split_csv_records(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8-sig",
+    max_record_chars: int = MAX_CSV_RECORD_CHARS,
+) -> AsyncIterator[str]:
+    """Split a CSV byte stream into raw records as it arrives, skipping blank lines.
+
+    A record may span several lines when a quoted field contains line breaks. Quotes
+    are tracked the way :mod:`csv` reads them: only a quote opening a field starts a
+    quoted field, so a stray quote inside an unquoted field does not swallow the
+    following lines. Memory is bounded by one incoming chunk plus the record in
+    progress, which may not exceed ``max_record_chars``; a longer record cannot be
+    told apart from an unterminated quote and raises :class:`CsvRecordTooLargeError`.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    parts: list[str] = []
+    size = 0
+    in_quotes = False
+
+    def append(line: str) -> str | None:
+        nonlocal size, in_quotes
+        parts.append(line)
+        size += len(line)
+        in_quotes = _ends_in_quotes(line, in_quotes)
+        if in_quotes:
+            if size > max_record_chars:
+                raise CsvRecordTooLargeError(max_record_chars)
+            return None
+        record = "".join(parts)
+        parts.clear()
+        size = 0
+        return record
+
+    def complete_records(text: str) -> list[str]:
+        # Split on "\n" only; str.splitlines() would also break on separators like U+2028
+        records = [append(line) for line in _LINE.findall(text)]
+        return [record for record in records if record is not None and record.strip()]
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        text, separator, pending = pending.rpartition("\n")
+        if size + len(pending) > max_record_chars:
+            raise CsvRecordTooLargeError(max_record_chars)
+        for record in complete_records(text + separator):
+            yield record
+
+    for record in complete_records(pending + decoder.decode(b"", final=True)):
+        yield record
+    if parts and "".join(parts).strip():
+        yield "".join(parts)
+
+
+def parse_csv_record(raw: str) -> list[str]:
+    """Parse one raw record into fields; raises :class:`csv.Error` when it is malformed."""
+    return next(csv.reader([raw], strict=True), [])
+
+
+def _ends_in_quotes(line: str, in_quotes: bool) -> bool:
+    """Whether a quoted field is still open at the end of ``line``."""
+    position = 0
+    while True:
+        if in_quotes:
+            quoted = _QUOTED_TEXT.match(line, position)
+            assert quoted is not None
+            position = quoted.end()
+            if position == len(line):
+                return True
+            in_quotes = False
+            position += 1
+        elif line.startswith('"', position):
+            in_quotes = True
+            position += 1
+            continue
+        delimiter = line.find(",", position)
+        if delimiter < 0:
+            return False
+        position = delimiter + 1
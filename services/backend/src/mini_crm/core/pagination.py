@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+
+from mini_crm.config.settings import get_settings
+from mini_crm.core.cache import RedisCache
+
+TOTAL_MODE_EXACT = "exact"
+TOTAL_MODE_ESTIMATED = "estimated"
+
+
+class CachedCounter:
+    """Serves list totals from Redis so estimated counts hit the database once per TTL.
+
+    The returned total may lag behind writes by at most ``ttl_seconds``; a TTL of zero
+    disables the cache.
+    """
+
+    def __init__(self, cache: RedisCache, ttl_seconds: int | None = None) -> None:
+        self.cache = cache
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else get_settings().list_total_cache_ttl_seconds
+        )
+
+    async def get_or_count(self, key: str, count: Callable[[], Awaitable[int]]) -> int:
+        if self.ttl_seconds <= 0:
+            return await count()
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return int(cached)
+        total = await count()
+        await self.cache.set(key, str(total).encode("ascii"), self.ttl_seconds)
+        return total
+
+    @staticmethod
+    def key(namespace: str, organization_id: int, **filters: object) -> str:
+        """Build a cache key unique to the organization and the filter values."""
+        canonical = json.dumps(filters, sort_keys=True, default=str, separators=(",", ":"))
+        digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+        return f"{namespace}:count:{organization_id}:{digest}"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import builtins
 from abc import ABC, abstractmethod
 
 from mini_crm.modules.activities.dto.schemas import ActivityCreate, ActivityResponse
@@ -20,6 +21,16 @@ class AbstractActivityRepository(ABC):
     ) -> ActivityResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(
+        self,
+        organization_id: int,
+        items: builtins.list[tuple[int, ActivityCreate]],
+        author_id: int | None = None,
+    ) -> builtins.list[ActivityResponse]:
+        """Create activities for ``(deal_id, payload)`` pairs in one batch."""
+        raise NotImplementedError
+
 
 class InMemoryActivityRepository(AbstractActivityRepository):
     def __init__(self) -> None:
@@ -42,3 +53,14 @@ class InMemoryActivityRepository(AbstractActivityRepository):
         )
         self._activities.append(activity)
         return activity
+
+    async def create_many(
+        self,
+        organization_id: int,
+        items: builtins.list[tuple[int, ActivityCreate]],
+        author_id: int | None = None,
+    ) -> builtins.list[ActivityResponse]:
+        return [
+            await self.create(organization_id, deal_id, payload, author_id=author_id)
+            for deal_id, payload in items
+        ]
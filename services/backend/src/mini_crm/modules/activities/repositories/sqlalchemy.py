@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+import builtins
+
+from sqlalchemy import JSON, Integer, String, column, insert, literal, select, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from mini_crm.core.identity import verified_aggregates
 from mini_crm.modules.activities.dto.schemas import ActivityCreate, ActivityResponse
 from mini_crm.modules.activities.models import Activity
 from mini_crm.modules.activities.repositories.repository import AbstractActivityRepository
@@ -15,13 +18,11 @@ class SQLAlchemyActivityRepository(AbstractActivityRepository):
         self.session = session
 
     async def list(self, organization_id: int, deal_id: int) -> list[ActivityResponse]:
-        # Join with Deal to ensure deal belongs to organization
         stmt = (
             select(Activity)
-            .join(Deal, Activity.deal_id == Deal.id)
             .where(
+                Activity.organization_id == organization_id,
                 Activity.deal_id == deal_id,
-                Deal.organization_id == organization_id,
             )
             .order_by(Activity.created_at.desc())
         )
@@ -37,22 +38,73 @@ class SQLAlchemyActivityRepository(AbstractActivityRepository):
         payload: ActivityCreate,
         author_id: int | None = None,
     ) -> ActivityResponse:
-        # Check if deal exists and belongs to organization
-        deal_stmt = select(Deal).where(
-            Deal.id == deal_id,
-            Deal.organization_id == organization_id,
+        (activity,) = await self.create_many(organization_id, [(deal_id, payload)], author_id)
+        return activity
+
+    async def create_many(
+        self,
+        organization_id: int,
+        items: builtins.list[tuple[int, ActivityCreate]],
+        author_id: int | None = None,
+    ) -> builtins.list[ActivityResponse]:
+        if not items:
+            return []
+        verified = verified_aggregates(self.session)
+        if verified.contains(Deal, organization_id, [deal_id for deal_id, _payload in items]):
+            # The deals were already checked in this transaction; a plain insert will do
+            rows = [
+                {
+                    "organization_id": organization_id,
+                    "deal_id": deal_id,
+                    "author_id": author_id,
+                    "type": payload.type,
+                    "payload": payload.payload,
+                }
+                for deal_id, payload in items
+            ]
+            stmt = insert(Activity).returning(Activity, sort_by_parameter_order=True)
+            result = await self.session.scalars(stmt, rows)
+            return [ActivityResponse.model_validate(activity) for activity in result.all()]
+
+        # INSERT ... SELECT joined to deals writes only rows whose deal belongs to the
+        # organization, so the ownership check costs no extra round-trip
+        new_activities = values(
+            column("position", Integer),
+            column("deal_id", Integer),
+            column("type", String),
+            column("payload", JSON),
+            name="new_activities",
+        ).data(
+            [
+                (position, deal_id, payload.type, payload.payload)
+                for position, (deal_id, payload) in enumerate(items)
+            ]
         )
-        deal = await self.session.scalar(deal_stmt)
-        if deal is None:
-            raise DealNotFoundError(deal_id)
-
-        activity = Activity(
-            deal_id=deal_id,
-            author_id=author_id,
-            type=payload.type,
-            payload=payload.payload,
+        source = (
+            select(
+                literal(organization_id, Integer),
+                new_activities.c.deal_id,
+                literal(author_id, Integer),
+                new_activities.c.type,
+                new_activities.c.payload,
+            )
+            .join(Deal, Deal.id == new_activities.c.deal_id)
+            .where(Deal.organization_id == organization_id)
+            .order_by(new_activities.c.position)
+        )
+        stmt = (
+            insert(Activity)
+            .from_select(["organization_id", "deal_id", "author_id", "type", "payload"], source)
+            .returning(Activity)
         )
-        self.session.add(activity)
-        await self.session.flush()
-        await self.session.refresh(activity)
-        return ActivityResponse.model_validate(activity)
+        result = await self.session.scalars(stmt)
+        # RETURNING does not follow the SELECT's ORDER BY, but ids are drawn from the
+        # sequence as the ordered rows are inserted, so sorting on id restores the input
+        # order; this is what sort_by_parameter_order does for serial keys
+        activities = sorted(result.all(), key=lambda activity: activity.id)
+
+        if len(activities) != len(items):
+            inserted = {activity.deal_id for activity in activities}
+            raise DealNotFoundError(next(d for d, _payload in items if d not in inserted))
+        verified.add(Deal, organization_id, [deal_id for deal_id, _payload in items])
+        return [ActivityResponse.model_validate(activity) for activity in activities]
@@ -1,27 +1,32 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mini_crm.core.cache import RedisCache
-from mini_crm.core.dependencies import get_db_session, get_request_context
+from mini_crm.core.dependencies import get_cache, get_db_session, get_request_context
+from mini_crm.core.fx import FxRatesError
+from mini_crm.modules.analytics.application.tracking import AnalyticsActivityTracker
 from mini_crm.modules.analytics.application.use_cases import (
+    GetDealsByOwnerUseCase,
     GetDealsFunnelUseCase,
     GetDealsSummaryUseCase,
+    GetFxRatesUseCase,
+)
+from mini_crm.modules.analytics.dto.schemas import (
+    DealsFunnel,
+    DealsSummary,
+    FxRatesResponse,
+    OwnerLeaderboard,
 )
-from mini_crm.modules.analytics.dto.schemas import DealsFunnel, DealsSummary
 from mini_crm.modules.analytics.repositories.repository import AbstractAnalyticsRepository
 from mini_crm.modules.analytics.repositories.sqlalchemy import SQLAlchemyAnalyticsRepository
 from mini_crm.modules.common.application.context import RequestContext
+from mini_crm.modules.common.domain.exceptions import PermissionDeniedError
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
-def get_cache() -> RedisCache:
-    """Get Redis cache instance."""
-    return RedisCache.get_instance()
-
-
 def get_analytics_repository(
     session: AsyncSession = Depends(get_db_session),
 ) -> AbstractAnalyticsRepository:
@@ -32,22 +37,41 @@ def get_deals_summary_use_case(
     repository: AbstractAnalyticsRepository = Depends(get_analytics_repository),
     cache: RedisCache = Depends(get_cache),
 ) -> GetDealsSummaryUseCase:
-    return GetDealsSummaryUseCase(repository=repository, cache=cache)
+    return GetDealsSummaryUseCase(
+        repository=repository, cache=cache, tracker=AnalyticsActivityTracker(cache)
+    )
 
 
 def get_deals_funnel_use_case(
     repository: AbstractAnalyticsRepository = Depends(get_analytics_repository),
     cache: RedisCache = Depends(get_cache),
 ) -> GetDealsFunnelUseCase:
-    return GetDealsFunnelUseCase(repository=repository, cache=cache)
+    return GetDealsFunnelUseCase(
+        repository=repository, cache=cache, tracker=AnalyticsActivityTracker(cache)
+    )
+
+
+def get_deals_by_owner_use_case(
+    repository: AbstractAnalyticsRepository = Depends(get_analytics_repository),
+    cache: RedisCache = Depends(get_cache),
+) -> GetDealsByOwnerUseCase:
+    return GetDealsByOwnerUseCase(repository=repository, cache=cache)
+
+
+def get_fx_rates_use_case() -> GetFxRatesUseCase:
+    return GetFxRatesUseCase()
 
 
 @router.get("/deals/summary", response_model=DealsSummary)
 async def deals_summary(
+    normalize_to: str | None = Query(default=None, min_length=3, max_length=8),
     context: RequestContext = Depends(get_request_context),
     use_case: GetDealsSummaryUseCase = Depends(get_deals_summary_use_case),
 ) -> DealsSummary:
-    return await use_case.execute(context)
+    try:
+        return await use_case.execute(context, normalize_to=normalize_to)
+    except FxRatesError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 @router.get("/deals/funnel", response_model=DealsFunnel)
@@ -56,3 +80,38 @@ async def deals_funnel(
     use_case: GetDealsFunnelUseCase = Depends(get_deals_funnel_use_case),
 ) -> DealsFunnel:
     return await use_case.execute(context)
+
+
+@router.get("/deals/by-owner", response_model=OwnerLeaderboard)
+async def deals_by_owner(
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    order_by: str = Query(
+        default="won_amount", pattern="^(won_amount|win_rate|open_pipeline|total_deals)$"
+    ),
+    order: str = Query(default="desc", pattern="^(asc|desc)$"),
+    currency: str | None = Query(default=None, min_length=3, max_length=8),
+    context: RequestContext = Depends(get_request_context),
+    use_case: GetDealsByOwnerUseCase = Depends(get_deals_by_owner_use_case),
+) -> OwnerLeaderboard:
+    try:
+        return await use_case.execute(
+            context,
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            order=order,
+            currency=currency,
+        )
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except FxRatesError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.get("/fx-rates", response_model=FxRatesResponse)
+async def get_fx_rates(
+    context: RequestContext = Depends(get_request_context),  # noqa: ARG001
+    use_case: GetFxRatesUseCase = Depends(get_fx_rates_use_case),
+) -> FxRatesResponse:
+    return await use_case.execute()
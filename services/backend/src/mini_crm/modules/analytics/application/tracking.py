@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+
+import structlog
+
+from mini_crm.core.cache import RedisCache
+
+logger = structlog.get_logger(__name__)
+
+ACTIVE_ORGANIZATIONS_KEY = "analytics:active_organizations"
+DIRTY_ORGANIZATIONS_KEY = "analytics:dirty_organizations"
+
+
+class AnalyticsActivityTracker:
+    """Tracks which organizations read analytics recently and whose deals changed."""
+
+    def __init__(self, cache: RedisCache) -> None:
+        self.cache = cache
+
+    async def mark_active(self, organization_id: int) -> None:
+        """Record that the organization has just requested analytics."""
+        await self.cache.zadd(ACTIVE_ORGANIZATIONS_KEY, str(organization_id), time.time())
+
+    async def mark_dirty(self, organization_id: int) -> None:
+        """Record that the organization's deals changed since the last refresh.
+
+        Called after the change has committed, so a failure is only logged: the write
+        stands and the worker's periodic full refresh picks the organization up later.
+        """
+        try:
+            await self.cache.sadd(DIRTY_ORGANIZATIONS_KEY, str(organization_id))
+        except Exception:
+            logger.exception("analytics_mark_dirty_failed", organization_id=organization_id)
+
+    async def active_organizations(self, window_seconds: float) -> list[int]:
+        """Return organizations active within the window, pruning older entries."""
+        cutoff = time.time() - window_seconds
+        await self.cache.zremrangebyscore(ACTIVE_ORGANIZATIONS_KEY, float("-inf"), cutoff)
+        members = await self.cache.zrangebyscore(ACTIVE_ORGANIZATIONS_KEY, cutoff, float("inf"))
+        return [int(member) for member in members]
+
+    async def pop_dirty_organizations(self, limit: int = 1000) -> list[int]:
+        """Remove and return organizations marked dirty."""
+        members = await self.cache.spop(DIRTY_ORGANIZATIONS_KEY, limit)
+        return [int(member) for member in members]
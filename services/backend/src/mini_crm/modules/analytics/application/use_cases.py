@@ -6,9 +6,19 @@ from mini_crm.core.cache import (
     deserialize_pydantic_model,
     serialize_pydantic_model,
 )
-from mini_crm.modules.analytics.dto.schemas import DealsFunnel, DealsSummary
+from mini_crm.core.fx import FxConversion, FxRateRegistry
+from mini_crm.modules.analytics.application.tracking import AnalyticsActivityTracker
+from mini_crm.modules.analytics.dto.schemas import (
+    DealsFunnel,
+    DealsSummary,
+    FxRatesResponse,
+    OwnerLeaderboard,
+)
 from mini_crm.modules.analytics.repositories.repository import AbstractAnalyticsRepository
 from mini_crm.modules.common.application.context import RequestContext
+from mini_crm.modules.common.domain.services import PermissionService
+from mini_crm.shared.domain.enums import UserRole
+from mini_crm.shared.dto.pagination import PaginationMeta
 
 
 class GetDealsSummaryUseCase:
@@ -18,30 +28,57 @@ class GetDealsSummaryUseCase:
         self,
         repository: AbstractAnalyticsRepository,
         cache: RedisCache,
+        fx_registry: FxRateRegistry | None = None,
+        tracker: AnalyticsActivityTracker | None = None,
     ) -> None:
         self.repository = repository
         self.cache = cache
+        self.fx_registry = fx_registry or FxRateRegistry.get_instance()
+        self.tracker = tracker
 
-    async def execute(self, context: RequestContext) -> DealsSummary:
-        """Get deals summary for the organization."""
+    async def execute(
+        self, context: RequestContext, normalize_to: str | None = None
+    ) -> DealsSummary:
+        """Get deals summary for the organization, optionally normalized to one currency."""
         organization_id = context.organization.organization_id
-        cache_key = f"analytics:deals:summary:{organization_id}"
+        if self.tracker is not None:
+            await self.tracker.mark_active(organization_id)
+
+        conversion = None
+        if normalize_to is not None:
+            conversion = self.fx_registry.get_table().conversion_to(normalize_to)
 
         # Try to get from cache
-        cached_data = await self.cache.get(cache_key)
+        cached_data = await self.cache.get(self._cache_key(organization_id, conversion))
         if cached_data is not None:
             return deserialize_pydantic_model(cached_data, DealsSummary)
 
-        # Get from repository
-        result = await self.repository.deals_summary(organization_id)
+        return await self.refresh(organization_id, conversion)
+
+    async def refresh(
+        self, organization_id: int, conversion: FxConversion | None = None
+    ) -> DealsSummary:
+        """Recompute the summary from the repository and store it in cache."""
+        result = await self.repository.deals_summary(organization_id, conversion)
 
-        # Store in cache
         settings = get_settings()
         serialized = serialize_pydantic_model(result)
-        await self.cache.set(cache_key, serialized, settings.analytics_cache_ttl_seconds)
+        await self.cache.set(
+            self._cache_key(organization_id, conversion),
+            serialized,
+            settings.analytics_cache_ttl_seconds,
+        )
 
         return result
 
+    @staticmethod
+    def _cache_key(organization_id: int, conversion: FxConversion | None) -> str:
+        cache_key = f"analytics:deals:summary:{organization_id}"
+        if conversion is not None:
+            # Version in the key invalidates cached totals whenever rates change
+            cache_key = f"{cache_key}:fx:{conversion.currency}:{conversion.version}"
+        return cache_key
+
 
 class GetDealsFunnelUseCase:
     """Use case for getting deals funnel."""
@@ -50,26 +87,111 @@ class GetDealsFunnelUseCase:
         self,
         repository: AbstractAnalyticsRepository,
         cache: RedisCache,
+        tracker: AnalyticsActivityTracker | None = None,
     ) -> None:
         self.repository = repository
         self.cache = cache
+        self.tracker = tracker
 
     async def execute(self, context: RequestContext) -> DealsFunnel:
         """Get deals funnel for the organization."""
         organization_id = context.organization.organization_id
-        cache_key = f"analytics:deals:funnel:{organization_id}"
+        if self.tracker is not None:
+            await self.tracker.mark_active(organization_id)
 
         # Try to get from cache
-        cached_data = await self.cache.get(cache_key)
+        cached_data = await self.cache.get(f"analytics:deals:funnel:{organization_id}")
         if cached_data is not None:
             return deserialize_pydantic_model(cached_data, DealsFunnel)
 
-        # Get from repository
+        return await self.refresh(organization_id)
+
+    async def refresh(self, organization_id: int) -> DealsFunnel:
+        """Recompute the funnel from the repository and store it in cache."""
         result = await self.repository.deals_funnel(organization_id)
 
+        settings = get_settings()
+        serialized = serialize_pydantic_model(result)
+        await self.cache.set(
+            f"analytics:deals:funnel:{organization_id}",
+            serialized,
+            settings.analytics_cache_ttl_seconds,
+        )
+
+        return result
+
+
+class GetDealsByOwnerUseCase:
+    """Use case for getting per-owner deal statistics."""
+
+    def __init__(
+        self,
+        repository: AbstractAnalyticsRepository,
+        cache: RedisCache,
+        fx_registry: FxRateRegistry | None = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.fx_registry = fx_registry or FxRateRegistry.get_instance()
+
+    async def execute(
+        self,
+        context: RequestContext,
+        page: int = 1,
+        page_size: int = 20,
+        order_by: str = "won_amount",
+        order: str = "desc",
+        currency: str | None = None,
+    ) -> OwnerLeaderboard:
+        """Get the owner leaderboard, with amounts in ``currency`` or the FX base currency."""
+        PermissionService.ensure_min_role(context.organization.role, UserRole.MANAGER)
+
+        organization_id = context.organization.organization_id
+        table = self.fx_registry.get_table()
+        conversion = table.conversion_to(currency or table.base_currency)
+        cache_key = (
+            f"analytics:deals:by_owner:{organization_id}:{order_by}:{order}:{page}:{page_size}"
+            f":fx:{conversion.currency}:{conversion.version}"
+        )
+
+        # Try to get from cache
+        cached_data = await self.cache.get(cache_key)
+        if cached_data is not None:
+            return deserialize_pydantic_model(cached_data, OwnerLeaderboard)
+
+        # Get from repository
+        items, total = await self.repository.deals_by_owner(
+            organization_id,
+            conversion,
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            order=order,
+        )
+        result = OwnerLeaderboard(
+            currency=conversion.currency,
+            fx_version=conversion.version,
+            items=items,
+            meta=PaginationMeta(page=page, page_size=page_size, total=total),
+        )
+
         # Store in cache
         settings = get_settings()
         serialized = serialize_pydantic_model(result)
         await self.cache.set(cache_key, serialized, settings.analytics_cache_ttl_seconds)
 
         return result
+
+
+class GetFxRatesUseCase:
+    """Use case for reading the FX rate table."""
+
+    def __init__(self, fx_registry: FxRateRegistry | None = None) -> None:
+        self.fx_registry = fx_registry or FxRateRegistry.get_instance()
+
+    async def execute(self) -> FxRatesResponse:
+        """Return the current FX rate table."""
+        table = self.fx_registry.get_table()
+        return FxRatesResponse(
+            base_currency=table.base_currency, rates=table.rates, version=table.version
+        )
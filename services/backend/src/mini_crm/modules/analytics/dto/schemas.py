@@ -5,6 +5,7 @@ from decimal import Decimal
 from pydantic import field_serializer
 
 from mini_crm.shared.dto.base import DTO
+from mini_crm.shared.dto.pagination import PaginationMeta
 
 
 class StatusCount(DTO):
@@ -13,6 +14,9 @@ class StatusCount(DTO):
     won: int = 0
     lost: int = 0
 
+    def total(self) -> int:
+        return self.new + self.in_progress + self.won + self.lost
+
 
 class StatusAmount(DTO):
     new: Decimal = Decimal("0")
@@ -21,12 +25,28 @@ class StatusAmount(DTO):
     lost: Decimal = Decimal("0")
 
 
+class CurrencyBreakdown(DTO):
+    currency: str
+    total_deals: int
+    deals_by_status: StatusCount
+    amounts_by_status: StatusAmount
+
+
+class NormalizedAmounts(DTO):
+    currency: str
+    fx_version: str
+    amounts_by_status: StatusAmount
+    unconverted_currencies: list[str] = []
+
+
 class DealsSummary(DTO):
     total_deals: int
     deals_by_status: StatusCount
     amounts_by_status: StatusAmount
     avg_won_amount: Decimal | None = None
     new_deals_last_30_days: int = 0
+    by_currency: list[CurrencyBreakdown] = []
+    normalized: NormalizedAmounts | None = None
 
     @field_serializer("avg_won_amount")
     def serialize_avg_won_amount(self, value: Decimal | None) -> str | None:
@@ -50,3 +70,28 @@ class ConversionRate(DTO):
 class DealsFunnel(DTO):
     stages: list[StageStats]
     conversion_rates: list[ConversionRate]
+
+
+class OwnerStats(DTO):
+    owner_id: int | None
+    total_deals: int
+    open_deals: int
+    won_deals: int
+    lost_deals: int
+    won_amount: Decimal
+    open_pipeline: Decimal
+    win_rate_percent: float
+    unconverted_currencies: list[str] = []
+
+
+class OwnerLeaderboard(DTO):
+    currency: str
+    fx_version: str
+    items: list[OwnerStats]
+    meta: PaginationMeta
+
+
+class FxRatesResponse(DTO):
+    base_currency: str
+    rates: dict[str, Decimal]
+    version: str
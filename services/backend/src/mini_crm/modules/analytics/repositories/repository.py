@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from mini_crm.core.fx import FxConversion
 from mini_crm.modules.analytics.dto.schemas import (
     DealsFunnel,
     DealsSummary,
+    NormalizedAmounts,
+    OwnerStats,
     StageStats,
     StatusAmount,
     StatusCount,
@@ -13,22 +16,47 @@ from mini_crm.modules.analytics.dto.schemas import (
 
 class AbstractAnalyticsRepository(ABC):
     @abstractmethod
-    async def deals_summary(self, organization_id: int) -> DealsSummary:
+    async def deals_summary(
+        self, organization_id: int, conversion: FxConversion | None = None
+    ) -> DealsSummary:
         raise NotImplementedError
 
     @abstractmethod
     async def deals_funnel(self, organization_id: int) -> DealsFunnel:
         raise NotImplementedError
 
+    @abstractmethod
+    async def deals_by_owner(
+        self,
+        organization_id: int,
+        conversion: FxConversion,
+        *,
+        page: int,
+        page_size: int,
+        order_by: str = "won_amount",
+        order: str = "desc",
+    ) -> tuple[list[OwnerStats], int]:
+        raise NotImplementedError
+
 
 class InMemoryAnalyticsRepository(AbstractAnalyticsRepository):
-    async def deals_summary(self, organization_id: int) -> DealsSummary:  # noqa: ARG002
+    async def deals_summary(
+        self, organization_id: int, conversion: FxConversion | None = None
+    ) -> DealsSummary:  # noqa: ARG002
+        normalized = None
+        if conversion is not None:
+            normalized = NormalizedAmounts(
+                currency=conversion.currency,
+                fx_version=conversion.version,
+                amounts_by_status=StatusAmount(),
+            )
         return DealsSummary(
             total_deals=0,
             deals_by_status=StatusCount(),
             amounts_by_status=StatusAmount(),
             avg_won_amount=None,
             new_deals_last_30_days=0,
+            normalized=normalized,
         )
 
     async def deals_funnel(self, organization_id: int) -> DealsFunnel:  # noqa: ARG002
@@ -38,3 +66,15 @@ class InMemoryAnalyticsRepository(AbstractAnalyticsRepository):
             ],
             conversion_rates=[],
         )
+
+    async def deals_by_owner(
+        self,
+        organization_id: int,
+        conversion: FxConversion,
+        *,
+        page: int,
+        page_size: int,
+        order_by: str = "won_amount",
+        order: str = "desc",
+    ) -> tuple[list[OwnerStats], int]:  # noqa: ARG002
+        return ([], 0)
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Numeric, Row, String, Values, and_, case, cast, column, func, select, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from mini_crm.core.fx import FxConversion
 from mini_crm.modules.analytics.dto.schemas import (
     ConversionRate,
+    CurrencyBreakdown,
     DealsFunnel,
     DealsSummary,
+    NormalizedAmounts,
+    OwnerStats,
     StageStats,
     StatusAmount,
     StatusCount,
@@ -18,86 +23,124 @@ from mini_crm.modules.analytics.repositories.repository import AbstractAnalytics
 from mini_crm.modules.deals.models import Deal
 from mini_crm.shared.enums import DealStage, DealStatus
 
+OPEN_STATUSES = (DealStatus.NEW, DealStatus.IN_PROGRESS)
+
 
 class SQLAlchemyAnalyticsRepository(AbstractAnalyticsRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def deals_summary(self, organization_id: int) -> DealsSummary:
-        # Count deals by status
-        count_by_status = select(
-            func.count(case((Deal.status == DealStatus.NEW, 1))).label("new"),
-            func.count(case((Deal.status == DealStatus.IN_PROGRESS, 1))).label("in_progress"),
-            func.count(case((Deal.status == DealStatus.WON, 1))).label("won"),
-            func.count(case((Deal.status == DealStatus.LOST, 1))).label("lost"),
-        ).where(Deal.organization_id == organization_id)
-
-        count_result = await self.session.execute(count_by_status)
-        count_row = count_result.first()
-        deals_by_status = StatusCount(
-            new=int(count_row.new or 0) if count_row else 0,
-            in_progress=int(count_row.in_progress or 0) if count_row else 0,
-            won=int(count_row.won or 0) if count_row else 0,
-            lost=int(count_row.lost or 0) if count_row else 0,
-        )
+    async def deals_summary(
+        self, organization_id: int, conversion: FxConversion | None = None
+    ) -> DealsSummary:
+        thirty_days_ago = datetime.now(tz=UTC) - timedelta(days=30)
+        statuses = list(DealStatus)
 
-        # Sum amounts by status
-        amount_by_status = select(
-            func.coalesce(func.sum(case((Deal.status == DealStatus.NEW, Deal.amount))), 0).label(
-                "new"
-            ),
-            func.coalesce(
-                func.sum(case((Deal.status == DealStatus.IN_PROGRESS, Deal.amount))), 0
-            ).label("in_progress"),
-            func.coalesce(func.sum(case((Deal.status == DealStatus.WON, Deal.amount))), 0).label(
-                "won"
-            ),
-            func.coalesce(func.sum(case((Deal.status == DealStatus.LOST, Deal.amount))), 0).label(
-                "lost"
-            ),
-        ).where(Deal.organization_id == organization_id)
-
-        amount_result = await self.session.execute(amount_by_status)
-        amount_row = amount_result.first()
-        amounts_by_status = StatusAmount(
-            new=Decimal(str(amount_row.new)) if amount_row and amount_row.new else Decimal("0"),
-            in_progress=Decimal(str(amount_row.in_progress))
-            if amount_row and amount_row.in_progress
-            else Decimal("0"),
-            won=Decimal(str(amount_row.won)) if amount_row and amount_row.won else Decimal("0"),
-            lost=Decimal(str(amount_row.lost)) if amount_row and amount_row.lost else Decimal("0"),
-        )
+        # One grouped pass: per-currency rows plus the ROLLUP grand-total row
+        columns = [
+            Deal.currency.label("currency"),
+            func.grouping(Deal.currency).label("is_total"),
+            func.avg(case((Deal.status == DealStatus.WON, Deal.amount))).label("avg_won"),
+            func.count(
+                case(
+                    (
+                        and_(Deal.status == DealStatus.NEW, Deal.created_at >= thirty_days_ago),
+                        1,
+                    )
+                )
+            ).label("new_last_30_days"),
+        ]
+        for deal_status in statuses:
+            columns.append(
+                func.count(case((Deal.status == deal_status, 1))).label(
+                    f"count_{deal_status.value}"
+                )
+            )
+            columns.append(
+                func.coalesce(func.sum(case((Deal.status == deal_status, Deal.amount))), 0).label(
+                    f"amount_{deal_status.value}"
+                )
+            )
 
-        # Average amount for won deals
-        avg_won_stmt = select(func.avg(Deal.amount)).where(
-            Deal.organization_id == organization_id, Deal.status == DealStatus.WON
-        )
-        avg_won_result = await self.session.scalar(avg_won_stmt)
-        avg_won_amount = avg_won_result if avg_won_result is not None else None
+        stmt = select(*columns).where(Deal.organization_id == organization_id)
 
-        # New deals in last 30 days
-        thirty_days_ago = datetime.now(tz=UTC) - timedelta(days=30)
-        new_deals_stmt = select(func.count(Deal.id)).where(
-            Deal.organization_id == organization_id,
-            Deal.status == DealStatus.NEW,
-            Deal.created_at >= thirty_days_ago,
-        )
-        new_deals_last_30_days = await self.session.scalar(new_deals_stmt) or 0
-
-        # Total deals count
-        total_deals = (
-            deals_by_status.new
-            + deals_by_status.in_progress
-            + deals_by_status.won
-            + deals_by_status.lost
-        )
+        if conversion is not None:
+            # Rates travel with the statement, so conversion happens inside the aggregate
+            fx_rates = _fx_rates(conversion)
+            factor = fx_rates.c.factor
+            columns_with_fx = [
+                func.count(case((factor.is_(None), 1))).label("unconverted"),
+            ]
+            for deal_status in statuses:
+                columns_with_fx.append(
+                    func.round(
+                        func.coalesce(
+                            func.sum(case((Deal.status == deal_status, Deal.amount * factor))), 0
+                        ),
+                        2,
+                    ).label(f"normalized_{deal_status.value}")
+                )
+            stmt = stmt.add_columns(*columns_with_fx).outerjoin(
+                fx_rates, fx_rates.c.currency == func.upper(Deal.currency)
+            )
+
+        stmt = stmt.group_by(func.rollup(Deal.currency)).order_by(Deal.currency)
+        rows = (await self.session.execute(stmt)).all()
+
+        total_row = next((row for row in rows if row.is_total), None)
+        by_currency = [
+            CurrencyBreakdown(
+                currency=row.currency,
+                total_deals=self._status_count(row).total(),
+                deals_by_status=self._status_count(row),
+                amounts_by_status=self._status_amount(row, "amount"),
+            )
+            for row in rows
+            if not row.is_total
+        ]
+
+        deals_by_status = self._status_count(total_row) if total_row else StatusCount()
+        normalized: NormalizedAmounts | None = None
+        if conversion is not None:
+            normalized = NormalizedAmounts(
+                currency=conversion.currency,
+                fx_version=conversion.version,
+                amounts_by_status=self._status_amount(total_row, "normalized")
+                if total_row
+                else StatusAmount(),
+                unconverted_currencies=[
+                    row.currency for row in rows if not row.is_total and row.unconverted
+                ],
+            )
 
         return DealsSummary(
-            total_deals=total_deals,
+            total_deals=deals_by_status.total(),
             deals_by_status=deals_by_status,
-            amounts_by_status=amounts_by_status,
-            avg_won_amount=avg_won_amount,
-            new_deals_last_30_days=int(new_deals_last_30_days),
+            amounts_by_status=self._status_amount(total_row, "amount")
+            if total_row
+            else StatusAmount(),
+            avg_won_amount=total_row.avg_won if total_row else None,
+            new_deals_last_30_days=int(total_row.new_last_30_days) if total_row else 0,
+            by_currency=by_currency,
+            normalized=normalized,
+        )
+
+    @staticmethod
+    def _status_count(row: Row[Any]) -> StatusCount:
+        return StatusCount(
+            **{
+                deal_status.value: int(getattr(row, f"count_{deal_status.value}") or 0)
+                for deal_status in DealStatus
+            }
+        )
+
+    @staticmethod
+    def _status_amount(row: Row[Any], prefix: str) -> StatusAmount:
+        return StatusAmount(
+            **{
+                deal_status.value: Decimal(str(getattr(row, f"{prefix}_{deal_status.value}") or 0))
+                for deal_status in DealStatus
+            }
         )
 
     async def deals_funnel(self, organization_id: int) -> DealsFunnel:
@@ -176,3 +219,108 @@ class SQLAlchemyAnalyticsRepository(AbstractAnalyticsRepository):
             )
 
         return DealsFunnel(stages=stages_data, conversion_rates=conversion_rates)
+
+    async def deals_by_owner(
+        self,
+        organization_id: int,
+        conversion: FxConversion,
+        *,
+        page: int,
+        page_size: int,
+        order_by: str = "won_amount",
+        order: str = "desc",
+    ) -> tuple[list[OwnerStats], int]:
+        offset = max(page - 1, 0) * page_size
+
+        # Amounts are summed in the conversion currency; deals without a rate are left
+        # out of the sums and their currencies reported instead
+        fx_rates = _fx_rates(conversion)
+        factor = fx_rates.c.factor
+        won_deals = func.count(case((Deal.status == DealStatus.WON, 1)))
+        lost_deals = func.count(case((Deal.status == DealStatus.LOST, 1)))
+        closed_deals = won_deals + lost_deals
+        sort_columns = {
+            "total_deals": func.count(Deal.id),
+            "won_amount": func.round(
+                func.coalesce(
+                    func.sum(case((Deal.status == DealStatus.WON, Deal.amount * factor))), 0
+                ),
+                2,
+            ),
+            "open_pipeline": func.round(
+                func.coalesce(
+                    func.sum(case((Deal.status.in_(OPEN_STATUSES), Deal.amount * factor))), 0
+                ),
+                2,
+            ),
+            "win_rate": case(
+                (closed_deals > 0, func.round(cast(won_deals, Numeric) * 100 / closed_deals, 2)),
+                else_=0,
+            ),
+        }
+        sort_column = sort_columns.get(order_by, sort_columns["won_amount"])
+
+        # Window count runs after grouping, so it yields the number of owners
+        stmt = (
+            select(
+                Deal.owner_id,
+                sort_columns["total_deals"].label("total_deals"),
+                func.count(case((Deal.status.in_(OPEN_STATUSES), 1))).label("open_deals"),
+                won_deals.label("won_deals"),
+                lost_deals.label("lost_deals"),
+                sort_columns["won_amount"].label("won_amount"),
+                sort_columns["open_pipeline"].label("open_pipeline"),
+                sort_columns["win_rate"].label("win_rate_percent"),
+                func.array_agg(Deal.currency.distinct())
+                .filter(factor.is_(None))
+                .label("unconverted"),
+                func.count().over().label("total_owners"),
+            )
+            .outerjoin(fx_rates, fx_rates.c.currency == func.upper(Deal.currency))
+            .where(Deal.organization_id == organization_id)
+            .group_by(Deal.owner_id)
+            .order_by(
+                sort_column.desc() if order == "desc" else sort_column.asc(),
+                Deal.owner_id.asc().nulls_last(),
+            )
+            .offset(offset)
+            .limit(page_size)
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        if rows:
+            total = int(rows[0].total_owners)
+        elif offset == 0:
+            total = 0
+        else:
+            # Page past the end: no rows to carry the window count
+            owners = (
+                select(Deal.owner_id)
+                .where(Deal.organization_id == organization_id)
+                .group_by(Deal.owner_id)
+                .subquery()
+            )
+            total = int(await self.session.scalar(select(func.count()).select_from(owners)) or 0)
+
+        items = [
+            OwnerStats(
+                owner_id=row.owner_id,
+                total_deals=int(row.total_deals),
+                open_deals=int(row.open_deals),
+                won_deals=int(row.won_deals),
+                lost_deals=int(row.lost_deals),
+                won_amount=Decimal(str(row.won_amount)),
+                open_pipeline=Decimal(str(row.open_pipeline)),
+                win_rate_percent=float(row.win_rate_percent),
+                unconverted_currencies=sorted(row.unconverted or []),
+            )
+            for row in rows
+        ]
+        return items, total
+
+
+def _fx_rates(conversion: FxConversion) -> Values:
+    """Conversion factors as an inline table joinable on the upper-cased currency."""
+    return values(column("currency", String), column("factor", Numeric), name="fx_rates").data(
+        list(conversion.factors.items())
+    )
@@ -1,27 +1,69 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mini_crm.core.dependencies import get_db_session, get_request_context
+from mini_crm.config.settings import get_settings
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.dependencies import (
+    get_cache,
+    get_db_session,
+    get_request_context,
+    get_streaming_session,
+)
+from mini_crm.core.export import EXPORT_FORMAT_CSV, close_on_error, export_response
+from mini_crm.core.pagination import TOTAL_MODE_EXACT, CachedCounter
 from mini_crm.modules.common.application.context import RequestContext
 from mini_crm.modules.common.domain.exceptions import PermissionDeniedError
-from mini_crm.modules.contacts.application.adapters import DealRepositoryAdapter
+from mini_crm.modules.contacts.application.duplicates import ContactDuplicateScanQueue
+from mini_crm.modules.contacts.application.suggestions import ContactSuggestionTracker
 from mini_crm.modules.contacts.application.use_cases import (
+    BulkDeleteContactsUseCase,
     CreateContactUseCase,
     DeleteContactUseCase,
+    ExportContactsUseCase,
+    GetContactDuplicatesUseCase,
+    GetContactUseCase,
+    ImportContactsUseCase,
     ListContactsUseCase,
+    MergeContactsUseCase,
+    RequestContactDuplicateScanUseCase,
+    SuggestContactsUseCase,
 )
 from mini_crm.modules.contacts.domain.exceptions import (
+    ContactDuplicateReportNotFoundError,
     ContactHasActiveDealsError,
+    ContactImportError,
     ContactNotFoundError,
 )
-from mini_crm.modules.contacts.domain.ports import AbstractDealChecker
-from mini_crm.modules.contacts.dto.schemas import ContactCreate, ContactResponse, PaginatedContacts
+from mini_crm.modules.contacts.dto.schemas import (
+    INCLUDE_DEAL_STATS,
+    ORDER_BY_ID,
+    ContactBulkDelete,
+    ContactBulkDeleteResult,
+    ContactCreate,
+    ContactDuplicateReport,
+    ContactImportResult,
+    ContactMerge,
+    ContactMergeResult,
+    ContactResponse,
+    ContactSuggestion,
+    PaginatedContacts,
+)
 from mini_crm.modules.contacts.repositories.repository import AbstractContactRepository
 from mini_crm.modules.contacts.repositories.sqlalchemy import SQLAlchemyContactRepository
-from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
-from mini_crm.modules.deals.repositories.sqlalchemy import SQLAlchemyDealRepository
+from mini_crm.modules.contacts.services.suggest_index import ContactSuggestIndex
+from mini_crm.shared.domain.exceptions import InvalidCursorError
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
@@ -32,24 +74,48 @@ def get_contact_repository(
     return SQLAlchemyContactRepository(session=session)
 
 
-def get_deal_repository_for_checker(
-    session: AsyncSession = Depends(get_db_session),
-) -> AbstractDealRepository:
-    """Create deal repository instance for use in deal checker adapter."""
-    return SQLAlchemyDealRepository(session=session)
+def get_contact_suggestion_tracker(
+    cache: RedisCache = Depends(get_cache),
+) -> ContactSuggestionTracker:
+    """Tracker for contact writes, recorded from a background task.
+
+    Background tasks run after the request's session has committed, so no process
+    rebuilds its suggest index at the new version from a snapshot missing the write.
+    """
+    return ContactSuggestionTracker(cache, ContactSuggestIndex.get_instance())
 
 
-def get_deal_checker(
-    deal_repository: AbstractDealRepository = Depends(get_deal_repository_for_checker),
-) -> AbstractDealChecker:
-    """Create deal checker adapter that wraps deal repository."""
-    return DealRepositoryAdapter(deal_repository=deal_repository)
+def get_contact_duplicate_scan_queue() -> ContactDuplicateScanQueue:
+    return ContactDuplicateScanQueue(
+        RedisCache.get_instance(), get_settings().contact_dedup_report_ttl_seconds
+    )
 
 
 def get_list_contacts_use_case(
     repository: AbstractContactRepository = Depends(get_contact_repository),
 ) -> ListContactsUseCase:
-    return ListContactsUseCase(repository=repository)
+    return ListContactsUseCase(
+        repository=repository, counter=CachedCounter(RedisCache.get_instance())
+    )
+
+
+def get_contact_use_case(
+    repository: AbstractContactRepository = Depends(get_contact_repository),
+) -> GetContactUseCase:
+    return GetContactUseCase(repository=repository)
+
+
+def get_export_contacts_use_case(
+    session: AsyncSession = Depends(get_streaming_session),
+) -> ExportContactsUseCase:
+    return ExportContactsUseCase(repository=SQLAlchemyContactRepository(session=session))
+
+
+def get_suggest_contacts_use_case(
+    repository: AbstractContactRepository = Depends(get_contact_repository),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
+) -> SuggestContactsUseCase:
+    return SuggestContactsUseCase(repository=repository, suggestions=suggestions)
 
 
 def get_create_contact_use_case(
@@ -58,11 +124,40 @@ def get_create_contact_use_case(
     return CreateContactUseCase(repository=repository)
 
 
+def get_import_contacts_use_case(
+    repository: AbstractContactRepository = Depends(get_contact_repository),
+) -> ImportContactsUseCase:
+    return ImportContactsUseCase(repository=repository)
+
+
 def get_delete_contact_use_case(
     repository: AbstractContactRepository = Depends(get_contact_repository),
-    deal_checker: AbstractDealChecker = Depends(get_deal_checker),
 ) -> DeleteContactUseCase:
-    return DeleteContactUseCase(repository=repository, deal_checker=deal_checker)
+    return DeleteContactUseCase(repository=repository)
+
+
+def get_bulk_delete_contacts_use_case(
+    repository: AbstractContactRepository = Depends(get_contact_repository),
+) -> BulkDeleteContactsUseCase:
+    return BulkDeleteContactsUseCase(repository=repository)
+
+
+def get_contact_duplicates_use_case(
+    queue: ContactDuplicateScanQueue = Depends(get_contact_duplicate_scan_queue),
+) -> GetContactDuplicatesUseCase:
+    return GetContactDuplicatesUseCase(queue=queue)
+
+
+def get_scan_contact_duplicates_use_case(
+    queue: ContactDuplicateScanQueue = Depends(get_contact_duplicate_scan_queue),
+) -> RequestContactDuplicateScanUseCase:
+    return RequestContactDuplicateScanUseCase(queue=queue)
+
+
+def get_merge_contacts_use_case(
+    repository: AbstractContactRepository = Depends(get_contact_repository),
+) -> MergeContactsUseCase:
+    return MergeContactsUseCase(repository=repository)
 
 
 @router.get("", response_model=PaginatedContacts)
@@ -71,6 +166,11 @@ async def list_contacts(
     page_size: int = 50,
     search: str | None = None,
     owner_id: int | None = None,
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: bool | None = None,
+    total_mode: str = Query(default=TOTAL_MODE_EXACT, pattern="^(exact|estimated)$"),
+    include: str | None = Query(default=None, pattern=f"^{INCLUDE_DEAL_STATS}$"),
+    order_by: str | None = Query(default=None, pattern=f"^{ORDER_BY_ID}$"),
     context: RequestContext = Depends(get_request_context),
     use_case: ListContactsUseCase = Depends(get_list_contacts_use_case),
 ) -> PaginatedContacts:
@@ -81,34 +181,181 @@ async def list_contacts(
             page_size=page_size,
             search=search,
             owner_id=owner_id,
+            cursor=cursor,
+            include_total=include_total,
+            total_mode=total_mode,
+            with_deal_stats=include == INCLUDE_DEAL_STATS,
+            order_by=order_by,
         )
         items, meta = result.to_paginated()
         return PaginatedContacts(items=items, meta=meta)
     except PermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_contacts(
+    export_format: str = Query(default=EXPORT_FORMAT_CSV, alias="format", pattern="^(csv|ndjson)$"),
+    search: str | None = None,
+    owner_id: int | None = None,
+    context: RequestContext = Depends(get_request_context),
+    session: AsyncSession = Depends(get_streaming_session),
+    use_case: ExportContactsUseCase = Depends(get_export_contacts_use_case),
+) -> StreamingResponse:
+    async with close_on_error(session):
+        try:
+            chunks = await use_case.execute(
+                context, export_format, search=search, owner_id=owner_id
+            )
+        except PermissionDeniedError as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    return export_response(chunks, export_format, "contacts", session)
+
+
+@router.get("/suggest", response_model=list[ContactSuggestion])
+async def suggest_contacts(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=50),
+    context: RequestContext = Depends(get_request_context),
+    use_case: SuggestContactsUseCase = Depends(get_suggest_contacts_use_case),
+) -> list[ContactSuggestion]:
+    """Typeahead: contacts whose name, a word of the name, or email starts with ``q``."""
+    return await use_case.execute(context, q, limit)
 
 
 @router.post("", response_model=ContactResponse, status_code=201)
 async def create_contact(
     payload: ContactCreate,
+    background_tasks: BackgroundTasks,
     context: RequestContext = Depends(get_request_context),
     use_case: CreateContactUseCase = Depends(get_create_contact_use_case),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
 ) -> ContactResponse:
-    return await use_case.execute(context, payload)
+    contact = await use_case.execute(context, payload)
+    background_tasks.add_task(
+        suggestions.contact_created, context.organization.organization_id, contact
+    )
+    return contact
+
+
+@router.post(
+    "/import",
+    response_model=ContactImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/csv": {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def import_contacts(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    context: RequestContext = Depends(get_request_context),
+    use_case: ImportContactsUseCase = Depends(get_import_contacts_use_case),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
+) -> ContactImportResult:
+    """Import contacts from a CSV request body, streamed rather than buffered."""
+    try:
+        result = await use_case.execute(context, request.stream())
+    except ContactImportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    if result.imported:
+        background_tasks.add_task(
+            suggestions.contacts_changed, context.organization.organization_id
+        )
+    return result
+
+
+@router.post("/bulk/delete", response_model=ContactBulkDeleteResult)
+async def bulk_delete_contacts(
+    payload: ContactBulkDelete,
+    background_tasks: BackgroundTasks,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkDeleteContactsUseCase = Depends(get_bulk_delete_contacts_use_case),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
+) -> ContactBulkDeleteResult:
+    result = await use_case.execute(context, payload)
+    if result.deleted:
+        background_tasks.add_task(
+            suggestions.contacts_changed, context.organization.organization_id
+        )
+    return result
+
+
+@router.get("/duplicates", response_model=ContactDuplicateReport)
+async def get_contact_duplicates(
+    context: RequestContext = Depends(get_request_context),
+    use_case: GetContactDuplicatesUseCase = Depends(get_contact_duplicates_use_case),
+) -> ContactDuplicateReport:
+    try:
+        return await use_case.execute(context)
+    except ContactDuplicateReportNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+@router.post("/duplicates/scan", response_model=ContactDuplicateReport, status_code=202)
+async def scan_contact_duplicates(
+    context: RequestContext = Depends(get_request_context),
+    use_case: RequestContactDuplicateScanUseCase = Depends(get_scan_contact_duplicates_use_case),
+) -> ContactDuplicateReport:
+    """Queue a duplicate scan; the worker replaces the pending report when it is done."""
+    return await use_case.execute(context)
+
+
+@router.post("/merge", response_model=ContactMergeResult)
+async def merge_contacts(
+    payload: ContactMerge,
+    background_tasks: BackgroundTasks,
+    context: RequestContext = Depends(get_request_context),
+    use_case: MergeContactsUseCase = Depends(get_merge_contacts_use_case),
+    queue: ContactDuplicateScanQueue = Depends(get_contact_duplicate_scan_queue),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
+) -> ContactMergeResult:
+    try:
+        result = await use_case.execute(context, payload)
+    except ContactNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except PermissionDeniedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    # The stored report still lists the merged contacts. Rescan once the merge has
+    # committed, so the worker cannot read the contacts from before it.
+    background_tasks.add_task(queue.requeue, context.organization.organization_id)
+    background_tasks.add_task(suggestions.contacts_changed, context.organization.organization_id)
+    return result
+
+
+@router.get("/{contact_id}", response_model=ContactResponse)
+async def get_contact(
+    contact_id: int,
+    context: RequestContext = Depends(get_request_context),
+    use_case: GetContactUseCase = Depends(get_contact_use_case),
+) -> ContactResponse:
+    try:
+        return await use_case.execute(context, contact_id)
+    except ContactNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
 
 
 @router.delete("/{contact_id}", status_code=204)
 async def delete_contact(
     contact_id: int,
+    background_tasks: BackgroundTasks,
     context: RequestContext = Depends(get_request_context),
     use_case: DeleteContactUseCase = Depends(get_delete_contact_use_case),
+    suggestions: ContactSuggestionTracker = Depends(get_contact_suggestion_tracker),
 ) -> Response:
     try:
         await use_case.execute(context, contact_id)
-        return Response(status_code=204)
     except ContactNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except PermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
     except ContactHasActiveDealsError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+    background_tasks.add_task(
+        suggestions.contact_deleted, context.organization.organization_id, contact_id
+    )
+    return Response(status_code=204)
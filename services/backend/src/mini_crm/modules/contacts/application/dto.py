@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from mini_crm.modules.contacts.dto.schemas import ContactResponse
-from mini_crm.shared.dto.pagination import PaginationMeta
+from mini_crm.shared.dto.pagination import CursorPaginationMeta
 
 
 @dataclass
@@ -11,13 +11,19 @@ class ContactListDTO:
     """DTO for contact list."""
 
     items: list[ContactResponse]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     page_size: int
+    has_more: bool = False
+    next_cursor: str | None = None
 
-    def to_paginated(self) -> tuple[list[ContactResponse], PaginationMeta]:
+    def to_paginated(self) -> tuple[list[ContactResponse], CursorPaginationMeta]:
         """Convert to paginated response."""
-        from mini_crm.shared.dto.pagination import PaginationMeta
-
-        meta = PaginationMeta(page=self.page, page_size=self.page_size, total=self.total)
+        meta = CursorPaginationMeta(
+            page=self.page,
+            page_size=self.page_size,
+            total=self.total,
+            has_more=self.has_more,
+            next_cursor=self.next_cursor,
+        )
         return self.items, meta
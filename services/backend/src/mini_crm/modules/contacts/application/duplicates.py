@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from mini_crm.core.cache import RedisCache
+from mini_crm.modules.contacts.dto.schemas import DUPLICATE_REPORT_PENDING, ContactDuplicateReport
+
+PENDING_DUPLICATE_SCANS_KEY = "contacts:duplicates:pending"
+
+
+def _report_key(organization_id: int) -> str:
+    return f"contacts:duplicates:report:{organization_id}"
+
+
+class ContactDuplicateScanQueue:
+    """Hands duplicate scans from the API to the worker and keeps their reports."""
+
+    def __init__(self, cache: RedisCache, report_ttl_seconds: int) -> None:
+        self.cache = cache
+        self.report_ttl_seconds = report_ttl_seconds
+
+    async def enqueue(self, organization_id: int) -> None:
+        """Ask the worker to scan the organization."""
+        await self.cache.sadd(PENDING_DUPLICATE_SCANS_KEY, str(organization_id))
+
+    async def requeue(self, organization_id: int) -> None:
+        """Rescan after contacts changed, replacing a stored report that is now stale.
+
+        Organizations without a report never asked for a scan and are left alone.
+        """
+        if await self.get_report(organization_id) is None:
+            return
+        report = ContactDuplicateReport(
+            status=DUPLICATE_REPORT_PENDING, requested_at=datetime.now(tz=UTC)
+        )
+        await self.save_report(organization_id, report)
+        await self.enqueue(organization_id)
+
+    async def pop_pending(self, limit: int = 100) -> list[int]:
+        """Remove and return organizations waiting for a scan."""
+        members = await self.cache.spop(PENDING_DUPLICATE_SCANS_KEY, limit)
+        return [int(member) for member in members]
+
+    async def save_report(self, organization_id: int, report: ContactDuplicateReport) -> None:
+        await self.cache.set(
+            _report_key(organization_id),
+            report.model_dump_json().encode("utf-8"),
+            self.report_ttl_seconds,
+        )
+
+    async def get_report(self, organization_id: int) -> ContactDuplicateReport | None:
+        raw = await self.cache.get(_report_key(organization_id))
+        if raw is None:
+            return None
+        return ContactDuplicateReport.model_validate_json(raw)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import structlog
+
+from mini_crm.core.cache import RedisCache
+from mini_crm.modules.contacts.dto.schemas import ContactResponse, ContactSuggestion
+from mini_crm.modules.contacts.services.suggest_index import ContactSuggestIndex
+
+logger = structlog.get_logger(__name__)
+
+
+def _version_key(organization_id: int) -> str:
+    return f"contacts:suggest:version:{organization_id}"
+
+
+class ContactSuggestionTracker:
+    """Keeps the in-memory suggest index in step with contact writes.
+
+    Every write bumps a per-organization version in Redis once it has committed, so a
+    process that sees the new version rebuilds from data that includes the write. The
+    writing process updates its own index in place; other processes rebuild lazily. A
+    failed bump is only logged: the write stands, and indexes are rebuilt after
+    ``CONTACT_SUGGEST_MAX_AGE_SECONDS`` regardless.
+    """
+
+    def __init__(self, cache: RedisCache, index: ContactSuggestIndex) -> None:
+        self.cache = cache
+        self.index = index
+
+    async def version(self, organization_id: int) -> int:
+        raw = await self.cache.get(_version_key(organization_id))
+        return int(raw) if raw is not None else 0
+
+    async def contact_created(self, organization_id: int, contact: ContactResponse) -> None:
+        """Record a committed create."""
+        version = await self._bump(organization_id)
+        if version is not None:
+            suggestion = ContactSuggestion(id=contact.id, name=contact.name, email=contact.email)
+            self.index.apply(organization_id, version, added=suggestion)
+
+    async def contact_deleted(self, organization_id: int, contact_id: int) -> None:
+        """Record a committed delete."""
+        version = await self._bump(organization_id)
+        if version is not None:
+            self.index.apply(organization_id, version, removed_id=contact_id)
+
+    async def contacts_changed(self, organization_id: int) -> None:
+        """Record a committed bulk change; every process rebuilds the index on next use."""
+        await self._bump(organization_id)
+        self.index.discard(organization_id)
+
+    async def _bump(self, organization_id: int) -> int | None:
+        try:
+            return await self.cache.incr(_version_key(organization_id))
+        except Exception:
+            logger.exception("contact_suggest_version_bump_failed", organization_id=organization_id)
+            # The local index can no longer be matched to a version; rebuild it on next use
+            self.index.discard(organization_id)
+            return None
@@ -1,20 +1,65 @@
 from __future__ import annotations
 
+import csv
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import UTC, datetime
+
+import structlog
+from pydantic import ValidationError as PydanticValidationError
+
+from mini_crm.config.settings import get_settings
+from mini_crm.core.export import encode_rows
+from mini_crm.core.importing import CsvRecordTooLargeError, parse_csv_record, split_csv_records
+from mini_crm.core.pagination import TOTAL_MODE_ESTIMATED, TOTAL_MODE_EXACT, CachedCounter
 from mini_crm.modules.common.application.context import RequestContext
+from mini_crm.modules.common.domain.exceptions import PermissionDeniedError
 from mini_crm.modules.common.domain.services import PermissionService
 from mini_crm.modules.contacts.application.dto import ContactListDTO
-from mini_crm.modules.contacts.domain.exceptions import ContactNotFoundError
-from mini_crm.modules.contacts.domain.ports import AbstractDealChecker
+from mini_crm.modules.contacts.application.duplicates import ContactDuplicateScanQueue
+from mini_crm.modules.contacts.application.suggestions import ContactSuggestionTracker
+from mini_crm.modules.contacts.domain.exceptions import (
+    ContactDuplicateReportNotFoundError,
+    ContactImportError,
+    ContactNotFoundError,
+)
 from mini_crm.modules.contacts.domain.services import ContactDomainService
-from mini_crm.modules.contacts.dto.schemas import ContactCreate, ContactResponse
+from mini_crm.modules.contacts.dto.schemas import (
+    CONTACT_IMPORT_BATCH_SIZE,
+    DUPLICATE_REPORT_PENDING,
+    DUPLICATE_REPORT_READY,
+    MAX_CONTACT_IMPORT_ERRORS,
+    MAX_DUPLICATE_GROUPS,
+    ORDER_BY_ID,
+    ContactBulkDelete,
+    ContactBulkDeleteResult,
+    ContactCreate,
+    ContactCursor,
+    ContactDeletion,
+    ContactDuplicateReport,
+    ContactImportResult,
+    ContactMerge,
+    ContactMergeResult,
+    ContactResponse,
+    ContactSuggestion,
+)
 from mini_crm.modules.contacts.repositories.repository import AbstractContactRepository
+from mini_crm.shared.domain.exceptions import DomainError
+from mini_crm.shared.dto.bulk import BulkItemError
+from mini_crm.shared.enums import UserRole
+
+logger = structlog.get_logger(__name__)
+
+IMPORT_COLUMNS = ("name", "email", "phone")
 
 
 class ListContactsUseCase:
     """Use case for listing contacts."""
 
-    def __init__(self, repository: AbstractContactRepository) -> None:
+    def __init__(
+        self, repository: AbstractContactRepository, counter: CachedCounter | None = None
+    ) -> None:
         self.repository = repository
+        self.counter = counter
 
     async def execute(
         self,
@@ -23,22 +68,177 @@ class ListContactsUseCase:
         page_size: int = 50,
         search: str | None = None,
         owner_id: int | None = None,
+        cursor: str | None = None,
+        include_total: bool | None = None,
+        total_mode: str = TOTAL_MODE_EXACT,
+        with_deal_stats: bool = False,
+        order_by: str | None = None,
     ) -> ContactListDTO:
-        """List contacts with permission checks."""
+        """List contacts with permission checks.
+
+        With ``cursor`` the page is read by keyset in ``id`` order after the cursor
+        position, which costs the same at any depth; ``order_by="id"`` starts such a
+        walk at the first contact, also when searching. Otherwise ``page`` selects an
+        offset page, ranked by similarity when searching. Totals are counted by
+        default only in page mode. ``with_deal_stats`` reads each contact's deal
+        aggregates in the same query as the page.
+        """
         if owner_id is not None:
             if not PermissionService.can_filter_by_owner(context.organization.role):
-                from mini_crm.modules.common.domain.exceptions import PermissionDeniedError
-
                 raise PermissionDeniedError("Filtering by owner_id is not allowed for member role")
 
-        items, total = await self.repository.list(
-            context.organization.organization_id,
-            page=page,
+        organization_id = context.organization.organization_id
+        keyset = cursor is not None or order_by == ORDER_BY_ID
+        if include_total is None:
+            include_total = not keyset
+
+        if not keyset and include_total and total_mode == TOTAL_MODE_EXACT:
+            items, total = await self.repository.list(
+                organization_id,
+                page=page,
+                page_size=page_size,
+                search=search,
+                owner_id=owner_id,
+                with_deal_stats=with_deal_stats,
+            )
+            has_more = page * page_size < total
+            return ContactListDTO(
+                items=items,
+                total=total,
+                page=page,
+                page_size=page_size,
+                has_more=has_more,
+                next_cursor=self._next_cursor(items, has_more, search),
+            )
+
+        if keyset:
+            items, has_more = await self.repository.list_after(
+                organization_id,
+                cursor=ContactCursor.decode(cursor) if cursor is not None else None,
+                limit=page_size,
+                search=search,
+                owner_id=owner_id,
+                with_deal_stats=with_deal_stats,
+            )
+        else:
+            items, has_more = await self.repository.list_page(
+                organization_id,
+                page=page,
+                page_size=page_size,
+                search=search,
+                owner_id=owner_id,
+                with_deal_stats=with_deal_stats,
+            )
+
+        counted_total: int | None = None
+        if include_total:
+
+            async def count() -> int:
+                return await self.repository.count(
+                    organization_id, search=search, owner_id=owner_id
+                )
+
+            if total_mode == TOTAL_MODE_ESTIMATED and self.counter is not None:
+                key = CachedCounter.key(
+                    "contacts", organization_id, search=search, owner_id=owner_id
+                )
+                counted_total = await self.counter.get_or_count(key, count)
+            else:
+                counted_total = await count()
+
+        return ContactListDTO(
+            items=items,
+            total=counted_total,
+            page=page if not keyset else None,
             page_size=page_size,
-            search=search,
-            owner_id=owner_id,
+            has_more=has_more,
+            next_cursor=self._next_cursor(items, has_more, search if not keyset else None),
+        )
+
+    @staticmethod
+    def _next_cursor(
+        items: list[ContactResponse], has_more: bool, ranked_by: str | None
+    ) -> str | None:
+        # Cursors continue in id order, which only follows on from unranked pages;
+        # a ranked search walks by cursor from the start with order_by=id instead
+        if not has_more or not items or ranked_by:
+            return None
+        return ContactCursor.from_contact(items[-1]).encode()
+
+
+class GetContactUseCase:
+    """Use case for reading one contact with its deal aggregates."""
+
+    def __init__(self, repository: AbstractContactRepository) -> None:
+        self.repository = repository
+
+    async def execute(self, context: RequestContext, contact_id: int) -> ContactResponse:
+        contact = await self.repository.get_by_id(
+            context.organization.organization_id, contact_id, with_deal_stats=True
+        )
+        if contact is None:
+            raise ContactNotFoundError(contact_id)
+        return contact
+
+
+class ExportContactsUseCase:
+    """Use case for exporting all contacts matching the list filters."""
+
+    def __init__(self, repository: AbstractContactRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self,
+        context: RequestContext,
+        export_format: str,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Check permissions up front and return the lazily encoded export body."""
+        if owner_id is not None:
+            if not PermissionService.can_filter_by_owner(context.organization.role):
+                raise PermissionDeniedError("Filtering by owner_id is not allowed for member role")
+
+        contacts = self.repository.stream(
+            context.organization.organization_id, search=search, owner_id=owner_id
         )
-        return ContactListDTO(items=items, total=total, page=page, page_size=page_size)
+        # Deal aggregates are never read for exports, so the nested field is left out
+        fields = [field for field in ContactResponse.model_fields if field != "deal_stats"]
+        return encode_rows(contacts, export_format, fields)
+
+
+class SuggestContactsUseCase:
+    """Use case for contact typeahead suggestions."""
+
+    def __init__(
+        self, repository: AbstractContactRepository, suggestions: ContactSuggestionTracker
+    ) -> None:
+        self.repository = repository
+        self.suggestions = suggestions
+
+    async def execute(
+        self, context: RequestContext, query: str, limit: int = 10
+    ) -> list[ContactSuggestion]:
+        """Return up to ``limit`` contacts whose name, a name word or email starts with ``query``.
+
+        Served from the in-memory index, built on first use; organizations too large
+        for the index are searched in the database.
+        """
+        organization_id = context.organization.organization_id
+        suggest_index = self.suggestions.index
+        version = await self.suggestions.version(organization_id)
+        index = suggest_index.get(organization_id, version)
+        if index is None:
+            count = await self.repository.count(organization_id)
+            if count > suggest_index.max_contacts_per_organization:
+                index = suggest_index.put_oversized(organization_id, version)
+            else:
+                contacts = await self.repository.list_suggestions(organization_id)
+                index = suggest_index.put(organization_id, contacts, version)
+
+        if index.oversized:
+            return await self.repository.suggest(organization_id, query, limit)
+        return index.search(query, limit)
 
 
 class CreateContactUseCase:
@@ -49,40 +249,281 @@ class CreateContactUseCase:
 
     async def execute(self, context: RequestContext, payload: ContactCreate) -> ContactResponse:
         """Create a new contact."""
-        contact = await self.repository.create(
+        return await self.repository.create(
             context.organization.organization_id, context.user.id, payload
         )
-        return contact
 
 
-class DeleteContactUseCase:
-    """Use case for deleting a contact."""
+class ImportContactsUseCase:
+    """Use case for importing contacts from an uploaded CSV file."""
 
     def __init__(
         self,
         repository: AbstractContactRepository,
-        deal_checker: AbstractDealChecker | None = None,
+        batch_size: int = CONTACT_IMPORT_BATCH_SIZE,
     ) -> None:
         self.repository = repository
-        self.deal_checker = deal_checker
+        self.batch_size = batch_size
+
+    async def execute(
+        self, context: RequestContext, chunks: AsyncIterable[bytes]
+    ) -> ContactImportResult:
+        """Import contacts owned by the current user, reading the file as it arrives.
+
+        The first record is a header naming the ``name``, ``email`` and ``phone``
+        columns (others are ignored). Invalid rows and rows whose email is already
+        used in the organization are reported and skipped; the rest are inserted.
+        Malformed CSV records are reported like invalid rows.
+        """
+        organization_id = context.organization.organization_id
+        records = split_csv_records(chunks)
+        processed = imported = 0
+        errors: list[BulkItemError] = []
+        failed = 0
+        batch: list[tuple[int, ContactCreate]] = []
+
+        def reject(index: int, detail: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < MAX_CONTACT_IMPORT_ERRORS:
+                errors.append(BulkItemError(index=index, detail=detail))
+
+        async def flush() -> None:
+            nonlocal imported
+            if not batch:
+                return
+            duplicates = await self.repository.import_batch(organization_id, context.user.id, batch)
+            imported += len(batch) - len(duplicates)
+            for index in duplicates:
+                reject(index, "A contact with this email already exists")
+            batch.clear()
+            logger.info(
+                "contacts_import_progress",
+                organization_id=organization_id,
+                processed=processed,
+                imported=imported,
+                failed=failed,
+            )
+
+        try:
+            header = await anext(records, None)
+            if header is None:
+                raise ContactImportError("The uploaded file is empty")
+            try:
+                positions = self._column_positions(parse_csv_record(header))
+            except csv.Error as exc:
+                raise ContactImportError(f"The header row is not valid CSV: {exc}") from exc
+
+            async for record in records:
+                index = processed
+                processed += 1
+                try:
+                    batch.append((index, self._parse_row(parse_csv_record(record), positions)))
+                except csv.Error as exc:
+                    reject(index, f"Malformed CSV record: {exc}")
+                except PydanticValidationError as exc:
+                    error = exc.errors()[0]
+                    field = ".".join(str(part) for part in error["loc"])
+                    reject(index, f"{field}: {error['msg']}")
+                except ValueError as exc:
+                    reject(index, str(exc))
+                if len(batch) >= self.batch_size:
+                    await flush()
+        except UnicodeDecodeError as exc:
+            raise ContactImportError("The uploaded file is not valid UTF-8") from exc
+        except CsvRecordTooLargeError as exc:
+            raise ContactImportError(f"{exc}; check the file for an unclosed quote") from exc
+        await flush()
+
+        return ContactImportResult(
+            processed=processed, imported=imported, failed=failed, errors=errors
+        )
+
+    @staticmethod
+    def _column_positions(header: list[str]) -> dict[str, int]:
+        columns = [name.strip().lower() for name in header]
+        if "name" not in columns:
+            raise ContactImportError("The header row must include a 'name' column")
+        return {field: columns.index(field) for field in IMPORT_COLUMNS if field in columns}
+
+    @staticmethod
+    def _parse_row(record: list[str], positions: dict[str, int]) -> ContactCreate:
+        values: dict[str, str | None] = {}
+        for field, position in positions.items():
+            value = record[position].strip() if position < len(record) else ""
+            if "\x00" in value:
+                raise ValueError(f"{field}: NUL characters are not allowed")
+            values[field] = value or None
+        return ContactCreate.model_validate(values)
+
+
+class DeleteContactUseCase:
+    """Use case for deleting a contact."""
+
+    def __init__(self, repository: AbstractContactRepository) -> None:
+        self.repository = repository
 
     async def execute(self, context: RequestContext, contact_id: int) -> None:
-        """Delete a contact with business rule validation."""
-        contact = await self.repository.get_by_id(context.organization.organization_id, contact_id)
-        if contact is None:
+        """Delete a contact with business rule validation.
+
+        Ownership and the no-deals rule are enforced by the delete statement itself;
+        a contact that was kept is then attributed to the rule that kept it.
+        """
+        organization_id = context.organization.organization_id
+        outcomes = await self.repository.delete_many(
+            organization_id, [contact_id], owner_id=_owner_scope(context)
+        )
+        if not outcomes:
             raise ContactNotFoundError(contact_id)
+        _raise_if_kept(context, outcomes[0])
+
+
+class BulkDeleteContactsUseCase:
+    """Use case for deleting many contacts in one request."""
+
+    def __init__(self, repository: AbstractContactRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self, context: RequestContext, payload: ContactBulkDelete
+    ) -> ContactBulkDeleteResult:
+        """Delete every contact the single delete would allow; report the rest per item."""
+        organization_id = context.organization.organization_id
+        outcomes = {
+            outcome.id: outcome
+            for outcome in await self.repository.delete_many(
+                organization_id, payload.ids, owner_id=_owner_scope(context)
+            )
+        }
+
+        deleted: list[int] = []
+        errors: list[BulkItemError] = []
+        for index, contact_id in enumerate(payload.ids):
+            outcome = outcomes.get(contact_id)
+            try:
+                if outcome is None:
+                    raise ContactNotFoundError(contact_id)
+                _raise_if_kept(context, outcome)
+            except DomainError as e:
+                errors.append(BulkItemError(index=index, detail=str(e)))
+            else:
+                deleted.append(contact_id)
+
+        return ContactBulkDeleteResult(deleted=deleted, errors=errors)
+
+
+class RequestContactDuplicateScanUseCase:
+    """Use case for queueing a duplicate scan of the organization's contacts."""
+
+    def __init__(self, queue: ContactDuplicateScanQueue) -> None:
+        self.queue = queue
+
+    async def execute(self, context: RequestContext) -> ContactDuplicateReport:
+        organization_id = context.organization.organization_id
+        report = ContactDuplicateReport(
+            status=DUPLICATE_REPORT_PENDING, requested_at=datetime.now(tz=UTC)
+        )
+        await self.queue.save_report(organization_id, report)
+        await self.queue.enqueue(organization_id)
+        return report
+
+
+class GetContactDuplicatesUseCase:
+    """Use case for reading the latest duplicate scan of the organization."""
+
+    def __init__(self, queue: ContactDuplicateScanQueue) -> None:
+        self.queue = queue
+
+    async def execute(self, context: RequestContext) -> ContactDuplicateReport:
+        report = await self.queue.get_report(context.organization.organization_id)
+        if report is None:
+            raise ContactDuplicateReportNotFoundError()
+        return report
+
+
+class ScanContactDuplicatesUseCase:
+    """Finds duplicate contacts of an organization and stores the report; run by the worker."""
+
+    def __init__(
+        self,
+        repository: AbstractContactRepository,
+        queue: ContactDuplicateScanQueue,
+        min_name_similarity: float | None = None,
+        max_block_size: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.repository = repository
+        self.queue = queue
+        self.min_name_similarity = (
+            min_name_similarity
+            if min_name_similarity is not None
+            else settings.contact_dedup_min_name_similarity
+        )
+        self.max_block_size = (
+            max_block_size if max_block_size is not None else settings.contact_dedup_max_block_size
+        )
+
+    async def refresh(self, organization_id: int) -> ContactDuplicateReport:
+        previous = await self.queue.get_report(organization_id)
+        pairs = await self.repository.find_duplicate_pairs(
+            organization_id,
+            min_name_similarity=self.min_name_similarity,
+            max_block_size=self.max_block_size,
+        )
+        groups = ContactDomainService.group_duplicates(pairs)
+        now = datetime.now(tz=UTC)
+        report = ContactDuplicateReport(
+            status=DUPLICATE_REPORT_READY,
+            requested_at=previous.requested_at if previous is not None else now,
+            generated_at=now,
+            total_groups=len(groups),
+            groups=groups[:MAX_DUPLICATE_GROUPS],
+        )
+        await self.queue.save_report(organization_id, report)
+        return report
+
+
+class MergeContactsUseCase:
+    """Use case for merging duplicate contacts into one."""
+
+    def __init__(self, repository: AbstractContactRepository) -> None:
+        self.repository = repository
+
+    async def execute(self, context: RequestContext, payload: ContactMerge) -> ContactMergeResult:
+        """Merge the duplicates into the primary contact, moving their deals onto it."""
+        organization_id = context.organization.organization_id
+        contact_ids = [payload.primary_id, *payload.duplicate_ids]
+        contacts = {
+            contact.id: contact
+            for contact in await self.repository.get_many_for_update(organization_id, contact_ids)
+        }
+        for contact_id in contact_ids:
+            contact = contacts.get(contact_id)
+            if contact is None:
+                raise ContactNotFoundError(contact_id)
+            if not PermissionService.can_update_entity(
+                context.organization.role, contact.owner_id, context.user.id
+            ):
+                raise PermissionDeniedError("You can only merge your own contacts")
+
+        primary, deals_moved = await self.repository.merge(
+            organization_id, payload.primary_id, payload.duplicate_ids
+        )
+        return ContactMergeResult(
+            contact=primary, merged_ids=payload.duplicate_ids, deals_moved=deals_moved
+        )
 
-        # Check permissions
-        if not PermissionService.can_delete_entity(
-            context.organization.role, contact.owner_id, context.user.id
-        ):
-            from mini_crm.modules.common.domain.exceptions import PermissionDeniedError
 
-            raise PermissionDeniedError("You can only delete your own contacts")
+def _owner_scope(context: RequestContext) -> int | None:
+    """Members may only delete their own contacts."""
+    return context.user.id if context.organization.role == UserRole.MEMBER else None
 
-        # Check business rules: cannot delete if has deals
-        if self.deal_checker:
-            has_deals = await self.deal_checker.has_deals_for_contact(contact_id)
-            ContactDomainService.validate_deletion(has_deals, contact_id)
 
-        await self.repository.delete(context.organization.organization_id, contact_id)
+def _raise_if_kept(context: RequestContext, outcome: ContactDeletion) -> None:
+    if outcome.deleted:
+        return
+    if not PermissionService.can_delete_entity(
+        context.organization.role, outcome.owner_id, context.user.id
+    ):
+        raise PermissionDeniedError("You can only delete your own contacts")
+    ContactDomainService.validate_deletion(True, outcome.id)
@@ -5,5 +5,4 @@ __all__ = [
     "ContactNotFoundError",
     "ContactHasActiveDealsError",
     "ContactDomainService",
-    "AbstractDealChecker",
 ]
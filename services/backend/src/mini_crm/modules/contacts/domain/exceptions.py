@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from mini_crm.shared.domain.exceptions import BusinessRuleViolationError, NotFoundError
+from mini_crm.shared.domain.exceptions import (
+    BusinessRuleViolationError,
+    NotFoundError,
+    ValidationError,
+)
 
 
 class ContactNotFoundError(NotFoundError):
@@ -18,3 +22,14 @@ class ContactHasActiveDealsError(BusinessRuleViolationError):
         message = f"Cannot delete contact {contact_id} with existing deals"
         super().__init__(message)
         self.contact_id = contact_id
+
+
+class ContactDuplicateReportNotFoundError(NotFoundError):
+    """Raised when no duplicate scan has been requested for the organization."""
+
+    def __init__(self) -> None:
+        super().__init__("Contact duplicate report")
+
+
+class ContactImportError(ValidationError):
+    """Raised when an uploaded contact file cannot be imported at all."""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from mini_crm.modules.contacts.dto.schemas import ContactDuplicateGroup, ContactDuplicatePair
+
 
 class ContactDomainService:
     """Domain service for contact business rules."""
@@ -16,3 +18,43 @@ class ContactDomainService:
             from mini_crm.modules.contacts.domain.exceptions import ContactHasActiveDealsError
 
             raise ContactHasActiveDealsError(contact_id)
+
+    @staticmethod
+    def group_duplicates(pairs: list[ContactDuplicatePair]) -> list[ContactDuplicateGroup]:
+        """Join matched pairs into groups of transitively duplicate contacts.
+
+        Each group is led by its oldest (lowest id) contact and scored by its
+        weakest pair; groups are returned oldest first.
+        """
+        parent: dict[int, int] = {}
+
+        def find(contact_id: int) -> int:
+            root = parent.setdefault(contact_id, contact_id)
+            while root != parent[root]:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            return root
+
+        for pair in pairs:
+            first, second = find(pair.contact_id), find(pair.duplicate_id)
+            if first != second:
+                parent[max(first, second)] = min(first, second)
+
+        members: dict[int, set[int]] = {}
+        matched_on: dict[int, set[str]] = {}
+        scores: dict[int, float] = {}
+        for pair in pairs:
+            root = find(pair.contact_id)
+            members.setdefault(root, set()).update((pair.contact_id, pair.duplicate_id))
+            matched_on.setdefault(root, set()).add(pair.matched_on)
+            scores[root] = min(scores.get(root, pair.score), pair.score)
+
+        return [
+            ContactDuplicateGroup(
+                primary_id=root,
+                duplicate_ids=sorted(members[root] - {root}),
+                matched_on=sorted(matched_on[root]),
+                score=round(scores[root], 4),
+            )
+            for root in sorted(members)
+        ]
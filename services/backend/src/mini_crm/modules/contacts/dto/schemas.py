@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from pydantic import EmailStr
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import EmailStr, Field, model_validator
 
 from mini_crm.shared.dto.base import DTO
-from mini_crm.shared.dto.pagination import PaginationMeta
+from mini_crm.shared.dto.bulk import BulkItemError
+from mini_crm.shared.dto.pagination import Cursor, CursorPaginationMeta
 
 
 class ContactBase(DTO):
@@ -16,11 +20,152 @@ class ContactCreate(ContactBase):
     pass
 
 
+# Value of the ``include`` query parameter that adds deal aggregates to contacts
+INCLUDE_DEAL_STATS = "deal_stats"
+
+# Value of the ``order_by`` query parameter that reads pages by keyset in id order
+ORDER_BY_ID = "id"
+
+
+class ContactDealAmounts(DTO):
+    """Totals of a contact's deals in one currency."""
+
+    currency: str
+    open_amount: Decimal = Decimal("0")
+    won_amount: Decimal = Decimal("0")
+
+
+class ContactDealStats(DTO):
+    """Aggregates over a contact's deals; amounts are totalled per currency."""
+
+    deal_count: int = 0
+    amounts: list[ContactDealAmounts] = []
+
+
 class ContactResponse(ContactBase):
     id: int
     owner_id: int
+    deal_stats: ContactDealStats | None = None
+
+
+class ContactSuggestion(DTO):
+    id: int
+    name: str
+    email: str | None = None
 
 
 class PaginatedContacts(DTO):
     items: list[ContactResponse]
-    meta: PaginationMeta
+    meta: CursorPaginationMeta
+
+
+class ContactCursor(Cursor):
+    """Position after the last contact of a page; cursor pages are read in id order."""
+
+    id: int
+
+    @classmethod
+    def from_contact(cls, contact: ContactResponse) -> ContactCursor:
+        return cls(id=contact.id)
+
+
+class ContactDeletion(DTO):
+    """Outcome of a guarded delete for a contact that exists in the organization."""
+
+    id: int
+    owner_id: int
+    deleted: bool
+
+
+MAX_BULK_CONTACTS = 1000
+
+
+class ContactBulkDelete(DTO):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_CONTACTS)
+
+    @model_validator(mode="after")
+    def check_unique(self) -> ContactBulkDelete:
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError("Contact ids must be unique")
+        return self
+
+
+class ContactBulkDeleteResult(DTO):
+    """Deleted contact ids in payload order, plus the ids that were rejected."""
+
+    deleted: list[int]
+    errors: list[BulkItemError]
+
+
+class ContactMerge(DTO):
+    primary_id: int
+    duplicate_ids: list[int] = Field(min_length=1, max_length=MAX_BULK_CONTACTS)
+
+    @model_validator(mode="after")
+    def check_ids(self) -> ContactMerge:
+        if len(set(self.duplicate_ids)) != len(self.duplicate_ids):
+            raise ValueError("Duplicate ids must be unique")
+        if self.primary_id in self.duplicate_ids:
+            raise ValueError("The primary contact cannot be merged into itself")
+        return self
+
+
+class ContactMergeResult(DTO):
+    """The surviving contact and how many deals were moved onto it."""
+
+    contact: ContactResponse
+    merged_ids: list[int]
+    deals_moved: int
+
+
+# Phones are compared by their trailing digits so country prefixes do not split a block
+PHONE_KEY_DIGITS = 10
+MIN_PHONE_DIGITS = 7
+
+DUPLICATE_REPORT_PENDING = "pending"
+DUPLICATE_REPORT_READY = "ready"
+MAX_DUPLICATE_GROUPS = 1000
+
+
+class ContactDuplicatePair(DTO):
+    """Two contacts sharing a blocking key, with the trigram similarity of their names."""
+
+    contact_id: int
+    duplicate_id: int
+    matched_on: str
+    score: float
+
+
+class ContactDuplicateGroup(DTO):
+    """Contacts judged to be the same person; ``primary_id`` is the oldest of them."""
+
+    primary_id: int
+    duplicate_ids: list[int]
+    matched_on: list[str]
+    score: float
+
+
+class ContactDuplicateReport(DTO):
+    """Result of the latest duplicate scan; ``groups`` holds at most the first groups."""
+
+    status: str
+    requested_at: datetime
+    generated_at: datetime | None = None
+    total_groups: int = 0
+    groups: list[ContactDuplicateGroup] = Field(default_factory=list)
+
+
+CONTACT_IMPORT_BATCH_SIZE = 5000
+MAX_CONTACT_IMPORT_ERRORS = 1000
+
+
+class ContactImportResult(DTO):
+    """Outcome of a contact import; ``errors`` lists at most the first rejected rows.
+
+    Row indexes count data rows from zero, excluding the header.
+    """
+
+    processed: int
+    imported: int
+    failed: int
+    errors: list[BulkItemError]
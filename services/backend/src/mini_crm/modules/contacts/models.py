@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from mini_crm.core.db import Base
@@ -10,6 +10,26 @@ from mini_crm.core.db import Base
 
 class Contact(Base):
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Keyset pages in id order, optionally per owner
+        Index("ix_contacts_org_id", "organization_id", "id"),
+        Index("ix_contacts_org_owner_id", "organization_id", "owner_id", "id"),
+        # Case-insensitive email lookups used by import de-duplication
+        Index("ix_contacts_org_email_lower", "organization_id", text("lower(email)")),
+        # Trigram indexes serving substring search and similarity ranking (pg_trgm)
+        Index(
+            "ix_contacts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contacts_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     organization_id: Mapped[int] = mapped_column(
@@ -19,6 +39,6 @@ class Contact(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     owner = relationship("User")
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import builtins
+import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from difflib import SequenceMatcher
 
-from mini_crm.modules.contacts.dto.schemas import ContactCreate, ContactResponse
+from mini_crm.modules.contacts.dto.schemas import (
+    MIN_PHONE_DIGITS,
+    PHONE_KEY_DIGITS,
+    ContactCreate,
+    ContactCursor,
+    ContactDealStats,
+    ContactDeletion,
+    ContactDuplicatePair,
+    ContactResponse,
+    ContactSuggestion,
+)
 
 
 class AbstractContactRepository(ABC):
@@ -15,7 +29,60 @@ class AbstractContactRepository(ABC):
         page_size: int,
         search: str | None = None,
         owner_id: int | None = None,
+        with_deal_stats: bool = False,
     ) -> tuple[list[ContactResponse], int]:
+        """Return one page and the total; ``with_deal_stats`` adds each contact's deal
+        aggregates, read in the same query.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        """Return one page and whether more contacts follow, without counting."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: ContactCursor | None,
+        limit: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        """Return up to ``limit`` contacts by id following ``cursor`` and whether more remain."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> AsyncIterator[ContactResponse]:
+        """Yield every matching contact by id without holding the result set in memory."""
         raise NotImplementedError
 
     @abstractmethod
@@ -25,11 +92,76 @@ class AbstractContactRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_id(self, organization_id: int, contact_id: int) -> ContactResponse | None:
+    async def list_suggestions(self, organization_id: int) -> builtins.list[ContactSuggestion]:
+        """Return id, name and email of every contact, for building the suggest index."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def suggest(
+        self, organization_id: int, prefix: str, limit: int
+    ) -> builtins.list[ContactSuggestion]:
+        """Return contacts whose name, a name word or email starts with ``prefix``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def import_batch(
+        self,
+        organization_id: int,
+        owner_id: int,
+        rows: builtins.list[tuple[int, ContactCreate]],
+    ) -> builtins.list[int]:
+        """Insert validated rows, skipping emails already used in the organization.
+
+        Rows are ``(index, payload)`` pairs; returns the indexes skipped as duplicates.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_id(
+        self, organization_id: int, contact_id: int, *, with_deal_stats: bool = False
+    ) -> ContactResponse | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_duplicate_pairs(
+        self, organization_id: int, *, min_name_similarity: float, max_block_size: int
+    ) -> builtins.list[ContactDuplicatePair]:
+        """Pairs of contacts sharing a normalized email or phone with similar names.
+
+        Blocks of more than ``max_block_size`` contacts sharing one key (a switchboard
+        number, a contact imported many times) are not compared pairwise; each member
+        is compared with the block's oldest contact only.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many_for_update(
+        self, organization_id: int, contact_ids: builtins.list[int]
+    ) -> builtins.list[ContactResponse]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def merge(
+        self, organization_id: int, primary_id: int, duplicate_ids: builtins.list[int]
+    ) -> tuple[ContactResponse, int]:
+        """Move the duplicates' deals to the primary contact, fill its missing email and
+        phone from them, and delete them. Returns the primary and the deals moved.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def delete(self, organization_id: int, contact_id: int) -> None:
+    async def delete_many(
+        self,
+        organization_id: int,
+        contact_ids: builtins.list[int],
+        *,
+        owner_id: int | None = None,
+    ) -> builtins.list[ContactDeletion]:
+        """Delete the contacts that have no deals (and belong to ``owner_id`` if given).
+
+        Returns an outcome for each requested contact that exists in the organization;
+        ids missing from the result were not found.
+        """
         raise NotImplementedError
 
 
@@ -46,6 +178,7 @@ class InMemoryContactRepository(AbstractContactRepository):
         page_size: int,
         search: str | None = None,
         owner_id: int | None = None,
+        with_deal_stats: bool = False,
     ) -> tuple[list[ContactResponse], int]:  # noqa: ARG002
         filtered = self._contacts
         if owner_id is not None:
@@ -61,8 +194,83 @@ class InMemoryContactRepository(AbstractContactRepository):
         total = len(filtered)
         offset = max(page - 1, 0) * page_size
         items = filtered[offset : offset + page_size]
+        if with_deal_stats:
+            # Deals are not tracked here, so every contact has empty aggregates
+            items = [c.model_copy(update={"deal_stats": ContactDealStats()}) for c in items]
         return (items, total)
 
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        items, total = await self.list(
+            organization_id,
+            page=page,
+            page_size=page_size,
+            search=search,
+            owner_id=owner_id,
+            with_deal_stats=with_deal_stats,
+        )
+        return items, page * page_size < total
+
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: ContactCursor | None,
+        limit: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        values, _total = await self.list(
+            organization_id,
+            page=1,
+            page_size=len(self._contacts),
+            search=search,
+            owner_id=owner_id,
+            with_deal_stats=with_deal_stats,
+        )
+        values.sort(key=lambda contact: contact.id)
+        if cursor is not None:
+            values = [contact for contact in values if contact.id > cursor.id]
+        return values[:limit], len(values) > limit
+
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        _items, total = await self.list(
+            organization_id, page=1, page_size=0, search=search, owner_id=owner_id
+        )
+        return total
+
+    async def stream(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> AsyncIterator[ContactResponse]:
+        items, _total = await self.list(
+            organization_id,
+            page=1,
+            page_size=len(self._contacts),
+            search=search,
+            owner_id=owner_id,
+        )
+        for item in items:
+            yield item
+
     async def create(
         self, organization_id: int, owner_id: int, payload: ContactCreate
     ) -> ContactResponse:  # noqa: ARG002
@@ -71,11 +279,148 @@ class InMemoryContactRepository(AbstractContactRepository):
         self._contacts.append(contact)
         return contact
 
-    async def get_by_id(self, organization_id: int, contact_id: int) -> ContactResponse | None:  # noqa: ARG002
+    async def import_batch(
+        self,
+        organization_id: int,
+        owner_id: int,
+        rows: builtins.list[tuple[int, ContactCreate]],
+    ) -> builtins.list[int]:
+        seen = {c.email.lower() for c in self._contacts if c.email}
+        duplicates: builtins.list[int] = []
+        for index, payload in rows:
+            if payload.email:
+                if payload.email.lower() in seen:
+                    duplicates.append(index)
+                    continue
+                seen.add(payload.email.lower())
+            await self.create(organization_id, owner_id, payload)
+        return duplicates
+
+    async def list_suggestions(self, organization_id: int) -> builtins.list[ContactSuggestion]:  # noqa: ARG002
+        return [ContactSuggestion(id=c.id, name=c.name, email=c.email) for c in self._contacts]
+
+    async def suggest(
+        self,
+        organization_id: int,  # noqa: ARG002
+        prefix: str,
+        limit: int,
+    ) -> builtins.list[ContactSuggestion]:
+        needle = prefix.strip().lower()
+        matches = [
+            c
+            for c in self._contacts
+            if any(word.startswith(needle) for word in c.name.lower().split())
+            or c.name.lower().startswith(needle)
+            or (c.email and c.email.lower().startswith(needle))
+        ]
+        matches.sort(key=lambda c: (c.name.lower(), c.id))
+        return [ContactSuggestion(id=c.id, name=c.name, email=c.email) for c in matches[:limit]]
+
+    async def get_by_id(
+        self,
+        organization_id: int,  # noqa: ARG002
+        contact_id: int,
+        *,
+        with_deal_stats: bool = False,
+    ) -> ContactResponse | None:
         for contact in self._contacts:
             if contact.id == contact_id:
+                if with_deal_stats:
+                    return contact.model_copy(update={"deal_stats": ContactDealStats()})
                 return contact
         return None
 
-    async def delete(self, organization_id: int, contact_id: int) -> None:  # noqa: ARG002
-        self._contacts = [c for c in self._contacts if c.id != contact_id]
+    async def delete_many(
+        self,
+        organization_id: int,  # noqa: ARG002
+        contact_ids: builtins.list[int],
+        *,
+        owner_id: int | None = None,
+    ) -> builtins.list[ContactDeletion]:
+        # Deals are not tracked here, so only ownership can block a deletion
+        requested = set(contact_ids)
+        outcomes = [
+            ContactDeletion(
+                id=contact.id,
+                owner_id=contact.owner_id,
+                deleted=owner_id is None or contact.owner_id == owner_id,
+            )
+            for contact in self._contacts
+            if contact.id in requested
+        ]
+        deleted = {outcome.id for outcome in outcomes if outcome.deleted}
+        self._contacts = [contact for contact in self._contacts if contact.id not in deleted]
+        return outcomes
+
+    async def find_duplicate_pairs(
+        self,
+        organization_id: int,  # noqa: ARG002
+        *,
+        min_name_similarity: float,
+        max_block_size: int,
+    ) -> builtins.list[ContactDuplicatePair]:
+        blocks: dict[tuple[str, str], builtins.list[ContactResponse]] = {}
+        for contact in self._contacts:
+            for kind, key in _blocking_keys(contact):
+                blocks.setdefault((kind, key), []).append(contact)
+
+        pairs: builtins.list[ContactDuplicatePair] = []
+        for (kind, _key), members in blocks.items():
+            members.sort(key=lambda contact: contact.id)
+            representatives = members[:1] if len(members) > max_block_size else members
+            for position, first in enumerate(representatives):
+                for second in members[position + 1 :]:
+                    score = SequenceMatcher(None, first.name.lower(), second.name.lower()).ratio()
+                    if score >= min_name_similarity:
+                        low, high = sorted((first.id, second.id))
+                        pairs.append(
+                            ContactDuplicatePair(
+                                contact_id=low, duplicate_id=high, matched_on=kind, score=score
+                            )
+                        )
+        return pairs
+
+    async def get_many_for_update(
+        self,
+        organization_id: int,  # noqa: ARG002
+        contact_ids: builtins.list[int],
+    ) -> builtins.list[ContactResponse]:
+        requested = set(contact_ids)
+        return sorted(
+            (contact for contact in self._contacts if contact.id in requested),
+            key=lambda contact: contact.id,
+        )
+
+    async def merge(
+        self, organization_id: int, primary_id: int, duplicate_ids: builtins.list[int]
+    ) -> tuple[ContactResponse, int]:
+        contacts = await self.get_many_for_update(organization_id, [primary_id, *duplicate_ids])
+        primary = next(contact for contact in contacts if contact.id == primary_id)
+        duplicates = [contact for contact in contacts if contact.id != primary_id]
+        merged = primary.model_copy(
+            update={
+                "email": primary.email or next((c.email for c in duplicates if c.email), None),
+                "phone": primary.phone or next((c.phone for c in duplicates if c.phone), None),
+            }
+        )
+        removed = set(duplicate_ids)
+        self._contacts = [
+            merged if contact.id == primary_id else contact
+            for contact in self._contacts
+            if contact.id not in removed
+        ]
+        # Deals are not tracked here, so there is nothing to move
+        return merged, 0
+
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def _blocking_keys(contact: ContactResponse) -> builtins.list[tuple[str, str]]:
+    keys: builtins.list[tuple[str, str]] = []
+    if contact.email:
+        keys.append(("email", contact.email.lower()))
+    digits = _NON_DIGITS.sub("", contact.phone or "")
+    if len(digits) >= MIN_PHONE_DIGITS:
+        keys.append(("phone", digits[-PHONE_KEY_DIGITS:]))
+    return keys
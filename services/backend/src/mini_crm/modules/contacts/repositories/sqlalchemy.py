@@ -1,14 +1,72 @@
 from __future__ import annotations
 
+import builtins
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from typing import Any, TypeVar
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    String,
+    UnaryExpression,
+    and_,
+    case,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from mini_crm.modules.contacts.domain.exceptions import ContactNotFoundError
-from mini_crm.modules.contacts.dto.schemas import ContactCreate, ContactResponse
+from mini_crm.core.db import STREAM_BATCH_SIZE
+from mini_crm.modules.contacts.dto.schemas import (
+    MIN_PHONE_DIGITS,
+    PHONE_KEY_DIGITS,
+    ContactCreate,
+    ContactCursor,
+    ContactDealAmounts,
+    ContactDealStats,
+    ContactDeletion,
+    ContactDuplicatePair,
+    ContactResponse,
+    ContactSuggestion,
+)
 from mini_crm.modules.contacts.models import Contact
 from mini_crm.modules.contacts.repositories.repository import AbstractContactRepository
+from mini_crm.modules.deals.models import Deal
+from mini_crm.shared.enums import DealStatus
+
+_T = TypeVar("_T", bound=tuple[Any, ...])
+
+OPEN_STATUSES = (DealStatus.NEW, DealStatus.IN_PROGRESS)
+
+# Session-local staging table for imports, dropped when the transaction ends
+_IMPORT_STAGING_DDL = text(
+    "CREATE TEMPORARY TABLE IF NOT EXISTS contact_import_staging "
+    "(position integer NOT NULL, name text NOT NULL, email text, phone text) "
+    "ON COMMIT DROP"
+)
+_import_staging = table(
+    "contact_import_staging",
+    column("position", Integer),
+    column("name", String),
+    column("email", String),
+    column("phone", String),
+)
 
 
 class SQLAlchemyContactRepository(AbstractContactRepository):
@@ -23,37 +81,99 @@ class SQLAlchemyContactRepository(AbstractContactRepository):
         page_size: int,
         search: str | None = None,
         owner_id: int | None = None,
+        with_deal_stats: bool = False,
     ) -> tuple[list[ContactResponse], int]:
         offset = max(page - 1, 0) * page_size
-        stmt = select(Contact).where(Contact.organization_id == organization_id)
+        # The window count is evaluated before OFFSET/LIMIT, so page and total share one query
+        stmt = _apply_filters(
+            select(Contact, func.count().over().label("total")), organization_id, search, owner_id
+        )
+        stmt = stmt.order_by(*_ordering(search)).offset(offset).limit(page_size)
+        if with_deal_stats:
+            stmt = _with_deal_stats(stmt, _ordering(search))
+        rows = (await self.session.execute(stmt)).all()
 
-        if owner_id is not None:
-            stmt = stmt.where(Contact.owner_id == owner_id)
+        if rows:
+            total = rows[0].total
+        elif offset == 0:
+            total = 0
+        else:
+            # A page past the end carries no window value; count separately only then
+            total = await self.count(organization_id, search=search, owner_id=owner_id)
 
-        if search:
-            pattern = f"%{search}%"
-            stmt = stmt.where(or_(Contact.name.ilike(pattern), Contact.email.ilike(pattern)))
+        items = [_contact_from_row(row, with_deal_stats) for row in rows]
+        return items, int(total)
 
-        stmt = stmt.order_by(Contact.id).offset(offset).limit(page_size)
-        result = await self.session.scalars(stmt)
-        contacts = result.all()
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        offset = max(page - 1, 0) * page_size
+        stmt = _apply_filters(select(Contact), organization_id, search, owner_id)
+        # Fetch one extra row to learn whether another page follows
+        stmt = stmt.order_by(*_ordering(search)).offset(offset).limit(page_size + 1)
+        if with_deal_stats:
+            stmt = _with_deal_stats(stmt, _ordering(search))
+        rows = (await self.session.execute(stmt)).all()
+
+        items = [_contact_from_row(row, with_deal_stats) for row in rows[:page_size]]
+        return items, len(rows) > page_size
+
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: ContactCursor | None,
+        limit: int,
+        search: str | None = None,
+        owner_id: int | None = None,
+        with_deal_stats: bool = False,
+    ) -> tuple[builtins.list[ContactResponse], bool]:
+        stmt = _apply_filters(select(Contact), organization_id, search, owner_id)
+        if cursor is not None:
+            # Range scan on (organization_id, id), or (organization_id, owner_id, id)
+            stmt = stmt.where(Contact.id > cursor.id)
+        # Fetch one extra row to learn whether another page follows
+        stmt = stmt.order_by(Contact.id).limit(limit + 1)
+        if with_deal_stats:
+            stmt = _with_deal_stats(stmt, [Contact.id.asc()])
+        rows = (await self.session.execute(stmt)).all()
+
+        items = [_contact_from_row(row, with_deal_stats) for row in rows[:limit]]
+        return items, len(rows) > limit
 
-        count_stmt = (
-            select(func.count())
-            .select_from(Contact)
-            .where(Contact.organization_id == organization_id)
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        stmt = _apply_filters(
+            select(func.count()).select_from(Contact), organization_id, search, owner_id
         )
-        if owner_id is not None:
-            count_stmt = count_stmt.where(Contact.owner_id == owner_id)
-        if search:
-            pattern = f"%{search}%"
-            count_stmt = count_stmt.where(
-                or_(Contact.name.ilike(pattern), Contact.email.ilike(pattern))
-            )
-        total = await self.session.scalar(count_stmt)
+        total = await self.session.scalar(stmt)
+        return int(total or 0)
 
-        items = [ContactResponse.model_validate(contact) for contact in contacts]
-        return items, int(total or 0)
+    async def stream(
+        self,
+        organization_id: int,
+        *,
+        search: str | None = None,
+        owner_id: int | None = None,
+    ) -> AsyncIterator[ContactResponse]:
+        stmt = _apply_filters(select(Contact), organization_id, search, owner_id)
+        # A server-side cursor fetches rows in batches, so memory stays flat for any tenant size
+        stmt = stmt.order_by(Contact.id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        result = await self.session.stream_scalars(stmt)
+        async for contact in result:
+            yield ContactResponse.model_validate(contact)
 
     async def create(
         self, organization_id: int, owner_id: int, payload: ContactCreate
@@ -66,28 +186,352 @@ class SQLAlchemyContactRepository(AbstractContactRepository):
         )
         self.session.add(contact)
         await self.session.flush()
-        await self.session.refresh(contact)
         return ContactResponse.model_validate(contact)
 
-    async def get_by_id(self, organization_id: int, contact_id: int) -> ContactResponse | None:
+    async def list_suggestions(self, organization_id: int) -> builtins.list[ContactSuggestion]:
+        stmt = select(Contact.id, Contact.name, Contact.email).where(
+            Contact.organization_id == organization_id
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [ContactSuggestion(id=row.id, name=row.name, email=row.email) for row in rows]
+
+    async def suggest(
+        self, organization_id: int, prefix: str, limit: int
+    ) -> builtins.list[ContactSuggestion]:
+        needle = prefix.strip()
+        stmt = (
+            select(Contact.id, Contact.name, Contact.email)
+            .where(
+                Contact.organization_id == organization_id,
+                or_(
+                    Contact.name.istartswith(needle, autoescape=True),
+                    Contact.name.icontains(f" {needle}", autoescape=True),
+                    Contact.email.istartswith(needle, autoescape=True),
+                ),
+            )
+            .order_by(func.lower(Contact.name), Contact.id)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [ContactSuggestion(id=row.id, name=row.name, email=row.email) for row in rows]
+
+    async def import_batch(
+        self,
+        organization_id: int,
+        owner_id: int,
+        rows: builtins.list[tuple[int, ContactCreate]],
+    ) -> builtins.list[int]:
+        connection = await self.session.connection()
+        await connection.execute(_IMPORT_STAGING_DDL)
+        await connection.execute(text("TRUNCATE contact_import_staging"))
+
+        # COPY streams the batch in one round-trip, far cheaper than per-row INSERTs
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+        assert asyncpg_connection is not None
+        await asyncpg_connection.copy_records_to_table(
+            "contact_import_staging",
+            records=[
+                (index, payload.name, payload.email, payload.phone) for index, payload in rows
+            ],
+            columns=["position", "name", "email", "phone"],
+        )
+
+        # An email is a duplicate if it already exists in the organization (including
+        # earlier batches of this import) or appears earlier in this batch
+        staging = _import_staging.c
+        lowered_email = func.lower(staging.email)
+        already_exists = (
+            select(Contact.id)
+            .where(
+                Contact.organization_id == organization_id,
+                func.lower(Contact.email) == lowered_email,
+            )
+            .exists()
+        )
+        repeated = func.row_number().over(partition_by=lowered_email, order_by=staging.position) > 1
+        candidates = select(
+            _import_staging,
+            and_(staging.email.is_not(None), or_(repeated, already_exists)).label("duplicate"),
+        ).cte("candidates")
+        inserted = (
+            insert(Contact)
+            .from_select(
+                ["organization_id", "owner_id", "name", "email", "phone"],
+                select(
+                    literal(organization_id),
+                    literal(owner_id),
+                    candidates.c.name,
+                    candidates.c.email,
+                    candidates.c.phone,
+                )
+                .where(~candidates.c.duplicate)
+                .order_by(candidates.c.position),
+            )
+            .cte("inserted")
+        )
+        stmt = (
+            select(candidates.c.position)
+            .where(candidates.c.duplicate)
+            .order_by(candidates.c.position)
+            .add_cte(inserted)
+        )
+        result = await self.session.scalars(stmt)
+        return builtins.list(result.all())
+
+    async def get_by_id(
+        self, organization_id: int, contact_id: int, *, with_deal_stats: bool = False
+    ) -> ContactResponse | None:
         stmt = select(Contact).where(
             Contact.id == contact_id,
             Contact.organization_id == organization_id,
         )
-        contact = await self.session.scalar(stmt)
-        if contact is None:
+        if with_deal_stats:
+            stmt = _with_deal_stats(stmt, [Contact.id.asc()])
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
             return None
-        return ContactResponse.model_validate(contact)
+        return _contact_from_row(row, with_deal_stats)
 
-    async def delete(self, organization_id: int, contact_id: int) -> None:
-        # Check if contact exists and belongs to organization
-        contact_stmt = select(Contact).where(
-            Contact.id == contact_id,
-            Contact.organization_id == organization_id,
+    async def find_duplicate_pairs(
+        self, organization_id: int, *, min_name_similarity: float, max_block_size: int
+    ) -> builtins.list[ContactDuplicatePair]:
+        # Contacts are grouped into blocks sharing a normalized email or phone in one
+        # ordered pass per kind; only names inside a block are compared, by pg_trgm.
+        # Members of a block larger than max_block_size are only compared with its
+        # oldest contact, so the comparisons stay linear in the block size
+        digits = func.regexp_replace(Contact.phone, "[^0-9]+", "", "g")
+
+        def block(kind: str, key: Any, value: Any) -> Select[Any]:
+            return (
+                select(
+                    literal(kind).label("kind"),
+                    key.label("key"),
+                    func.array_agg(aggregate_order_by(Contact.id, Contact.id)).label("ids"),
+                    func.array_agg(aggregate_order_by(Contact.name, Contact.id)).label("names"),
+                )
+                .where(Contact.organization_id == organization_id, value.is_not(None))
+                .group_by(key)
+                .having(func.count() >= 2)
+            )
+
+        blocks = (
+            union_all(
+                # Served by ix_contacts_org_email_lower
+                block("email", func.lower(Contact.email), Contact.email),
+                block("phone", func.right(digits, PHONE_KEY_DIGITS), Contact.phone),
+            )
+            .cte("blocks")
+            # Keeps the short phone filter below out of the scans, so the normalized
+            # phone is computed once per contact
+            .prefix_with("MATERIALIZED")
+        )
+        size = func.cardinality(blocks.c.ids)
+        first = (
+            func.generate_series(1, case((size > max_block_size, 1), else_=size))
+            .table_valued("position")
+            .render_derived()
+            .lateral("first")
         )
-        contact = await self.session.scalar(contact_stmt)
-        if contact is None:
-            raise ContactNotFoundError(contact_id)
+        second = (
+            func.generate_series(first.c.position + 1, size)
+            .table_valued("position")
+            .render_derived()
+            .lateral("second")
+        )
+        score = func.similarity(blocks.c.names[first.c.position], blocks.c.names[second.c.position])
+        stmt = (
+            select(
+                blocks.c.ids[first.c.position].label("contact_id"),
+                blocks.c.ids[second.c.position].label("duplicate_id"),
+                blocks.c.kind.label("matched_on"),
+                score.label("score"),
+            )
+            .select_from(blocks)
+            .join(first, true())
+            .join(second, true())
+            .where(
+                or_(blocks.c.kind != "phone", func.length(blocks.c.key) >= MIN_PHONE_DIGITS),
+                score >= min_name_similarity,
+            )
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            ContactDuplicatePair(
+                contact_id=min(row.contact_id, row.duplicate_id),
+                duplicate_id=max(row.contact_id, row.duplicate_id),
+                matched_on=row.matched_on,
+                score=row.score,
+            )
+            for row in rows
+        ]
 
-        await self.session.delete(contact)
-        await self.session.flush()
+    async def get_many_for_update(
+        self, organization_id: int, contact_ids: builtins.list[int]
+    ) -> builtins.list[ContactResponse]:
+        # Lock in id order so concurrent merges cannot deadlock each other
+        stmt = (
+            select(Contact)
+            .where(Contact.organization_id == organization_id, Contact.id.in_(contact_ids))
+            .order_by(Contact.id)
+            .with_for_update()
+        )
+        result = await self.session.scalars(stmt)
+        return [ContactResponse.model_validate(contact) for contact in result.all()]
+
+    async def merge(
+        self, organization_id: int, primary_id: int, duplicate_ids: builtins.list[int]
+    ) -> tuple[ContactResponse, int]:
+        # Deals move in one set-based UPDATE regardless of how many there are
+        moved = await self.session.scalars(
+            update(Deal)
+            .where(Deal.organization_id == organization_id, Deal.contact_id.in_(duplicate_ids))
+            .values(contact_id=primary_id, updated_at=datetime.now(tz=UTC))
+            .returning(Deal.id)
+        )
+        deals_moved = len(moved.all())
+
+        source = aliased(Contact, name="source")
+
+        def first_known(field: str) -> Any:
+            column = getattr(source, field)
+            return (
+                select(column)
+                .where(
+                    source.organization_id == organization_id,
+                    source.id.in_(duplicate_ids),
+                    column.is_not(None),
+                )
+                .order_by(source.id)
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        stmt = (
+            update(Contact)
+            .where(Contact.organization_id == organization_id, Contact.id == primary_id)
+            .values(
+                email=func.coalesce(Contact.email, first_known("email")),
+                phone=func.coalesce(Contact.phone, first_known("phone")),
+            )
+            .returning(Contact)
+        )
+        primary = (await self.session.scalars(stmt)).one()
+        await self.session.execute(
+            delete(Contact).where(
+                Contact.organization_id == organization_id, Contact.id.in_(duplicate_ids)
+            )
+        )
+        return ContactResponse.model_validate(primary), deals_moved
+
+    async def delete_many(
+        self,
+        organization_id: int,
+        contact_ids: builtins.list[int],
+        *,
+        owner_id: int | None = None,
+    ) -> builtins.list[ContactDeletion]:
+        if not contact_ids:
+            return []
+        requested = (Contact.organization_id == organization_id, Contact.id.in_(contact_ids))
+        # Any referencing deal blocks deletion, since the foreign key would cascade to it
+        guarded = delete(Contact).where(*requested, ~exists().where(Deal.contact_id == Contact.id))
+        if owner_id is not None:
+            guarded = guarded.where(Contact.owner_id == owner_id)
+        deleted = guarded.returning(Contact.id).cte("deleted")
+        # The outer SELECT reads the snapshot from before the DELETE, so contacts that
+        # were kept are still reported and the caller can tell why
+        stmt = (
+            select(Contact.id, Contact.owner_id, deleted.c.id.is_not(None).label("deleted"))
+            .outerjoin(deleted, deleted.c.id == Contact.id)
+            .where(*requested)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            ContactDeletion(id=row.id, owner_id=row.owner_id, deleted=row.deleted) for row in rows
+        ]
+
+
+def _apply_filters(
+    stmt: Select[_T], organization_id: int, search: str | None, owner_id: int | None
+) -> Select[_T]:
+    stmt = stmt.where(Contact.organization_id == organization_id)
+    if owner_id is not None:
+        stmt = stmt.where(Contact.owner_id == owner_id)
+    if search:
+        # Served by the pg_trgm GIN indexes on name and email via a BitmapOr
+        pattern = f"%{search}%"
+        stmt = stmt.where(or_(Contact.name.ilike(pattern), Contact.email.ilike(pattern)))
+    return stmt
+
+
+def _with_deal_stats(page: Select[Any], ordering: list[UnaryExpression[Any]]) -> Select[Any]:
+    """Wrap a limited page of contacts and join each contact's deal aggregates.
+
+    The aggregates come from a lateral subquery on the deals ``contact_id`` index, so
+    the page and its stats are one statement and deals are only read for the contacts
+    returned, not for every contact the filters matched. Amounts are totalled per
+    currency and returned as arrays ordered by currency. ``ordering`` must be the
+    page's own ordering; it is carried out of the subquery as a row number.
+    """
+    ranked = page.add_columns(func.row_number().over(order_by=ordering).label("position"))
+    subquery = ranked.subquery("page")
+    contact = aliased(Contact, subquery, name="Contact")
+    by_currency = (
+        select(
+            Deal.currency.label("currency"),
+            func.count().label("deal_count"),
+            func.coalesce(func.sum(case((Deal.status.in_(OPEN_STATUSES), Deal.amount))), 0).label(
+                "open_amount"
+            ),
+            func.coalesce(func.sum(case((Deal.status == DealStatus.WON, Deal.amount))), 0).label(
+                "won_amount"
+            ),
+        )
+        .where(Deal.contact_id == contact.id, Deal.organization_id == contact.organization_id)
+        .group_by(Deal.currency)
+        .correlate(subquery)
+        .lateral("deal_currencies")
+    )
+
+    def by_currency_array(value: ColumnElement[Any]) -> Any:
+        return func.array_agg(aggregate_order_by(value, by_currency.c.currency))
+
+    stats = (
+        select(
+            func.coalesce(func.sum(by_currency.c.deal_count), 0).label("deal_count"),
+            by_currency_array(by_currency.c.currency).label("currencies"),
+            by_currency_array(by_currency.c.open_amount).label("open_amounts"),
+            by_currency_array(by_currency.c.won_amount).label("won_amounts"),
+        )
+        .select_from(by_currency)
+        .lateral("deal_stats")
+    )
+    extra = [c for c in subquery.c if c.key not in Contact.__table__.c and c.key != "position"]
+    return select(contact, *extra, *stats.c).join(stats, true()).order_by(subquery.c.position)
+
+
+def _contact_from_row(row: Row[Any], with_deal_stats: bool) -> ContactResponse:
+    contact = ContactResponse.model_validate(row.Contact)
+    if with_deal_stats:
+        contact.deal_stats = ContactDealStats(
+            deal_count=row.deal_count,
+            amounts=[
+                ContactDealAmounts(currency=currency, open_amount=open_amount, won_amount=won)
+                for currency, open_amount, won in zip(
+                    row.currencies or [], row.open_amounts or [], row.won_amounts or [], strict=True
+                )
+            ],
+        )
+    return contact
+
+
+def _ordering(search: str | None) -> list[UnaryExpression[Any]]:
+    """Order search results by pg_trgm similarity to the term, then by ``id``."""
+    if not search:
+        return [Contact.id.asc()]
+    rank = func.greatest(
+        func.similarity(Contact.name, search),
+        func.similarity(func.coalesce(Contact.email, ""), search),
+    )
+    return [rank.desc(), Contact.id.asc()]
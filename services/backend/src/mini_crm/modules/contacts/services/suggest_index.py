@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import bisect
+import re
+import time
+from collections import OrderedDict
+
+from mini_crm.config.settings import get_settings
+from mini_crm.modules.contacts.dto.schemas import ContactSuggestion
+
+_TOKEN_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def suggestion_keys(contact: ContactSuggestion) -> set[str]:
+    """Lowercased prefixes a contact can be found by: its name, each name word, its email."""
+    name = contact.name.strip().lower()
+    keys = {name, *(word for word in _TOKEN_SEPARATORS.split(name) if word)}
+    if contact.email:
+        keys.add(contact.email.lower())
+    keys.discard("")
+    return keys
+
+
+class OrganizationSuggestIndex:
+    """Sorted ``(key, contact_id)`` pairs of one organization, searched by bisection."""
+
+    def __init__(self, version: int, oversized: bool = False) -> None:
+        self.version = version
+        # Marks organizations too large to hold in memory; they are searched in the database
+        self.oversized = oversized
+        self.built_at = self.last_used = time.monotonic()
+        self._entries: list[tuple[str, int]] = []
+        self._contacts: dict[int, ContactSuggestion] = {}
+
+    @classmethod
+    def build(cls, contacts: list[ContactSuggestion], version: int) -> OrganizationSuggestIndex:
+        index = cls(version)
+        index._contacts = {contact.id: contact for contact in contacts}
+        index._entries = sorted(
+            (key, contact.id) for contact in contacts for key in suggestion_keys(contact)
+        )
+        return index
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def contact_count(self) -> int:
+        return len(self._contacts)
+
+    def add(self, contact: ContactSuggestion) -> None:
+        self.remove(contact.id)
+        self._contacts[contact.id] = contact
+        for key in suggestion_keys(contact):
+            bisect.insort(self._entries, (key, contact.id))
+
+    def remove(self, contact_id: int) -> None:
+        contact = self._contacts.pop(contact_id, None)
+        if contact is None:
+            return
+        for key in suggestion_keys(contact):
+            position = bisect.bisect_left(self._entries, (key, contact_id))
+            if position < len(self._entries) and self._entries[position] == (key, contact_id):
+                del self._entries[position]
+
+    def search(self, prefix: str, limit: int) -> list[ContactSuggestion]:
+        """Return up to ``limit`` contacts with a key starting with ``prefix``.
+
+        Keys are visited in sorted order, so exact and shorter matches come first.
+        """
+        prefix = prefix.strip().lower()
+        found: dict[int, ContactSuggestion] = {}
+        position = bisect.bisect_left(self._entries, (prefix, -1))
+        while position < len(self._entries) and len(found) < limit:
+            key, contact_id = self._entries[position]
+            if not key.startswith(prefix):
+                break
+            found.setdefault(contact_id, self._contacts[contact_id])
+            position += 1
+        return list(found.values())
+
+
+class ContactSuggestIndex:
+    """Process-wide, lazily built prefix indexes for contact typeahead.
+
+    Each organization's index is tagged with the change version it was built at, so a
+    caller can tell when another process has modified the organization's contacts.
+    Versions are bumped after the writing transaction commits; as a safety net for a
+    bump that failed, indexes are also rebuilt after ``max_age_seconds``. The total
+    number of keys is capped; least recently used organizations are evicted first, and
+    organizations idle for longer than ``idle_seconds`` are dropped.
+    """
+
+    _instance: ContactSuggestIndex | None = None
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_contacts_per_organization: int | None = None,
+        idle_seconds: float | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        if ContactSuggestIndex._instance is not None:
+            raise RuntimeError("ContactSuggestIndex is a singleton. Use get_instance() instead.")
+        settings = get_settings()
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.contact_suggest_max_entries
+        )
+        self.max_contacts_per_organization = (
+            max_contacts_per_organization
+            if max_contacts_per_organization is not None
+            else settings.contact_suggest_max_contacts_per_organization
+        )
+        self.idle_seconds = (
+            idle_seconds if idle_seconds is not None else settings.contact_suggest_idle_seconds
+        )
+        self.max_age_seconds = (
+            max_age_seconds
+            if max_age_seconds is not None
+            else settings.contact_suggest_max_age_seconds
+        )
+        self._indexes: OrderedDict[int, OrganizationSuggestIndex] = OrderedDict()
+        self._size = 0
+
+    @classmethod
+    def get_instance(cls) -> ContactSuggestIndex:
+        """Get singleton instance of ContactSuggestIndex."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def size(self) -> int:
+        """Number of keys held across all organizations."""
+        return self._size
+
+    def get(self, organization_id: int, version: int) -> OrganizationSuggestIndex | None:
+        """Return the organization's index if it is loaded and built at ``version``."""
+        self._evict_idle()
+        index = self._indexes.get(organization_id)
+        if index is None:
+            return None
+        now = time.monotonic()
+        if index.version != version or now - index.built_at > self.max_age_seconds:
+            self.discard(organization_id)
+            return None
+        index.last_used = now
+        self._indexes.move_to_end(organization_id)
+        return index
+
+    def put(
+        self, organization_id: int, contacts: list[ContactSuggestion], version: int
+    ) -> OrganizationSuggestIndex:
+        """Build and keep the organization's index at ``version``."""
+        return self._store(organization_id, OrganizationSuggestIndex.build(contacts, version))
+
+    def put_oversized(self, organization_id: int, version: int) -> OrganizationSuggestIndex:
+        """Remember that the organization has more contacts than may be held in memory."""
+        return self._store(organization_id, OrganizationSuggestIndex(version, oversized=True))
+
+    def apply(
+        self,
+        organization_id: int,
+        version: int,
+        added: ContactSuggestion | None = None,
+        removed_id: int | None = None,
+    ) -> None:
+        """Apply one change recorded as ``version`` to a loaded index.
+
+        The change is applied in place only if the index is at the preceding version;
+        otherwise another process changed the organization too and the index is dropped.
+        """
+        index = self._indexes.get(organization_id)
+        if index is None:
+            return
+        if index.version != version - 1:
+            self.discard(organization_id)
+            return
+        index.version = version
+        if index.oversized:
+            return
+        self._size -= index.size
+        if removed_id is not None:
+            index.remove(removed_id)
+        if added is not None:
+            index.add(added)
+        self._size += index.size
+        if index.contact_count > self.max_contacts_per_organization:
+            self.put_oversized(organization_id, version)
+        self._evict_to_capacity()
+
+    def _store(
+        self, organization_id: int, index: OrganizationSuggestIndex
+    ) -> OrganizationSuggestIndex:
+        self.discard(organization_id)
+        self._indexes[organization_id] = index
+        self._size += index.size
+        self._evict_to_capacity()
+        return index
+
+    def discard(self, organization_id: int) -> None:
+        index = self._indexes.pop(organization_id, None)
+        if index is not None:
+            self._size -= index.size
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        self._size = 0
+
+    def _evict_to_capacity(self) -> None:
+        while self._size > self.max_entries and self._indexes:
+            _organization_id, index = self._indexes.popitem(last=False)
+            self._size -= index.size
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_seconds
+        while self._indexes:
+            organization_id, index = next(iter(self._indexes.items()))
+            if index.last_used >= cutoff:
+                break
+            self.discard(organization_id)
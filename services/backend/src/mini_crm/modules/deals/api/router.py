@@ -2,16 +2,29 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from mini_crm.core.dependencies import get_db_session, get_request_context
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.dependencies import (
+    get_cache,
+    get_db_session,
+    get_request_context,
+    get_streaming_session,
+)
+from mini_crm.core.export import EXPORT_FORMAT_CSV, close_on_error, export_response
+from mini_crm.core.pagination import TOTAL_MODE_EXACT, CachedCounter
 from mini_crm.modules.activities.repositories.repository import AbstractActivityRepository
 from mini_crm.modules.activities.repositories.sqlalchemy import SQLAlchemyActivityRepository
+from mini_crm.modules.analytics.application.tracking import AnalyticsActivityTracker
 from mini_crm.modules.common.application.context import RequestContext
 from mini_crm.modules.contacts.domain.exceptions import ContactNotFoundError
 from mini_crm.modules.deals.application.use_cases import (
+    BulkCreateDealsUseCase,
+    BulkTransitionDealsUseCase,
     CreateDealUseCase,
+    ExportDealsUseCase,
     ListDealsUseCase,
     UpdateDealUseCase,
 )
@@ -20,9 +33,19 @@ from mini_crm.modules.deals.domain.exceptions import (
     DealPermissionDeniedError,
     DealValidationError,
 )
-from mini_crm.modules.deals.dto.schemas import DealCreate, DealResponse, DealUpdate, PaginatedDeals
+from mini_crm.modules.deals.dto.schemas import (
+    DealBulkCreate,
+    DealBulkCreateResult,
+    DealBulkTransition,
+    DealBulkTransitionResult,
+    DealCreate,
+    DealResponse,
+    DealUpdate,
+    PaginatedDeals,
+)
 from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
 from mini_crm.modules.deals.repositories.sqlalchemy import SQLAlchemyDealRepository
+from mini_crm.shared.domain.exceptions import InvalidCursorError
 from mini_crm.shared.enums import DealStage, DealStatus
 
 router = APIRouter(prefix="/deals", tags=["deals"])
@@ -40,10 +63,26 @@ def get_activity_repository(
     return SQLAlchemyActivityRepository(session=session)
 
 
+def get_analytics_tracker(cache: RedisCache = Depends(get_cache)) -> AnalyticsActivityTracker:
+    """Tracker for deal writes, marked dirty from a background task.
+
+    Background tasks run after the request's session has committed, so the analytics
+    worker never refreshes from a transaction that is still open or rolls back.
+    """
+    return AnalyticsActivityTracker(cache)
+
+
 def get_list_deals_use_case(
     repository: AbstractDealRepository = Depends(get_deal_repository),
+    cache: RedisCache = Depends(get_cache),
 ) -> ListDealsUseCase:
-    return ListDealsUseCase(repository=repository)
+    return ListDealsUseCase(repository=repository, counter=CachedCounter(cache))
+
+
+def get_export_deals_use_case(
+    session: AsyncSession = Depends(get_streaming_session),
+) -> ExportDealsUseCase:
+    return ExportDealsUseCase(repository=SQLAlchemyDealRepository(session=session))
 
 
 def get_create_deal_use_case(
@@ -52,6 +91,21 @@ def get_create_deal_use_case(
     return CreateDealUseCase(repository=repository)
 
 
+def get_bulk_create_deals_use_case(
+    repository: AbstractDealRepository = Depends(get_deal_repository),
+) -> BulkCreateDealsUseCase:
+    return BulkCreateDealsUseCase(repository=repository)
+
+
+def get_bulk_transition_deals_use_case(
+    repository: AbstractDealRepository = Depends(get_deal_repository),
+    activity_repository: AbstractActivityRepository = Depends(get_activity_repository),
+) -> BulkTransitionDealsUseCase:
+    return BulkTransitionDealsUseCase(
+        repository=repository, activity_repository=activity_repository
+    )
+
+
 def get_update_deal_use_case(
     repository: AbstractDealRepository = Depends(get_deal_repository),
     activity_repository: AbstractActivityRepository = Depends(get_activity_repository),
@@ -70,6 +124,9 @@ async def list_deals(
     owner_id: int | None = None,
     order_by: str | None = Query(default=None, pattern="^(created_at|amount)$"),
     order: str = Query(default="asc", pattern="^(asc|desc)$"),
+    cursor: str | None = Query(default=None, min_length=1),
+    include_total: bool | None = None,
+    total_mode: str = Query(default=TOTAL_MODE_EXACT, pattern="^(exact|estimated)$"),
     context: RequestContext = Depends(get_request_context),
     use_case: ListDealsUseCase = Depends(get_list_deals_use_case),
 ) -> PaginatedDeals:
@@ -94,37 +151,116 @@ async def list_deals(
             owner_id=owner_id,
             order_by=order_by,
             order=order,
+            cursor=cursor,
+            include_total=include_total,
+            total_mode=total_mode,
         )
         items, meta = result.to_paginated()
         return PaginatedDeals(items=items, meta=meta)
     except DealPermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_deals(
+    export_format: str = Query(default=EXPORT_FORMAT_CSV, alias="format", pattern="^(csv|ndjson)$"),
+    status_param: list[str] | None = Query(default=None, alias="status"),
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    stage: str | None = None,
+    owner_id: int | None = None,
+    order_by: str | None = Query(default=None, pattern="^(created_at|amount)$"),
+    order: str = Query(default="asc", pattern="^(asc|desc)$"),
+    context: RequestContext = Depends(get_request_context),
+    session: AsyncSession = Depends(get_streaming_session),
+    use_case: ExportDealsUseCase = Depends(get_export_deals_use_case),
+) -> StreamingResponse:
+    async with close_on_error(session):
+        try:
+            status_enums = [DealStatus(s) for s in status_param] if status_param else None
+            stage_enum = DealStage(stage) if stage else None
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+        try:
+            chunks = await use_case.execute(
+                context,
+                export_format,
+                status=status_enums,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                stage=stage_enum,
+                owner_id=owner_id,
+                order_by=order_by,
+                order=order,
+            )
+        except DealPermissionDeniedError as e:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    return export_response(chunks, export_format, "deals", session)
 
 
 @router.post("", response_model=DealResponse, status_code=201)
 async def create_deal(
     payload: DealCreate,
+    background_tasks: BackgroundTasks,
     context: RequestContext = Depends(get_request_context),
     use_case: CreateDealUseCase = Depends(get_create_deal_use_case),
+    tracker: AnalyticsActivityTracker = Depends(get_analytics_tracker),
 ) -> DealResponse:
     try:
-        return await use_case.execute(context, payload)
+        deal = await use_case.execute(context, payload)
     except ContactNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    background_tasks.add_task(tracker.mark_dirty, context.organization.organization_id)
+    return deal
+
+
+@router.post("/bulk", response_model=DealBulkCreateResult)
+async def bulk_create_deals(
+    payload: DealBulkCreate,
+    background_tasks: BackgroundTasks,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkCreateDealsUseCase = Depends(get_bulk_create_deals_use_case),
+    tracker: AnalyticsActivityTracker = Depends(get_analytics_tracker),
+) -> DealBulkCreateResult:
+    result = await use_case.execute(context, payload.items)
+    if result.created:
+        background_tasks.add_task(tracker.mark_dirty, context.organization.organization_id)
+    return result
+
+
+@router.post("/bulk/transition", response_model=DealBulkTransitionResult)
+async def bulk_transition_deals(
+    payload: DealBulkTransition,
+    background_tasks: BackgroundTasks,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkTransitionDealsUseCase = Depends(get_bulk_transition_deals_use_case),
+    tracker: AnalyticsActivityTracker = Depends(get_analytics_tracker),
+) -> DealBulkTransitionResult:
+    result = await use_case.execute(context, payload)
+    if result.updated:
+        background_tasks.add_task(tracker.mark_dirty, context.organization.organization_id)
+    return result
 
 
 @router.patch("/{deal_id}", response_model=DealResponse)
 async def update_deal(
     deal_id: int,
     payload: DealUpdate,
+    background_tasks: BackgroundTasks,
     context: RequestContext = Depends(get_request_context),
     use_case: UpdateDealUseCase = Depends(get_update_deal_use_case),
+    tracker: AnalyticsActivityTracker = Depends(get_analytics_tracker),
 ) -> DealResponse:
     try:
-        return await use_case.execute(context, deal_id, payload)
+        deal = await use_case.execute(context, deal_id, payload)
     except DealNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except DealPermissionDeniedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
     except DealValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    background_tasks.add_task(tracker.mark_dirty, context.organization.organization_id)
+    return deal
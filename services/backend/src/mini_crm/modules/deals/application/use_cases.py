@@ -1,27 +1,44 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from decimal import Decimal
 
+from mini_crm.core.export import encode_rows
+from mini_crm.core.pagination import TOTAL_MODE_ESTIMATED, TOTAL_MODE_EXACT, CachedCounter
 from mini_crm.modules.activities.dto.schemas import ActivityCreate
 from mini_crm.modules.activities.repositories.repository import AbstractActivityRepository
 from mini_crm.modules.common.application.context import RequestContext
 from mini_crm.modules.common.domain.services import PermissionService
+from mini_crm.modules.contacts.domain.exceptions import ContactNotFoundError
 from mini_crm.modules.deals.application.dto import DealListDTO
 from mini_crm.modules.deals.domain.exceptions import (
     DealNotFoundError,
     DealPermissionDeniedError,
 )
 from mini_crm.modules.deals.domain.services import DealDomainService
-from mini_crm.modules.deals.dto.schemas import DealCreate, DealResponse, DealUpdate
+from mini_crm.modules.deals.dto.schemas import (
+    DealBulkCreateResult,
+    DealBulkTransition,
+    DealBulkTransitionResult,
+    DealCreate,
+    DealCursor,
+    DealResponse,
+    DealUpdate,
+)
 from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
+from mini_crm.shared.domain.exceptions import DomainError, InvalidCursorError
+from mini_crm.shared.dto.bulk import BulkItemError
 from mini_crm.shared.enums import ActivityType, DealStage, DealStatus, UserRole
 
 
 class ListDealsUseCase:
     """Use case for listing deals."""
 
-    def __init__(self, repository: AbstractDealRepository) -> None:
+    def __init__(
+        self, repository: AbstractDealRepository, counter: CachedCounter | None = None
+    ) -> None:
         self.repository = repository
+        self.counter = counter
 
     async def execute(
         self,
@@ -35,18 +52,161 @@ class ListDealsUseCase:
         owner_id: int | None = None,
         order_by: str | None = None,
         order: str = "asc",
+        cursor: str | None = None,
+        include_total: bool | None = None,
+        total_mode: str = TOTAL_MODE_EXACT,
     ) -> DealListDTO:
-        """List deals with permission checks."""
+        """List deals with permission checks.
+
+        With ``cursor`` the page is read by keyset after the cursor position, which
+        costs the same at any depth; otherwise ``page`` selects an offset page.
+        Totals are counted by default only in page mode; ``total_mode="estimated"``
+        serves them from a short-lived cache instead of counting on every request.
+        """
         if owner_id is not None:
             if not PermissionService.can_filter_by_owner(context.organization.role):
                 raise DealPermissionDeniedError(
                     "Filtering by owner_id is not allowed for member role"
                 )
 
-        items, total = await self.repository.list(
-            context.organization.organization_id,
-            page=page,
+        organization_id = context.organization.organization_id
+        if include_total is None:
+            include_total = cursor is None
+
+        if cursor is None and include_total and total_mode == TOTAL_MODE_EXACT:
+            items, total = await self.repository.list(
+                organization_id,
+                page=page,
+                page_size=page_size,
+                status=status,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                stage=stage,
+                owner_id=owner_id,
+                order_by=order_by,
+                order=order,
+            )
+            has_more = page * page_size < total
+            return DealListDTO(
+                items=items,
+                total=total,
+                page=page,
+                page_size=page_size,
+                has_more=has_more,
+                next_cursor=self._next_cursor(items, has_more, order_by, order),
+            )
+
+        if cursor is not None:
+            position = self._decode_cursor(cursor, order_by, order)
+            items, has_more = await self.repository.list_after(
+                organization_id,
+                cursor=position,
+                limit=page_size,
+                status=status,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                stage=stage,
+                owner_id=owner_id,
+                order_by=order_by,
+                order=order,
+            )
+        else:
+            items, has_more = await self.repository.list_page(
+                organization_id,
+                page=page,
+                page_size=page_size,
+                status=status,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                stage=stage,
+                owner_id=owner_id,
+                order_by=order_by,
+                order=order,
+            )
+
+        counted_total: int | None = None
+        if include_total:
+
+            async def count() -> int:
+                return await self.repository.count(
+                    organization_id,
+                    status=status,
+                    min_amount=min_amount,
+                    max_amount=max_amount,
+                    stage=stage,
+                    owner_id=owner_id,
+                )
+
+            if total_mode == TOTAL_MODE_ESTIMATED and self.counter is not None:
+                key = CachedCounter.key(
+                    "deals",
+                    organization_id,
+                    status=sorted(status) if status else None,
+                    min_amount=min_amount,
+                    max_amount=max_amount,
+                    stage=stage,
+                    owner_id=owner_id,
+                )
+                counted_total = await self.counter.get_or_count(key, count)
+            else:
+                counted_total = await count()
+
+        return DealListDTO(
+            items=items,
+            total=counted_total,
+            page=page if cursor is None else None,
             page_size=page_size,
+            has_more=has_more,
+            next_cursor=self._next_cursor(items, has_more, order_by, order),
+        )
+
+    @staticmethod
+    def _decode_cursor(cursor: str, order_by: str | None, order: str) -> DealCursor:
+        position = DealCursor.decode(cursor)
+        if position.order_by != order_by or position.order != order:
+            raise InvalidCursorError("Cursor was issued for a different ordering")
+        if order_by == "created_at" and position.created_at is None:
+            raise InvalidCursorError()
+        if order_by == "amount" and position.amount is None:
+            raise InvalidCursorError()
+        return position
+
+    @staticmethod
+    def _next_cursor(
+        items: list[DealResponse], has_more: bool, order_by: str | None, order: str
+    ) -> str | None:
+        if not has_more or not items:
+            return None
+        return DealCursor.from_deal(items[-1], order_by, order).encode()
+
+
+class ExportDealsUseCase:
+    """Use case for exporting all deals matching the list filters."""
+
+    def __init__(self, repository: AbstractDealRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self,
+        context: RequestContext,
+        export_format: str,
+        status: list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> AsyncIterator[str]:
+        """Check permissions up front and return the lazily encoded export body."""
+        if owner_id is not None:
+            if not PermissionService.can_filter_by_owner(context.organization.role):
+                raise DealPermissionDeniedError(
+                    "Filtering by owner_id is not allowed for member role"
+                )
+
+        deals = self.repository.stream(
+            context.organization.organization_id,
             status=status,
             min_amount=min_amount,
             max_amount=max_amount,
@@ -55,7 +215,7 @@ class ListDealsUseCase:
             order_by=order_by,
             order=order,
         )
-        return DealListDTO(items=items, total=total, page=page, page_size=page_size)
+        return encode_rows(deals, export_format, list(DealResponse.model_fields))
 
 
 class CreateDealUseCase:
@@ -72,6 +232,103 @@ class CreateDealUseCase:
         return deal
 
 
+class BulkCreateDealsUseCase:
+    """Use case for creating many deals in one request."""
+
+    def __init__(self, repository: AbstractDealRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self, context: RequestContext, payloads: list[DealCreate]
+    ) -> DealBulkCreateResult:
+        """Create all deals whose contact exists; report the rest per item."""
+        organization_id = context.organization.organization_id
+        known_contacts = await self.repository.existing_contact_ids(
+            organization_id, [payload.contact_id for payload in payloads]
+        )
+
+        accepted: list[DealCreate] = []
+        errors: list[BulkItemError] = []
+        for index, payload in enumerate(payloads):
+            if payload.contact_id in known_contacts:
+                accepted.append(payload)
+            else:
+                errors.append(
+                    BulkItemError(index=index, detail=str(ContactNotFoundError(payload.contact_id)))
+                )
+
+        created = await self.repository.create_many(organization_id, context.user.id, accepted)
+        return DealBulkCreateResult(created=created, errors=errors)
+
+
+class BulkTransitionDealsUseCase:
+    """Use case for moving many deals to a new status and/or stage at once."""
+
+    def __init__(
+        self,
+        repository: AbstractDealRepository,
+        activity_repository: AbstractActivityRepository | None = None,
+    ) -> None:
+        self.repository = repository
+        self.activity_repository = activity_repository
+
+    async def execute(
+        self, context: RequestContext, payload: DealBulkTransition
+    ) -> DealBulkTransitionResult:
+        """Apply the same rules as a single update to each deal, then write in batches."""
+        organization_id = context.organization.organization_id
+        role = context.organization.role
+        deals = {
+            deal.id: deal
+            for deal in await self.repository.get_many_for_update(organization_id, payload.ids)
+        }
+
+        accepted: list[DealResponse] = []
+        errors: list[BulkItemError] = []
+        for index, deal_id in enumerate(payload.ids):
+            deal = deals.get(deal_id)
+            try:
+                if deal is None:
+                    raise DealNotFoundError(deal_id)
+                if role == UserRole.MEMBER and deal.owner_id != context.user.id:
+                    raise DealPermissionDeniedError("You can only update your own deals")
+                if payload.status == DealStatus.WON:
+                    DealDomainService.validate_won_deal_amount(deal.amount)
+                if payload.stage is not None and payload.stage != deal.stage:
+                    DealDomainService.validate_stage_rollback(deal.stage, payload.stage, role)
+            except DomainError as e:
+                errors.append(BulkItemError(index=index, detail=str(e)))
+            else:
+                accepted.append(deal)
+
+        if not accepted:
+            return DealBulkTransitionResult(updated=[], errors=errors)
+
+        updated = {
+            deal.id: deal
+            for deal in await self.repository.transition_many(
+                organization_id,
+                [deal.id for deal in accepted],
+                status=payload.status,
+                stage=payload.stage,
+            )
+        }
+
+        if self.activity_repository is not None:
+            activities = [
+                (old_deal.id, activity)
+                for old_deal in accepted
+                for activity in transition_activities(old_deal, payload.status, payload.stage)
+            ]
+            await self.activity_repository.create_many(
+                organization_id, activities, author_id=context.user.id
+            )
+
+        return DealBulkTransitionResult(
+            updated=[updated[deal.id] for deal in accepted], errors=errors
+        )
+
+
 class UpdateDealUseCase:
     """Use case for updating a deal."""
 
@@ -87,8 +344,10 @@ class UpdateDealUseCase:
         self, context: RequestContext, deal_id: int, payload: DealUpdate
     ) -> DealResponse:
         """Update a deal with business rule validation."""
-        # Get current deal to check old values
-        old_deal = await self.repository.get_by_id(context.organization.organization_id, deal_id)
+        organization_id = context.organization.organization_id
+        # Read and lock the current row once; it supplies the old values for
+        # validation and activity logging, and serializes concurrent updates
+        old_deal = await self.repository.get_for_update(organization_id, deal_id)
         if old_deal is None:
             raise DealNotFoundError(deal_id)
 
@@ -113,35 +372,39 @@ class UpdateDealUseCase:
                 old_deal.stage, new_stage, context.organization.role
             )
 
-        # Update deal
-        updated_deal = await self.repository.update(
-            context.organization.organization_id, deal_id, payload
-        )
+        # Update deal; the write returns the new row
+        updated_deal = await self.repository.update(organization_id, deal_id, payload)
 
         # Create Activity records for status/stage changes
         if self.activity_repository is not None:
-            if new_status is not None and new_status != old_deal.status:
-                activity_payload = ActivityCreate(
-                    type=ActivityType.STATUS_CHANGED,
-                    payload={"old_status": old_deal.status.value, "new_status": new_status.value},
-                )
-                await self.activity_repository.create(
-                    context.organization.organization_id,
-                    deal_id,
-                    activity_payload,
-                    author_id=context.user.id,
-                )
-
-            if new_stage is not None and new_stage != old_deal.stage:
-                activity_payload = ActivityCreate(
-                    type=ActivityType.STAGE_CHANGED,
-                    payload={"old_stage": old_deal.stage.value, "new_stage": new_stage.value},
-                )
-                await self.activity_repository.create(
-                    context.organization.organization_id,
-                    deal_id,
-                    activity_payload,
+            activities = transition_activities(old_deal, new_status, new_stage)
+            if activities:
+                await self.activity_repository.create_many(
+                    organization_id,
+                    [(deal_id, activity) for activity in activities],
                     author_id=context.user.id,
                 )
 
         return updated_deal
+
+
+def transition_activities(
+    old_deal: DealResponse, new_status: DealStatus | None, new_stage: DealStage | None
+) -> list[ActivityCreate]:
+    """Build the STATUS_CHANGED/STAGE_CHANGED activities for a deal transition."""
+    activities: list[ActivityCreate] = []
+    if new_status is not None and new_status != old_deal.status:
+        activities.append(
+            ActivityCreate(
+                type=ActivityType.STATUS_CHANGED,
+                payload={"old_status": old_deal.status.value, "new_status": new_status.value},
+            )
+        )
+    if new_stage is not None and new_stage != old_deal.stage:
+        activities.append(
+            ActivityCreate(
+                type=ActivityType.STAGE_CHANGED,
+                payload={"old_stage": old_deal.stage.value, "new_stage": new_stage.value},
+            )
+        )
+    return activities
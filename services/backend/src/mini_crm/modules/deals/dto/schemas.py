@@ -3,8 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
+from pydantic import Field, model_validator
+
 from mini_crm.shared.dto.base import DTO
-from mini_crm.shared.dto.pagination import PaginationMeta
+from mini_crm.shared.dto.bulk import BulkItemError
+from mini_crm.shared.dto.pagination import Cursor, CursorPaginationMeta
 from mini_crm.shared.enums import DealStage, DealStatus
 
 
@@ -37,4 +40,59 @@ class DealResponse(DTO):
 
 class PaginatedDeals(DTO):
     items: list[DealResponse]
-    meta: PaginationMeta
+    meta: CursorPaginationMeta
+
+
+MAX_BULK_DEALS = 1000
+
+
+class DealBulkCreate(DTO):
+    items: list[DealCreate] = Field(min_length=1, max_length=MAX_BULK_DEALS)
+
+
+class DealBulkCreateResult(DTO):
+    """Created deals in payload order, plus the items that were rejected."""
+
+    created: list[DealResponse]
+    errors: list[BulkItemError]
+
+
+class DealBulkTransition(DTO):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_DEALS)
+    status: DealStatus | None = None
+    stage: DealStage | None = None
+
+    @model_validator(mode="after")
+    def check_transition(self) -> DealBulkTransition:
+        if self.status is None and self.stage is None:
+            raise ValueError("Either status or stage must be provided")
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError("Deal ids must be unique")
+        return self
+
+
+class DealBulkTransitionResult(DTO):
+    """Transitioned deals in payload order, plus the ids that were rejected."""
+
+    updated: list[DealResponse]
+    errors: list[BulkItemError]
+
+
+class DealCursor(Cursor):
+    """Position after the last deal of a page, for the ordering it was produced with."""
+
+    order_by: str | None = None
+    order: str = "asc"
+    id: int
+    created_at: datetime | None = None
+    amount: Decimal | None = None
+
+    @classmethod
+    def from_deal(cls, deal: DealResponse, order_by: str | None, order: str) -> DealCursor:
+        return cls(
+            order_by=order_by,
+            order=order,
+            id=deal.id,
+            created_at=deal.created_at if order_by == "created_at" else None,
+            amount=deal.amount if order_by == "amount" else None,
+        )
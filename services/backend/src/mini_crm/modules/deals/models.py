@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from mini_crm.core.db import Base
@@ -12,11 +12,17 @@ from mini_crm.shared.enums import DealStage, DealStatus
 
 class Deal(Base):
     __tablename__ = "deals"
+    # Every list/analytics query is scoped by organization, so the organization leads
+    # each composite index and doubles as the plain organization_id index.
+    __table_args__ = (
+        Index("ix_deals_org_status", "organization_id", "status"),
+        Index("ix_deals_org_stage", "organization_id", "stage"),
+        Index("ix_deals_org_created_at", "organization_id", "created_at", "id"),
+        Index("ix_deals_org_amount", "organization_id", "amount", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    organization_id: Mapped[int] = mapped_column(
-        ForeignKey("organizations.id", ondelete="CASCADE"), index=True
-    )
+    organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
     contact_id: Mapped[int] = mapped_column(
         ForeignKey("contacts.id", ondelete="CASCADE"), index=True
     )
@@ -28,9 +34,9 @@ class Deal(Base):
     currency: Mapped[str] = mapped_column(String(8), default="USD")
     status: Mapped[DealStatus] = mapped_column(String(20), default=DealStatus.NEW)
     stage: Mapped[DealStage] = mapped_column(String(32), default=DealStage.QUALIFICATION)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default="now()", onupdate="now()"
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     contact = relationship("Contact")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import builtins
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from decimal import Decimal
+from typing import Any
 
-from mini_crm.modules.deals.dto.schemas import DealCreate, DealResponse, DealUpdate
+from mini_crm.modules.deals.dto.schemas import DealCreate, DealCursor, DealResponse, DealUpdate
 from mini_crm.shared.enums import DealStage, DealStatus
 
 
@@ -26,23 +29,127 @@ class AbstractDealRepository(ABC):
     ) -> tuple[list[DealResponse], int]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        """Return one offset page and whether more deals follow, without counting."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: DealCursor | None,
+        limit: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        """Return up to ``limit`` deals following ``cursor`` and whether more remain."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> AsyncIterator[DealResponse]:
+        """Yield every matching deal in order without holding the result set in memory."""
+        raise NotImplementedError
+
     @abstractmethod
     async def create(
         self, organization_id: int, owner_id: int, payload: DealCreate
     ) -> DealResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(
+        self, organization_id: int, owner_id: int, payloads: builtins.list[DealCreate]
+    ) -> builtins.list[DealResponse]:
+        """Insert deals whose contacts were already validated, preserving payload order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def existing_contact_ids(
+        self, organization_id: int, contact_ids: builtins.list[int]
+    ) -> set[int]:
+        """Return which of the given contacts belong to the organization."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_owner_ids(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> dict[int, int | None]:
+        """Map each of the given deals that belongs to the organization to its owner."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, organization_id: int, deal_id: int, payload: DealUpdate) -> DealResponse:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_by_id(self, organization_id: int, deal_id: int) -> DealResponse | None:
+    async def get_for_update(self, organization_id: int, deal_id: int) -> DealResponse | None:
+        """Load a deal and lock its row until the end of the transaction."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many_for_update(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> builtins.list[DealResponse]:
+        """Load the organization's deals among ``deal_ids`` and lock them for update."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def transition_many(
+        self,
+        organization_id: int,
+        deal_ids: builtins.list[int],
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+    ) -> builtins.list[DealResponse]:
+        """Set the same status and/or stage on all given deals in one statement."""
         raise NotImplementedError
 
     @abstractmethod
-    async def has_deals_for_contact(self, contact_id: int) -> bool:
-        """Check if contact has any deals."""
+    async def get_by_id(self, organization_id: int, deal_id: int) -> DealResponse | None:
         raise NotImplementedError
 
 
@@ -94,6 +201,129 @@ class InMemoryDealRepository(AbstractDealRepository):
 
         return (paginated_values, total)
 
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        items, total = await self.list(
+            organization_id,
+            page=page,
+            page_size=page_size,
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            stage=stage,
+            owner_id=owner_id,
+            order_by=order_by,
+            order=order,
+        )
+        return items, page * page_size < total
+
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        _items, total = await self.list(
+            organization_id,
+            page=1,
+            page_size=0,
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            stage=stage,
+            owner_id=owner_id,
+        )
+        return total
+
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: DealCursor | None,
+        limit: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        values, _total = await self.list(
+            organization_id,
+            page=1,
+            page_size=len(self._items),
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            stage=stage,
+            owner_id=owner_id,
+        )
+
+        def sort_key(deal: DealResponse) -> tuple[Any, int]:
+            if order_by == "created_at":
+                return deal.created_at, deal.id
+            if order_by == "amount":
+                return deal.amount, deal.id
+            return deal.id, deal.id
+
+        reverse = order == "desc"
+        values.sort(key=sort_key, reverse=reverse)
+        if cursor is not None:
+            position: tuple[Any, int] = (cursor.id, cursor.id)
+            if order_by == "created_at":
+                position = (cursor.created_at, cursor.id)
+            elif order_by == "amount":
+                position = (cursor.amount, cursor.id)
+            if reverse:
+                values = [v for v in values if sort_key(v) < position]
+            else:
+                values = [v for v in values if sort_key(v) > position]
+        return values[:limit], len(values) > limit
+
+    async def stream(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> AsyncIterator[DealResponse]:
+        values, _has_more = await self.list_after(
+            organization_id,
+            cursor=None,
+            limit=len(self._items),
+            status=status,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            stage=stage,
+            owner_id=owner_id,
+            order_by=order_by,
+            order=order,
+        )
+        for value in values:
+            yield value
+
     async def create(
         self, organization_id: int, owner_id: int, payload: DealCreate
     ) -> DealResponse:  # noqa: ARG002
@@ -116,6 +346,24 @@ class InMemoryDealRepository(AbstractDealRepository):
         self._organization_ids[self._counter] = organization_id
         return deal
 
+    async def create_many(
+        self, organization_id: int, owner_id: int, payloads: builtins.list[DealCreate]
+    ) -> builtins.list[DealResponse]:
+        return [await self.create(organization_id, owner_id, payload) for payload in payloads]
+
+    async def existing_contact_ids(
+        self,
+        organization_id: int,  # noqa: ARG002
+        contact_ids: builtins.list[int],
+    ) -> set[int]:
+        return set(contact_ids)
+
+    async def get_owner_ids(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> dict[int, int | None]:
+        deals = [await self.get_by_id(organization_id, deal_id) for deal_id in set(deal_ids)]
+        return {deal.id: deal.owner_id for deal in deals if deal is not None}
+
     async def update(self, organization_id: int, deal_id: int, payload: DealUpdate) -> DealResponse:  # noqa: ARG002
         deal = self._items[deal_id]
         update_data = payload.model_dump(exclude_none=True)
@@ -124,6 +372,25 @@ class InMemoryDealRepository(AbstractDealRepository):
         self._items[deal_id] = updated
         return updated
 
+    async def get_for_update(self, organization_id: int, deal_id: int) -> DealResponse | None:
+        return await self.get_by_id(organization_id, deal_id)
+
+    async def get_many_for_update(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> builtins.list[DealResponse]:
+        deals = [await self.get_by_id(organization_id, deal_id) for deal_id in sorted(deal_ids)]
+        return [deal for deal in deals if deal is not None]
+
+    async def transition_many(
+        self,
+        organization_id: int,
+        deal_ids: builtins.list[int],
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+    ) -> builtins.list[DealResponse]:
+        payload = DealUpdate(status=status, stage=stage)
+        return [await self.update(organization_id, deal_id, payload) for deal_id in deal_ids]
+
     async def get_by_id(self, organization_id: int, deal_id: int) -> DealResponse | None:
         deal = self._items.get(deal_id)
         if deal is None:
@@ -131,7 +398,3 @@ class InMemoryDealRepository(AbstractDealRepository):
         if self._organization_ids.get(deal_id) != organization_id:
             return None
         return deal
-
-    async def has_deals_for_contact(self, contact_id: int) -> bool:  # noqa: ARG002
-        """Check if contact has any deals."""
-        return any(deal.contact_id == contact_id for deal in self._items.values())
@@ -1,24 +1,45 @@
 from __future__ import annotations
 
+import builtins
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from decimal import Decimal
+from typing import Any, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Select,
+    UnaryExpression,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from mini_crm.core.db import STREAM_BATCH_SIZE
+from mini_crm.core.identity import verified_aggregates
 from mini_crm.modules.contacts.domain.exceptions import ContactNotFoundError
 from mini_crm.modules.contacts.models import Contact
 from mini_crm.modules.deals.domain.exceptions import DealNotFoundError
-from mini_crm.modules.deals.dto.schemas import DealCreate, DealResponse, DealUpdate
+from mini_crm.modules.deals.dto.schemas import DealCreate, DealCursor, DealResponse, DealUpdate
 from mini_crm.modules.deals.models import Deal
 from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
 from mini_crm.shared.enums import DealStage, DealStatus
 
+_T = TypeVar("_T", bound=tuple[Any, ...])
+
 
 class SQLAlchemyDealRepository(AbstractDealRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    def _remember(self, organization_id: int, deal_ids: builtins.list[int]) -> None:
+        """Let later writes in this transaction skip re-checking these deals' organization."""
+        verified_aggregates(self.session).add(Deal, organization_id, deal_ids)
+
     async def list(
         self,
         organization_id: int,
@@ -35,63 +56,144 @@ class SQLAlchemyDealRepository(AbstractDealRepository):
     ) -> tuple[list[DealResponse], int]:
         offset = max(page - 1, 0) * page_size
 
-        # Build base query with filters
-        stmt = select(Deal).where(Deal.organization_id == organization_id)
+        # The window count is evaluated before OFFSET/LIMIT, so page and total share one query
+        stmt = _apply_filters(
+            select(Deal, func.count().over().label("total")),
+            organization_id,
+            status,
+            min_amount,
+            max_amount,
+            stage,
+            owner_id,
+        )
+        stmt = stmt.order_by(*_ordering(order_by, order)).offset(offset).limit(page_size)
+        rows = (await self.session.execute(stmt)).all()
 
-        # Apply filters
-        if status:
-            stmt = stmt.where(Deal.status.in_(status))
-        if min_amount is not None:
-            stmt = stmt.where(Deal.amount >= min_amount)
-        if max_amount is not None:
-            stmt = stmt.where(Deal.amount <= max_amount)
-        if stage is not None:
-            stmt = stmt.where(Deal.stage == stage)
-        if owner_id is not None:
-            stmt = stmt.where(Deal.owner_id == owner_id)
-
-        # Apply sorting
-        if order_by == "created_at":
-            if order == "desc":
-                stmt = stmt.order_by(Deal.created_at.desc())
-            else:
-                stmt = stmt.order_by(Deal.created_at.asc())
-        elif order_by == "amount":
-            if order == "desc":
-                stmt = stmt.order_by(Deal.amount.desc())
-            else:
-                stmt = stmt.order_by(Deal.amount.asc())
+        if rows:
+            total = rows[0].total
+        elif offset == 0:
+            total = 0
         else:
-            if order == "desc":
-                stmt = stmt.order_by(Deal.id.desc())
-            else:
-                stmt = stmt.order_by(Deal.id.asc())
+            # A page past the end carries no window value; count separately only then
+            total = await self.count(
+                organization_id,
+                status=status,
+                min_amount=min_amount,
+                max_amount=max_amount,
+                stage=stage,
+                owner_id=owner_id,
+            )
 
-        stmt = stmt.offset(offset).limit(page_size)
+        items = [DealResponse.model_validate(row.Deal) for row in rows]
+        return items, int(total)
 
+    async def list_page(
+        self,
+        organization_id: int,
+        *,
+        page: int,
+        page_size: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        offset = max(page - 1, 0) * page_size
+        stmt = _apply_filters(
+            select(Deal), organization_id, status, min_amount, max_amount, stage, owner_id
+        )
+        # Fetch one extra row to learn whether another page follows
+        stmt = stmt.order_by(*_ordering(order_by, order)).offset(offset).limit(page_size + 1)
         result = await self.session.scalars(stmt)
         deals = result.all()
 
-        # Build count query with same filters
-        count_stmt = (
-            select(func.count()).select_from(Deal).where(Deal.organization_id == organization_id)
+        items = [DealResponse.model_validate(deal) for deal in deals[:page_size]]
+        return items, len(deals) > page_size
+
+    async def count(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+    ) -> int:
+        stmt = _apply_filters(
+            select(func.count()).select_from(Deal),
+            organization_id,
+            status,
+            min_amount,
+            max_amount,
+            stage,
+            owner_id,
         )
+        total = await self.session.scalar(stmt)
+        return int(total or 0)
 
-        if status:
-            count_stmt = count_stmt.where(Deal.status.in_(status))
-        if min_amount is not None:
-            count_stmt = count_stmt.where(Deal.amount >= min_amount)
-        if max_amount is not None:
-            count_stmt = count_stmt.where(Deal.amount <= max_amount)
-        if stage is not None:
-            count_stmt = count_stmt.where(Deal.stage == stage)
-        if owner_id is not None:
-            count_stmt = count_stmt.where(Deal.owner_id == owner_id)
+    async def list_after(
+        self,
+        organization_id: int,
+        *,
+        cursor: DealCursor | None,
+        limit: int,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> tuple[builtins.list[DealResponse], bool]:
+        stmt = _apply_filters(
+            select(Deal), organization_id, status, min_amount, max_amount, stage, owner_id
+        )
 
-        total = await self.session.scalar(count_stmt)
+        if cursor is not None:
+            # Row comparison on (sort column, id) is answered by the composite indexes
+            column = _sort_column(order_by)
+            if column is Deal.id:
+                stmt = stmt.where(Deal.id < cursor.id if order == "desc" else Deal.id > cursor.id)
+            else:
+                value = cursor.created_at if order_by == "created_at" else cursor.amount
+                position = tuple_(column, Deal.id)
+                bound = tuple_(literal(value), literal(cursor.id))
+                stmt = stmt.where(position < bound if order == "desc" else position > bound)
 
-        items = [DealResponse.model_validate(deal) for deal in deals]
-        return items, int(total or 0)
+        # Fetch one extra row to learn whether another page follows
+        stmt = stmt.order_by(*_ordering(order_by, order)).limit(limit + 1)
+        result = await self.session.scalars(stmt)
+        deals = result.all()
+
+        items = [DealResponse.model_validate(deal) for deal in deals[:limit]]
+        return items, len(deals) > limit
+
+    async def stream(
+        self,
+        organization_id: int,
+        *,
+        status: builtins.list[DealStatus] | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        stage: DealStage | None = None,
+        owner_id: int | None = None,
+        order_by: str | None = None,
+        order: str = "asc",
+    ) -> AsyncIterator[DealResponse]:
+        stmt = _apply_filters(
+            select(Deal), organization_id, status, min_amount, max_amount, stage, owner_id
+        )
+        # A server-side cursor fetches rows in batches, so memory stays flat for any tenant size
+        stmt = stmt.order_by(*_ordering(order_by, order)).execution_options(
+            yield_per=STREAM_BATCH_SIZE
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for deal in result:
+            yield DealResponse.model_validate(deal)
 
     async def create(
         self, organization_id: int, owner_id: int, payload: DealCreate
@@ -119,27 +221,126 @@ class SQLAlchemyDealRepository(AbstractDealRepository):
         )
         self.session.add(deal)
         await self.session.flush()
-        await self.session.refresh(deal)
+        self._remember(organization_id, [deal.id])
         return DealResponse.model_validate(deal)
 
-    async def update(self, organization_id: int, deal_id: int, payload: DealUpdate) -> DealResponse:
-        stmt = select(Deal).where(
-            Deal.id == deal_id,
+    async def create_many(
+        self, organization_id: int, owner_id: int, payloads: builtins.list[DealCreate]
+    ) -> builtins.list[DealResponse]:
+        if not payloads:
+            return []
+        now = datetime.now(tz=UTC)
+        rows = [
+            {
+                "organization_id": organization_id,
+                "contact_id": payload.contact_id,
+                "owner_id": owner_id,
+                "title": payload.title,
+                "amount": payload.amount,
+                "currency": payload.currency,
+                "status": DealStatus.NEW,
+                "stage": DealStage.QUALIFICATION,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for payload in payloads
+        ]
+        # Batched multi-row INSERT ... RETURNING; rows come back in parameter order
+        stmt = insert(Deal).returning(Deal, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, rows)
+        deals = [DealResponse.model_validate(deal) for deal in result.all()]
+        self._remember(organization_id, [deal.id for deal in deals])
+        return deals
+
+    async def existing_contact_ids(
+        self, organization_id: int, contact_ids: builtins.list[int]
+    ) -> set[int]:
+        if not contact_ids:
+            return set()
+        stmt = select(Contact.id).where(
+            Contact.organization_id == organization_id,
+            Contact.id.in_(set(contact_ids)),
+        )
+        result = await self.session.scalars(stmt)
+        return set(result.all())
+
+    async def get_owner_ids(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> dict[int, int | None]:
+        if not deal_ids:
+            return {}
+        stmt = select(Deal.id, Deal.owner_id).where(
             Deal.organization_id == organization_id,
+            Deal.id.in_(set(deal_ids)),
+        )
+        result = await self.session.execute(stmt)
+        owners = {deal_id: owner_id for deal_id, owner_id in result.all()}
+        self._remember(organization_id, list(owners))
+        return owners
+
+    async def update(self, organization_id: int, deal_id: int, payload: DealUpdate) -> DealResponse:
+        update_data = payload.model_dump(exclude_none=True)
+        update_data["updated_at"] = datetime.now(tz=UTC)
+        stmt = (
+            update(Deal)
+            .where(Deal.id == deal_id, Deal.organization_id == organization_id)
+            .values(update_data)
+            .returning(Deal)
         )
         deal = await self.session.scalar(stmt)
         if deal is None:
             raise DealNotFoundError(deal_id)
+        return DealResponse.model_validate(deal)
 
-        # Update fields
-        update_data = payload.model_dump(exclude_none=True)
-        for key, value in update_data.items():
-            setattr(deal, key, value)
+    async def get_for_update(self, organization_id: int, deal_id: int) -> DealResponse | None:
+        stmt = (
+            select(Deal)
+            .where(Deal.id == deal_id, Deal.organization_id == organization_id)
+            .with_for_update()
+        )
+        result = await self.session.scalar(stmt)
+        if result is None:
+            return None
+        self._remember(organization_id, [deal_id])
+        return DealResponse.model_validate(result)
 
-        deal.updated_at = datetime.now(tz=UTC)
-        await self.session.flush()
-        await self.session.refresh(deal)
-        return DealResponse.model_validate(deal)
+    async def get_many_for_update(
+        self, organization_id: int, deal_ids: builtins.list[int]
+    ) -> builtins.list[DealResponse]:
+        # Lock in id order so concurrent bulk requests cannot deadlock each other
+        stmt = (
+            select(Deal)
+            .where(Deal.organization_id == organization_id, Deal.id.in_(deal_ids))
+            .order_by(Deal.id)
+            .with_for_update()
+        )
+        result = await self.session.scalars(stmt)
+        deals = [DealResponse.model_validate(deal) for deal in result.all()]
+        self._remember(organization_id, [deal.id for deal in deals])
+        return deals
+
+    async def transition_many(
+        self,
+        organization_id: int,
+        deal_ids: builtins.list[int],
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+    ) -> builtins.list[DealResponse]:
+        if not deal_ids:
+            return []
+        values: dict[str, object] = {"updated_at": datetime.now(tz=UTC)}
+        if status is not None:
+            values["status"] = status
+        if stage is not None:
+            values["stage"] = stage
+        stmt = (
+            update(Deal)
+            .where(Deal.organization_id == organization_id, Deal.id.in_(deal_ids))
+            .values(values)
+            .returning(Deal)
+        )
+        result = await self.session.scalars(stmt)
+        return [DealResponse.model_validate(deal) for deal in result.all()]
 
     async def get_by_id(self, organization_id: int, deal_id: int) -> DealResponse | None:
         stmt = select(Deal).where(
@@ -149,10 +350,46 @@ class SQLAlchemyDealRepository(AbstractDealRepository):
         result = await self.session.scalar(stmt)
         if result is None:
             return None
+        self._remember(organization_id, [deal_id])
         return DealResponse.model_validate(result)
 
-    async def has_deals_for_contact(self, contact_id: int) -> bool:
-        """Check if contact has any deals."""
-        stmt = select(func.count()).select_from(Deal).where(Deal.contact_id == contact_id)
-        count = await self.session.scalar(stmt)
-        return bool(count and count > 0)
+
+def _apply_filters(
+    stmt: Select[_T],
+    organization_id: int,
+    status: list[DealStatus] | None,
+    min_amount: Decimal | None,
+    max_amount: Decimal | None,
+    stage: DealStage | None,
+    owner_id: int | None,
+) -> Select[_T]:
+    stmt = stmt.where(Deal.organization_id == organization_id)
+    if status:
+        stmt = stmt.where(Deal.status.in_(status))
+    if min_amount is not None:
+        stmt = stmt.where(Deal.amount >= min_amount)
+    if max_amount is not None:
+        stmt = stmt.where(Deal.amount <= max_amount)
+    if stage is not None:
+        stmt = stmt.where(Deal.stage == stage)
+    if owner_id is not None:
+        stmt = stmt.where(Deal.owner_id == owner_id)
+    return stmt
+
+
+def _sort_column(order_by: str | None) -> InstrumentedAttribute[Any]:
+    if order_by == "created_at":
+        return Deal.created_at
+    if order_by == "amount":
+        return Deal.amount
+    return Deal.id
+
+
+def _ordering(order_by: str | None, order: str) -> list[UnaryExpression[Any]]:
+    """Sort column plus ``id`` as a tiebreaker so pages never overlap or skip rows."""
+    columns = [_sort_column(order_by)]
+    if columns[0] is not Deal.id:
+        columns.append(Deal.id)
+    if order == "desc":
+        return [column.desc() for column in columns]
+    return [column.asc() for column in columns]
@@ -12,14 +12,34 @@ from mini_crm.modules.common.application.context import RequestContext
 from mini_crm.modules.deals.domain.exceptions import DealNotFoundError
 from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
 from mini_crm.modules.deals.repositories.sqlalchemy import SQLAlchemyDealRepository
-from mini_crm.modules.tasks.application.use_cases import CreateTaskUseCase, ListTasksUseCase
+from mini_crm.modules.tasks.application.use_cases import (
+    BulkCompleteTasksUseCase,
+    BulkCreateTasksUseCase,
+    BulkRescheduleTasksUseCase,
+    CreateTaskUseCase,
+    GetTaskAgendaUseCase,
+    ListTasksUseCase,
+)
 from mini_crm.modules.tasks.domain.exceptions import (
     TaskPermissionDeniedError,
     TaskValidationError,
 )
-from mini_crm.modules.tasks.dto.schemas import TaskCreate, TaskResponse
+from mini_crm.modules.tasks.dto.schemas import (
+    TASK_AGENDA_MAX_PER_DAY,
+    TASK_ORDER_CREATED_AT,
+    PaginatedTasks,
+    TaskAgendaDay,
+    TaskBulkCreate,
+    TaskBulkCreateResult,
+    TaskBulkIds,
+    TaskBulkReschedule,
+    TaskBulkUpdateResult,
+    TaskCreate,
+    TaskResponse,
+)
 from mini_crm.modules.tasks.repositories.repository import AbstractTaskRepository
 from mini_crm.modules.tasks.repositories.sqlalchemy import SQLAlchemyTaskRepository
+from mini_crm.shared.domain.exceptions import InvalidCursorError
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -48,6 +68,12 @@ def get_list_tasks_use_case(
     return ListTasksUseCase(repository=repository)
 
 
+def get_task_agenda_use_case(
+    repository: AbstractTaskRepository = Depends(get_task_repository),
+) -> GetTaskAgendaUseCase:
+    return GetTaskAgendaUseCase(repository=repository)
+
+
 def get_create_task_use_case(
     repository: AbstractTaskRepository = Depends(get_task_repository),
     deal_repository: AbstractDealRepository = Depends(get_deal_repository),
@@ -60,22 +86,77 @@ def get_create_task_use_case(
     )
 
 
-@router.get("", response_model=list[TaskResponse])
+def get_bulk_create_tasks_use_case(
+    repository: AbstractTaskRepository = Depends(get_task_repository),
+    deal_repository: AbstractDealRepository = Depends(get_deal_repository),
+    activity_repository: AbstractActivityRepository = Depends(get_activity_repository),
+) -> BulkCreateTasksUseCase:
+    return BulkCreateTasksUseCase(
+        repository=repository,
+        deal_repository=deal_repository,
+        activity_repository=activity_repository,
+    )
+
+
+def get_bulk_complete_tasks_use_case(
+    repository: AbstractTaskRepository = Depends(get_task_repository),
+) -> BulkCompleteTasksUseCase:
+    return BulkCompleteTasksUseCase(repository=repository)
+
+
+def get_bulk_reschedule_tasks_use_case(
+    repository: AbstractTaskRepository = Depends(get_task_repository),
+) -> BulkRescheduleTasksUseCase:
+    return BulkRescheduleTasksUseCase(repository=repository)
+
+
+@router.get("", response_model=PaginatedTasks)
 async def list_tasks(
     deal_id: int | None = Query(default=None),
     only_open: bool = Query(default=False),
     due_before: datetime | None = Query(default=None),
     due_after: datetime | None = Query(default=None),
+    page_size: int = Query(default=50, ge=1, le=100),
+    order_by: str = Query(default=TASK_ORDER_CREATED_AT, pattern="^(created_at|due_date)$"),
+    cursor: str | None = Query(default=None, min_length=1),
     context: RequestContext = Depends(get_request_context),
     use_case: ListTasksUseCase = Depends(get_list_tasks_use_case),
-) -> list[TaskResponse]:
-    return await use_case.execute(
-        context,
-        deal_id=deal_id,
-        only_open=only_open,
-        due_before=due_before,
-        due_after=due_after,
-    )
+) -> PaginatedTasks:
+    """List one page of tasks; ``meta.next_cursor`` continues to the following page.
+
+    The list used to return every matching task as a bare array. Clients must now read
+    ``items`` and follow ``meta.next_cursor`` until it is null to see all tasks.
+    """
+    try:
+        result = await use_case.execute(
+            context,
+            deal_id=deal_id,
+            only_open=only_open,
+            due_before=due_before,
+            due_after=due_after,
+            cursor=cursor,
+            page_size=page_size,
+            order_by=order_by,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    items, meta = result.to_paginated()
+    return PaginatedTasks(items=items, meta=meta)
+
+
+@router.get("/agenda", response_model=list[TaskAgendaDay])
+async def get_task_agenda(
+    start: datetime = Query(alias="from"),
+    end: datetime = Query(alias="to"),
+    per_day: int = Query(default=5, ge=1, le=TASK_AGENDA_MAX_PER_DAY),
+    timezone: str = Query(default="UTC", min_length=1, max_length=64),
+    context: RequestContext = Depends(get_request_context),
+    use_case: GetTaskAgendaUseCase = Depends(get_task_agenda_use_case),
+) -> list[TaskAgendaDay]:
+    try:
+        return await use_case.execute(context, start, end, per_day=per_day, timezone=timezone)
+    except TaskValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
 
 @router.post("", response_model=TaskResponse, status_code=201)
@@ -92,3 +173,33 @@ async def create_task(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
     except TaskValidationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
+@router.post("/bulk", response_model=TaskBulkCreateResult)
+async def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkCreateTasksUseCase = Depends(get_bulk_create_tasks_use_case),
+) -> TaskBulkCreateResult:
+    return await use_case.execute(context, payload.items)
+
+
+@router.post("/bulk/complete", response_model=TaskBulkUpdateResult)
+async def bulk_complete_tasks(
+    payload: TaskBulkIds,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkCompleteTasksUseCase = Depends(get_bulk_complete_tasks_use_case),
+) -> TaskBulkUpdateResult:
+    return await use_case.execute(context, payload)
+
+
+@router.post("/bulk/reschedule", response_model=TaskBulkUpdateResult)
+async def bulk_reschedule_tasks(
+    payload: TaskBulkReschedule,
+    context: RequestContext = Depends(get_request_context),
+    use_case: BulkRescheduleTasksUseCase = Depends(get_bulk_reschedule_tasks_use_case),
+) -> TaskBulkUpdateResult:
+    try:
+        return await use_case.execute(context, payload)
+    except TaskValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
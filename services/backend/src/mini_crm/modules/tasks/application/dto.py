@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mini_crm.modules.tasks.dto.schemas import TaskResponse
+from mini_crm.shared.dto.pagination import CursorPaginationMeta
+
+
+@dataclass
+class TaskListDTO:
+    """DTO for one page of tasks."""
+
+    items: list[TaskResponse]
+    page_size: int
+    has_more: bool = False
+    next_cursor: str | None = None
+
+    def to_paginated(self) -> tuple[list[TaskResponse], CursorPaginationMeta]:
+        """Convert to paginated response."""
+        meta = CursorPaginationMeta(
+            page_size=self.page_size, has_more=self.has_more, next_cursor=self.next_cursor
+        )
+        return self.items, meta
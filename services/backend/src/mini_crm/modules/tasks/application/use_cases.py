@@ -1,16 +1,38 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from mini_crm.config.settings import get_settings
 from mini_crm.modules.activities.dto.schemas import ActivityCreate
 from mini_crm.modules.activities.repositories.repository import AbstractActivityRepository
 from mini_crm.modules.common.application.context import RequestContext
 from mini_crm.modules.deals.domain.exceptions import DealNotFoundError
 from mini_crm.modules.deals.repositories.repository import AbstractDealRepository
-from mini_crm.modules.tasks.domain.exceptions import TaskPermissionDeniedError
+from mini_crm.modules.tasks.application.dto import TaskListDTO
+from mini_crm.modules.tasks.domain.exceptions import (
+    TaskNotFoundError,
+    TaskPermissionDeniedError,
+    TaskValidationError,
+)
 from mini_crm.modules.tasks.domain.services import TaskDomainService
-from mini_crm.modules.tasks.dto.schemas import TaskCreate, TaskResponse
+from mini_crm.modules.tasks.dto.schemas import (
+    TASK_AGENDA_MAX_DAYS,
+    TASK_ORDER_CREATED_AT,
+    TaskAgendaDay,
+    TaskBulkCreateResult,
+    TaskBulkIds,
+    TaskBulkReschedule,
+    TaskBulkUpdateResult,
+    TaskChange,
+    TaskCreate,
+    TaskCursor,
+    TaskResponse,
+)
 from mini_crm.modules.tasks.repositories.repository import AbstractTaskRepository
+from mini_crm.shared.domain.exceptions import DomainError, InvalidCursorError
+from mini_crm.shared.dto.bulk import BulkItemError
 from mini_crm.shared.enums import ActivityType, UserRole
 
 
@@ -27,14 +49,74 @@ class ListTasksUseCase:
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
-    ) -> list[TaskResponse]:
-        """List tasks."""
-        return await self.repository.list_tasks(
+        cursor: str | None = None,
+        page_size: int = 50,
+        order_by: str = TASK_ORDER_CREATED_AT,
+    ) -> TaskListDTO:
+        """List one page of tasks.
+
+        Pages are read by keyset after ``cursor`` in ``order_by`` order, so a page costs
+        the same at any depth.
+        """
+        items, has_more = await self.repository.list_tasks(
             context.organization.organization_id,
             deal_id=deal_id,
             only_open=only_open,
             due_before=due_before,
             due_after=due_after,
+            cursor=self._decode_cursor(cursor, order_by) if cursor is not None else None,
+            limit=page_size,
+            order_by=order_by,
+        )
+        next_cursor = None
+        if has_more and items:
+            next_cursor = TaskCursor.from_task(items[-1], order_by).encode()
+        return TaskListDTO(
+            items=items, page_size=page_size, has_more=has_more, next_cursor=next_cursor
+        )
+
+    @staticmethod
+    def _decode_cursor(cursor: str, order_by: str) -> TaskCursor:
+        position = TaskCursor.decode(cursor)
+        if position.order_by != order_by:
+            raise InvalidCursorError("Cursor was issued for a different ordering")
+        if order_by == TASK_ORDER_CREATED_AT and position.created_at is None:
+            raise InvalidCursorError()
+        return position
+
+
+class GetTaskAgendaUseCase:
+    """Use case for the calendar agenda: task counts and first tasks per day."""
+
+    def __init__(self, repository: AbstractTaskRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self,
+        context: RequestContext,
+        start: datetime,
+        end: datetime,
+        per_day: int = 5,
+        timezone: str = "UTC",
+    ) -> list[TaskAgendaDay]:
+        if start.tzinfo is None or end.tzinfo is None:
+            raise TaskValidationError("from and to must include a UTC offset")
+        if end <= start:
+            raise TaskValidationError("to must be after from")
+        if end - start > timedelta(days=TASK_AGENDA_MAX_DAYS):
+            raise TaskValidationError(f"The agenda spans at most {TASK_AGENDA_MAX_DAYS} days")
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise TaskValidationError(f"Unknown timezone: {timezone}") from e
+
+        return await self.repository.agenda(
+            context.organization.organization_id,
+            start,
+            end,
+            per_day=per_day,
+            timezone=timezone,
+            now=datetime.now(tz=UTC),
         )
 
 
@@ -56,21 +138,18 @@ class CreateTaskUseCase:
         # Validate due_date
         TaskDomainService.validate_due_date(payload.due_date)
 
-        # Check deal exists and belongs to organization
-        deal = await self.deal_repository.get_by_id(
-            context.organization.organization_id,
-            payload.deal_id,
-        )
-        if deal is None:
-            raise DealNotFoundError(payload.deal_id)
-
-        deal_org_id = getattr(deal, "organization_id", context.organization.organization_id)
-        if deal_org_id != context.organization.organization_id:
-            raise TaskPermissionDeniedError("Deal belongs to another organization")
-
-        # Check permissions: member can only create tasks for their own deals
-        if context.organization.role == UserRole.MEMBER and deal.owner_id != context.user.id:
-            raise TaskPermissionDeniedError("You can only create tasks for your own deals")
+        # Check permissions: member can only create tasks for their own deals. Other roles
+        # need only the organization check the task insert performs itself; either way the
+        # deal is then known to the session, so the activity insert does not check it again
+        if context.organization.role == UserRole.MEMBER:
+            deal = await self.deal_repository.get_by_id(
+                context.organization.organization_id,
+                payload.deal_id,
+            )
+            if deal is None:
+                raise DealNotFoundError(payload.deal_id)
+            if deal.owner_id != context.user.id:
+                raise TaskPermissionDeniedError("You can only create tasks for your own deals")
 
         task = await self.repository.create(context.organization.organization_id, payload)
 
@@ -87,3 +166,162 @@ class CreateTaskUseCase:
             )
 
         return task
+
+
+class BulkCreateTasksUseCase:
+    """Use case for creating many tasks in one request."""
+
+    def __init__(
+        self,
+        repository: AbstractTaskRepository,
+        deal_repository: AbstractDealRepository,
+        activity_repository: AbstractActivityRepository | None = None,
+    ) -> None:
+        self.repository = repository
+        self.deal_repository = deal_repository
+        self.activity_repository = activity_repository
+
+    async def execute(
+        self, context: RequestContext, payloads: list[TaskCreate]
+    ) -> TaskBulkCreateResult:
+        """Apply the same rules as a single create to each task, then write in batches."""
+        organization_id = context.organization.organization_id
+        owners = await self.deal_repository.get_owner_ids(
+            organization_id, [payload.deal_id for payload in payloads]
+        )
+
+        accepted: list[TaskCreate] = []
+        errors: list[BulkItemError] = []
+        for index, payload in enumerate(payloads):
+            try:
+                TaskDomainService.validate_due_date(payload.due_date)
+                if payload.deal_id not in owners:
+                    raise DealNotFoundError(payload.deal_id)
+                if (
+                    context.organization.role == UserRole.MEMBER
+                    and owners[payload.deal_id] != context.user.id
+                ):
+                    raise TaskPermissionDeniedError("You can only create tasks for your own deals")
+            except DomainError as e:
+                errors.append(BulkItemError(index=index, detail=str(e)))
+            else:
+                accepted.append(payload)
+
+        created = await self.repository.create_many(organization_id, accepted)
+
+        if created and self.activity_repository is not None:
+            activities = [
+                (
+                    task.deal_id,
+                    ActivityCreate(
+                        type=ActivityType.TASK_CREATED,
+                        payload={"task_id": task.id, "task_title": task.title},
+                    ),
+                )
+                for task in created
+            ]
+            await self.activity_repository.create_many(organization_id, activities)
+
+        return TaskBulkCreateResult(created=created, errors=errors)
+
+
+class BulkCompleteTasksUseCase:
+    """Use case for marking many tasks as done at once."""
+
+    def __init__(self, repository: AbstractTaskRepository) -> None:
+        self.repository = repository
+
+    async def execute(self, context: RequestContext, payload: TaskBulkIds) -> TaskBulkUpdateResult:
+        changes = await self.repository.update_many(
+            context.organization.organization_id,
+            payload.ids,
+            is_done=True,
+            owner_id=_owner_scope(context),
+        )
+        return _bulk_update_result(payload.ids, changes)
+
+
+class BulkRescheduleTasksUseCase:
+    """Use case for moving many tasks to a new due date at once."""
+
+    def __init__(self, repository: AbstractTaskRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self, context: RequestContext, payload: TaskBulkReschedule
+    ) -> TaskBulkUpdateResult:
+        TaskDomainService.validate_due_date(payload.due_date)
+        changes = await self.repository.update_many(
+            context.organization.organization_id,
+            payload.ids,
+            due_date=payload.due_date,
+            owner_id=_owner_scope(context),
+        )
+        return _bulk_update_result(payload.ids, changes)
+
+
+class SendTaskRemindersUseCase:
+    """Records a reminder on the deal of each task that fell due; run by the worker."""
+
+    def __init__(
+        self,
+        repository: AbstractTaskRepository,
+        activity_repository: AbstractActivityRepository,
+        batch_size: int | None = None,
+        lookback_seconds: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.repository = repository
+        self.activity_repository = activity_repository
+        self.batch_size = (
+            batch_size if batch_size is not None else settings.task_reminder_batch_size
+        )
+        # Tasks overdue for longer than this when first seen are not reminded about
+        self.lookback_seconds = (
+            lookback_seconds
+            if lookback_seconds is not None
+            else settings.task_reminder_lookback_seconds
+        )
+
+    async def execute(self, now: datetime | None = None) -> list[TaskResponse]:
+        now = now or datetime.now(tz=UTC)
+        claimed = await self.repository.claim_due_reminders(
+            now - timedelta(seconds=self.lookback_seconds), now, self.batch_size
+        )
+
+        by_organization: defaultdict[int, list[tuple[int, ActivityCreate]]] = defaultdict(list)
+        for organization_id, task in claimed:
+            activity = ActivityCreate(
+                type=ActivityType.TASK_DUE,
+                payload={
+                    "task_id": task.id,
+                    "task_title": task.title,
+                    "due_date": task.due_date.isoformat() if task.due_date else None,
+                },
+            )
+            by_organization[organization_id].append((task.deal_id, activity))
+        for organization_id, items in by_organization.items():
+            await self.activity_repository.create_many(organization_id, items)
+
+        return [task for _organization_id, task in claimed]
+
+
+def _owner_scope(context: RequestContext) -> int | None:
+    """Members may only change tasks of their own deals."""
+    return context.user.id if context.organization.role == UserRole.MEMBER else None
+
+
+def _bulk_update_result(task_ids: list[int], changes: list[TaskChange]) -> TaskBulkUpdateResult:
+    outcomes = {change.id: change for change in changes}
+    updated: list[TaskResponse] = []
+    errors: list[BulkItemError] = []
+    for index, task_id in enumerate(task_ids):
+        change = outcomes.get(task_id)
+        if change is None:
+            errors.append(BulkItemError(index=index, detail=str(TaskNotFoundError(task_id))))
+        elif change.task is None:
+            detail = str(TaskPermissionDeniedError("You can only change tasks of your own deals"))
+            errors.append(BulkItemError(index=index, detail=detail))
+        else:
+            updated.append(change.task)
+    return TaskBulkUpdateResult(updated=updated, errors=errors)
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from mini_crm.shared.domain.exceptions import BusinessRuleViolationError, PermissionDeniedError
+from mini_crm.shared.domain.exceptions import (
+    BusinessRuleViolationError,
+    NotFoundError,
+    PermissionDeniedError,
+)
+
+
+class TaskNotFoundError(NotFoundError):
+    """Raised when a task is not found."""
+
+    def __init__(self, task_id: int | None = None) -> None:
+        super().__init__("Task", task_id)
+        self.task_id = task_id
 
 
 class TaskValidationError(BusinessRuleViolationError):
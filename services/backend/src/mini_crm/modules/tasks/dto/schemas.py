@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+
+from pydantic import Field, model_validator
 
 from mini_crm.shared.dto.base import DTO
+from mini_crm.shared.dto.bulk import BulkItemError
+from mini_crm.shared.dto.pagination import Cursor, CursorPaginationMeta
+
+# Newest first, as tasks have always been listed
+TASK_ORDER_CREATED_AT = "created_at"
+# Soonest due first; tasks without a due date come last
+TASK_ORDER_DUE_DATE = "due_date"
 
 
 class TaskCreate(DTO):
@@ -15,3 +24,85 @@ class TaskCreate(DTO):
 class TaskResponse(TaskCreate):
     id: int
     is_done: bool = False
+    created_at: datetime | None = None
+
+
+class PaginatedTasks(DTO):
+    items: list[TaskResponse]
+    meta: CursorPaginationMeta
+
+
+# Widest range one agenda request may span, and tasks listed per day at most
+TASK_AGENDA_MAX_DAYS = 62
+TASK_AGENDA_MAX_PER_DAY = 50
+
+
+class TaskAgendaDay(DTO):
+    """Task counts of one calendar day, with the day's earliest due tasks."""
+
+    day: date
+    open_count: int
+    done_count: int
+    overdue_count: int
+    tasks: list[TaskResponse]
+
+
+class TaskChange(DTO):
+    """Outcome of a guarded bulk update for a task that exists in the organization."""
+
+    id: int
+    # The task after the update, or None when the update was not allowed
+    task: TaskResponse | None
+
+
+MAX_BULK_TASKS = 1000
+
+
+class TaskBulkCreate(DTO):
+    items: list[TaskCreate] = Field(min_length=1, max_length=MAX_BULK_TASKS)
+
+
+class TaskBulkCreateResult(DTO):
+    """Created tasks in payload order, plus the items that were rejected."""
+
+    created: list[TaskResponse]
+    errors: list[BulkItemError]
+
+
+class TaskBulkIds(DTO):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_TASKS)
+
+    @model_validator(mode="after")
+    def check_unique(self) -> TaskBulkIds:
+        if len(set(self.ids)) != len(self.ids):
+            raise ValueError("Task ids must be unique")
+        return self
+
+
+class TaskBulkReschedule(TaskBulkIds):
+    due_date: datetime
+
+
+class TaskBulkUpdateResult(DTO):
+    """Updated tasks in payload order, plus the ids that were rejected."""
+
+    updated: list[TaskResponse]
+    errors: list[BulkItemError]
+
+
+class TaskCursor(Cursor):
+    """Position after the last task of a page, for the ordering it was produced with."""
+
+    order_by: str = TASK_ORDER_CREATED_AT
+    id: int
+    created_at: datetime | None = None
+    due_date: datetime | None = None
+
+    @classmethod
+    def from_task(cls, task: TaskResponse, order_by: str) -> TaskCursor:
+        return cls(
+            order_by=order_by,
+            id=task.id,
+            created_at=task.created_at if order_by == TASK_ORDER_CREATED_AT else None,
+            due_date=task.due_date if order_by == TASK_ORDER_DUE_DATE else None,
+        )
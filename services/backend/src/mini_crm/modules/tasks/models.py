@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from mini_crm.core.db import Base
@@ -10,11 +10,40 @@ from mini_crm.core.db import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    # Organization-scoped keyset indexes; is_done is included so the open filter is
+    # checked from the index while a page is read in order
+    __table_args__ = (
+        Index("ix_tasks_deal_done_due", "deal_id", "is_done", "due_date"),
+        Index(
+            "ix_tasks_org_created_at_id",
+            "organization_id",
+            "created_at",
+            "id",
+            postgresql_include=["is_done"],
+        ),
+        Index(
+            "ix_tasks_org_due_date_id",
+            "organization_id",
+            "due_date",
+            "id",
+            postgresql_include=["is_done"],
+        ),
+        # Open tasks still awaiting their due reminder; claimed rows leave the index
+        Index(
+            "ix_tasks_due_reminders",
+            "due_date",
+            postgresql_where=text("is_done = false AND reminded_at IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    deal_id: Mapped[int] = mapped_column(ForeignKey("deals.id", ondelete="CASCADE"), index=True)
+    # Copied from the deal so tenant-scoped reads need not join deals
+    organization_id: Mapped[int] = mapped_column(ForeignKey("organizations.id", ondelete="CASCADE"))
+    deal_id: Mapped[int] = mapped_column(ForeignKey("deals.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     due_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     is_done: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    # Set when the reminder worker claims the task once it falls due
+    reminded_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import defaultdict
+from datetime import UTC, date, datetime
+from typing import Any
+from zoneinfo import ZoneInfo
 
-from mini_crm.modules.tasks.dto.schemas import TaskCreate, TaskResponse
+from mini_crm.modules.tasks.dto.schemas import (
+    TASK_ORDER_CREATED_AT,
+    TASK_ORDER_DUE_DATE,
+    TaskAgendaDay,
+    TaskChange,
+    TaskCreate,
+    TaskCursor,
+    TaskResponse,
+)
 
 
 class AbstractTaskRepository(ABC):
@@ -15,17 +26,77 @@ class AbstractTaskRepository(ABC):
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
-    ) -> list[TaskResponse]:
+        *,
+        cursor: TaskCursor | None = None,
+        limit: int,
+        order_by: str = TASK_ORDER_CREATED_AT,
+    ) -> tuple[list[TaskResponse], bool]:
+        """Return up to ``limit`` tasks following ``cursor`` and whether more remain."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def agenda(
+        self,
+        organization_id: int,
+        start: datetime,
+        end: datetime,
+        *,
+        per_day: int,
+        timezone: str,
+        now: datetime,
+    ) -> list[TaskAgendaDay]:
+        """Count the tasks due in ``[start, end)`` per day in ``timezone``.
+
+        Each day lists its first ``per_day`` tasks by due date; days without tasks are
+        left out. Open tasks due before ``now`` count as overdue.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def create(self, organization_id: int, payload: TaskCreate) -> TaskResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(
+        self, organization_id: int, payloads: list[TaskCreate]
+    ) -> list[TaskResponse]:
+        """Insert tasks whose deals were already validated, preserving payload order."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_many(
+        self,
+        organization_id: int,
+        task_ids: list[int],
+        *,
+        is_done: bool | None = None,
+        due_date: datetime | None = None,
+        owner_id: int | None = None,
+    ) -> list[TaskChange]:
+        """Apply the given changes to the tasks (on deals of ``owner_id`` if given).
+
+        Returns an outcome for each requested task that exists in the organization;
+        ids missing from the result were not found.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_due_reminders(
+        self, due_after: datetime, now: datetime, limit: int
+    ) -> list[tuple[int, TaskResponse]]:
+        """Mark up to ``limit`` open tasks due in ``(due_after, now]`` as reminded.
+
+        Returns ``(organization_id, task)`` pairs. A task is claimed at most once, even
+        by concurrent callers.
+        """
+        raise NotImplementedError
+
 
 class InMemoryTaskRepository(AbstractTaskRepository):
     def __init__(self) -> None:
         self._tasks: list[TaskResponse] = []
+        self._organizations: dict[int, int] = {}
+        self._reminded: set[int] = set()
         self._counter = 0
 
     async def list_tasks(  # noqa: ARG002
@@ -35,7 +106,11 @@ class InMemoryTaskRepository(AbstractTaskRepository):
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
-    ) -> list[TaskResponse]:
+        *,
+        cursor: TaskCursor | None = None,
+        limit: int,
+        order_by: str = TASK_ORDER_CREATED_AT,
+    ) -> tuple[list[TaskResponse], bool]:
         tasks = self._tasks
         if deal_id is not None:
             tasks = [task for task in tasks if task.deal_id == deal_id]
@@ -45,10 +120,101 @@ class InMemoryTaskRepository(AbstractTaskRepository):
             tasks = [task for task in tasks if task.due_date and task.due_date <= due_before]
         if due_after is not None:
             tasks = [task for task in tasks if task.due_date and task.due_date >= due_after]
-        return tasks
 
-    async def create(self, organization_id: int, payload: TaskCreate) -> TaskResponse:  # noqa: ARG002
+        tasks = sorted(tasks, key=lambda task: _position(task, order_by))
+        if cursor is not None:
+            after = _position(cursor, order_by)
+            tasks = [task for task in tasks if _position(task, order_by) > after]
+        return tasks[:limit], len(tasks) > limit
+
+    async def agenda(
+        self,
+        organization_id: int,  # noqa: ARG002
+        start: datetime,
+        end: datetime,
+        *,
+        per_day: int,
+        timezone: str,
+        now: datetime,
+    ) -> list[TaskAgendaDay]:
+        zone = ZoneInfo(timezone)
+        by_day: defaultdict[date, list[TaskResponse]] = defaultdict(list)
+        for task in sorted(self._tasks, key=lambda task: _position(task, TASK_ORDER_DUE_DATE)):
+            if task.due_date is not None and start <= task.due_date < end:
+                by_day[task.due_date.astimezone(zone).date()].append(task)
+        return [
+            TaskAgendaDay(
+                day=day,
+                open_count=sum(not task.is_done for task in tasks),
+                done_count=sum(task.is_done for task in tasks),
+                overdue_count=sum(
+                    not task.is_done and task.due_date is not None and task.due_date < now
+                    for task in tasks
+                ),
+                tasks=tasks[:per_day],
+            )
+            for day, tasks in sorted(by_day.items())
+        ]
+
+    async def create(self, organization_id: int, payload: TaskCreate) -> TaskResponse:
         self._counter += 1
-        task = TaskResponse(id=self._counter, **payload.model_dump())
+        task = TaskResponse(
+            id=self._counter, created_at=datetime.now(tz=UTC), **payload.model_dump()
+        )
         self._tasks.append(task)
+        self._organizations[task.id] = organization_id
         return task
+
+    async def create_many(
+        self, organization_id: int, payloads: list[TaskCreate]
+    ) -> list[TaskResponse]:
+        return [await self.create(organization_id, payload) for payload in payloads]
+
+    async def update_many(
+        self,
+        organization_id: int,
+        task_ids: list[int],
+        *,
+        is_done: bool | None = None,
+        due_date: datetime | None = None,
+        owner_id: int | None = None,  # noqa: ARG002
+    ) -> list[TaskChange]:
+        # Deals are not tracked here, so deal ownership never blocks an update
+        requested = set(task_ids)
+        changes: dict[str, Any] = {}
+        if is_done is not None:
+            changes["is_done"] = is_done
+        if due_date is not None:
+            changes["due_date"] = due_date
+            self._reminded -= requested
+        outcomes = []
+        for position, task in enumerate(self._tasks):
+            if task.id in requested and self._organizations[task.id] == organization_id:
+                self._tasks[position] = task.model_copy(update=changes)
+                outcomes.append(TaskChange(id=task.id, task=self._tasks[position]))
+        return outcomes
+
+    async def claim_due_reminders(
+        self, due_after: datetime, now: datetime, limit: int
+    ) -> list[tuple[int, TaskResponse]]:
+        due = sorted(
+            (
+                task
+                for task in self._tasks
+                if not task.is_done
+                and task.id not in self._reminded
+                and task.due_date is not None
+                and due_after < task.due_date <= now
+            ),
+            key=lambda task: (task.due_date, task.id),
+        )[:limit]
+        self._reminded.update(task.id for task in due)
+        return [(self._organizations[task.id], task) for task in due]
+
+
+def _position(task: TaskResponse | TaskCursor, order_by: str) -> tuple[Any, ...]:
+    """Sort key mirroring the SQL orderings, so cursors compare the same way."""
+    if order_by == TASK_ORDER_DUE_DATE:
+        return (task.due_date is None, task.due_date or datetime.min.replace(tzinfo=UTC), task.id)
+    created_at = task.created_at or datetime.min.replace(tzinfo=UTC)
+    return (-created_at.timestamp(), -task.id)
@@ -1,13 +1,39 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    UnaryExpression,
+    and_,
+    bindparam,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from mini_crm.core.identity import verified_aggregates
 from mini_crm.modules.deals.domain.exceptions import DealNotFoundError
 from mini_crm.modules.deals.models import Deal
-from mini_crm.modules.tasks.dto.schemas import TaskCreate, TaskResponse
+from mini_crm.modules.tasks.dto.schemas import (
+    TASK_ORDER_CREATED_AT,
+    TASK_ORDER_DUE_DATE,
+    TaskAgendaDay,
+    TaskChange,
+    TaskCreate,
+    TaskCursor,
+    TaskResponse,
+)
 from mini_crm.modules.tasks.models import Task
 from mini_crm.modules.tasks.repositories.repository import AbstractTaskRepository
 
@@ -23,14 +49,12 @@ class SQLAlchemyTaskRepository(AbstractTaskRepository):
         only_open: bool = False,
         due_before: datetime | None = None,
         due_after: datetime | None = None,
-    ) -> list[TaskResponse]:
-        # Join with Deal to ensure tasks belong to organization
-        stmt = (
-            select(Task)
-            .join(Deal, Task.deal_id == Deal.id)
-            .where(Deal.organization_id == organization_id)
-            .order_by(Task.created_at.desc())
-        )
+        *,
+        cursor: TaskCursor | None = None,
+        limit: int,
+        order_by: str = TASK_ORDER_CREATED_AT,
+    ) -> tuple[list[TaskResponse], bool]:
+        stmt = select(Task).where(Task.organization_id == organization_id)
 
         if deal_id is not None:
             stmt = stmt.where(Task.deal_id == deal_id)
@@ -41,29 +65,236 @@ class SQLAlchemyTaskRepository(AbstractTaskRepository):
         if due_after is not None:
             stmt = stmt.where(Task.due_date.is_not(None), Task.due_date >= due_after)
 
+        # Fetch one extra row to learn whether another page follows
+        if cursor is not None and order_by == TASK_ORDER_DUE_DATE and cursor.due_date is not None:
+            stmt = _due_date_page_after(stmt, cursor, limit + 1)
+        else:
+            if cursor is not None:
+                stmt = stmt.where(_after(cursor, order_by))
+            stmt = stmt.order_by(*_ordering(order_by)).limit(limit + 1)
         result = await self.session.scalars(stmt)
         tasks = result.all()
 
-        return [TaskResponse.model_validate(task) for task in tasks]
+        items = [TaskResponse.model_validate(task) for task in tasks[:limit]]
+        return items, len(tasks) > limit
+
+    async def agenda(
+        self,
+        organization_id: int,
+        start: datetime,
+        end: datetime,
+        *,
+        per_day: int,
+        timezone: str,
+        now: datetime,
+    ) -> list[TaskAgendaDay]:
+        # Counts come from the (organization_id, due_date, id) index alone; each day's
+        # first tasks are then read by a short LIMIT scan of the same index
+        timezone_name = bindparam("timezone", timezone, type_=String)
+        day = func.date_trunc("day", func.timezone(timezone_name, Task.due_date)).label("day")
+        is_open = Task.is_done.is_(False)
+        days = (
+            select(
+                day,
+                func.count().filter(is_open).label("open_count"),
+                func.count().filter(Task.is_done.is_(True)).label("done_count"),
+                func.count().filter(is_open, Task.due_date < now).label("overdue_count"),
+            )
+            .where(
+                Task.organization_id == organization_id,
+                Task.due_date >= start,
+                Task.due_date < end,
+            )
+            .group_by(day)
+            .cte("days")
+        )
+        # Day boundaries are local midnights converted back to instants, clamped to the range
+        day_start = func.timezone(timezone_name, days.c.day)
+        day_end = func.timezone(timezone_name, days.c.day + timedelta(days=1))
+        first = (
+            select(Task)
+            .where(
+                Task.organization_id == organization_id,
+                Task.due_date >= func.greatest(day_start, literal(start, Task.due_date.type)),
+                Task.due_date < func.least(day_end, literal(end, Task.due_date.type)),
+            )
+            .order_by(Task.due_date, Task.id)
+            .limit(per_day)
+            .lateral("first")
+        )
+        task = aliased(Task, first, name="Task")
+        stmt = (
+            select(days.c.day, days.c.open_count, days.c.done_count, days.c.overdue_count, task)
+            .select_from(days)
+            .join(first, true())
+            .order_by(days.c.day, task.due_date, task.id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+
+        agenda: dict[datetime, TaskAgendaDay] = {}
+        for row in rows:
+            entry = agenda.get(row.day)
+            if entry is None:
+                entry = agenda[row.day] = TaskAgendaDay(
+                    day=row.day.date(),
+                    open_count=row.open_count,
+                    done_count=row.done_count,
+                    overdue_count=row.overdue_count,
+                    tasks=[],
+                )
+            entry.tasks.append(TaskResponse.model_validate(row.Task))
+        return list(agenda.values())
 
     async def create(self, organization_id: int, payload: TaskCreate) -> TaskResponse:
-        # Check if deal exists and belongs to organization
-        deal_stmt = select(Deal).where(
-            Deal.id == payload.deal_id,
-            Deal.organization_id == organization_id,
+        verified = verified_aggregates(self.session)
+        if verified.contains(Deal, organization_id, [payload.deal_id]):
+            (task,) = await self.create_many(organization_id, [payload])
+            return task
+
+        # INSERT ... SELECT from deals writes the task only if the deal belongs to the
+        # organization, so the ownership check costs no extra round-trip
+        source = select(
+            literal(organization_id, Task.organization_id.type),
+            Deal.id,
+            literal(payload.title, Task.title.type),
+            literal(payload.description, Task.description.type),
+            literal(payload.due_date, Task.due_date.type),
+            literal(False, Task.is_done.type),
+        ).where(Deal.id == payload.deal_id, Deal.organization_id == organization_id)
+        stmt = (
+            insert(Task)
+            .from_select(
+                ["organization_id", "deal_id", "title", "description", "due_date", "is_done"],
+                source,
+            )
+            .returning(Task)
         )
-        deal = await self.session.scalar(deal_stmt)
-        if deal is None:
+        task = await self.session.scalar(stmt)
+        if task is None:
             raise DealNotFoundError(payload.deal_id)
+        verified.add(Deal, organization_id, [payload.deal_id])
+        return TaskResponse.model_validate(task)
 
-        task = Task(
-            deal_id=payload.deal_id,
-            title=payload.title,
-            description=payload.description,
-            due_date=payload.due_date,
-            is_done=False,
+    async def create_many(
+        self, organization_id: int, payloads: list[TaskCreate]
+    ) -> list[TaskResponse]:
+        if not payloads:
+            return []
+        rows = [
+            {
+                "organization_id": organization_id,
+                "deal_id": payload.deal_id,
+                "title": payload.title,
+                "description": payload.description,
+                "due_date": payload.due_date,
+                "is_done": False,
+            }
+            for payload in payloads
+        ]
+        # Batched multi-row INSERT ... RETURNING; rows come back in parameter order
+        stmt = insert(Task).returning(Task, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, rows)
+        return [TaskResponse.model_validate(task) for task in result.all()]
+
+    async def update_many(
+        self,
+        organization_id: int,
+        task_ids: list[int],
+        *,
+        is_done: bool | None = None,
+        due_date: datetime | None = None,
+        owner_id: int | None = None,
+    ) -> list[TaskChange]:
+        if not task_ids:
+            return []
+        values: dict[str, Any] = {}
+        if is_done is not None:
+            values["is_done"] = is_done
+        if due_date is not None:
+            # A new due date earns a new reminder
+            values["due_date"] = due_date
+            values["reminded_at"] = None
+        requested = (Task.organization_id == organization_id, Task.id.in_(task_ids))
+        guarded = update(Task).where(*requested).values(values)
+        if owner_id is not None:
+            guarded = guarded.where(Task.deal_id == Deal.id, Deal.owner_id == owner_id)
+        updated = guarded.returning(*Task.__table__.columns).cte("updated")
+        # The outer SELECT reads the snapshot from before the UPDATE, so tasks that were
+        # kept are still reported and the caller can tell them from missing ones
+        task = aliased(Task, updated)
+        stmt = select(Task.id, task).outerjoin(task, task.id == Task.id).where(*requested)
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            TaskChange(
+                id=task_id,
+                task=TaskResponse.model_validate(changed) if changed is not None else None,
+            )
+            for task_id, changed in rows
+        ]
+
+    async def claim_due_reminders(
+        self, due_after: datetime, now: datetime, limit: int
+    ) -> list[tuple[int, TaskResponse]]:
+        # Rows locked by another worker's open claim are skipped rather than waited on,
+        # so replicas take disjoint batches; reminded_at then drops the claimed rows
+        # from the partial due-reminder index
+        due = (
+            select(Task.id)
+            .where(
+                Task.is_done == False,  # noqa: E712 - matches the partial index predicate
+                Task.reminded_at.is_(None),
+                Task.due_date > due_after,
+                Task.due_date <= now,
+            )
+            .order_by(Task.due_date)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("due")
+            .prefix_with("MATERIALIZED")
         )
-        self.session.add(task)
-        await self.session.flush()
-        await self.session.refresh(task)
-        return TaskResponse.model_validate(task)
+        stmt = (
+            update(Task)
+            .where(Task.id == due.c.id)
+            .values(reminded_at=now)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.scalars(stmt)
+        tasks = sorted(result.all(), key=lambda task: (task.due_date, task.id))
+        return [(task.organization_id, TaskResponse.model_validate(task)) for task in tasks]
+
+
+def _ordering(order_by: str) -> list[UnaryExpression[Any]]:
+    """Sort column plus ``id`` as a tiebreaker so pages never overlap or skip rows.
+
+    Both orderings are read straight off the organization's ``(created_at, id)`` and
+    ``(due_date, id)`` index ranges; ascending ``due_date`` puts tasks without a due date
+    last, as the index does.
+    """
+    if order_by == TASK_ORDER_DUE_DATE:
+        return [Task.due_date.asc(), Task.id.asc()]
+    return [Task.created_at.desc(), Task.id.desc()]
+
+
+def _after(cursor: TaskCursor, order_by: str) -> ColumnElement[bool]:
+    if order_by == TASK_ORDER_DUE_DATE:
+        # Past the last dated task only undated ones remain, in id order
+        return and_(Task.due_date.is_(None), Task.id > cursor.id)
+    position = tuple_(Task.created_at, Task.id)
+    return position < tuple_(literal(cursor.created_at, Task.created_at.type), literal(cursor.id))
+
+
+def _due_date_page_after(stmt: Select[Any], cursor: TaskCursor, size: int) -> Select[Any]:
+    """Read the dated tasks after ``cursor`` and then the undated ones.
+
+    ``(due_date, id) > bound OR due_date IS NULL`` cannot be answered by one ordered
+    index range, so each half is read as its own limited range scan and the two short
+    results are merged.
+    """
+    ordering = _ordering(TASK_ORDER_DUE_DATE)
+    bound = tuple_(literal(cursor.due_date, Task.due_date.type), literal(cursor.id))
+    dated = stmt.where(tuple_(Task.due_date, Task.id) > bound).order_by(*ordering).limit(size)
+    undated = stmt.where(Task.due_date.is_(None)).order_by(*ordering).limit(size)
+    page = union_all(dated, undated).subquery("page")
+    task = aliased(Task, page)
+    return select(task).order_by(task.due_date.asc(), task.id.asc()).limit(size)
@@ -29,4 +29,5 @@ class ActivityType(str, Enum):
     STATUS_CHANGED = "status_changed"
     STAGE_CHANGED = "stage_changed"
     TASK_CREATED = "task_created"
+    TASK_DUE = "task_due"
     SYSTEM = "system"
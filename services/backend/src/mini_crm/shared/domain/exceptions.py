@@ -32,6 +32,13 @@ class ValidationError(DomainException):
     pass
 
 
+class InvalidCursorError(ValidationError):
+    """Raised when a pagination cursor cannot be decoded or does not fit the request."""
+
+    def __init__(self, message: str = "Invalid pagination cursor") -> None:
+        super().__init__(message)
+
+
 class BusinessRuleViolationError(DomainException):
     """Raised when a business rule is violated."""
 
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from mini_crm.shared.dto.base import DTO
+
+
+class BulkItemError(DTO):
+    """Failure of a single item in a bulk request, by its position in the payload."""
+
+    index: int
+    detail: str
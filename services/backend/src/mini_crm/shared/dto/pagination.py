@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import base64
+import binascii
+from typing import Self
+
+from pydantic import ConfigDict
+
+from mini_crm.shared.domain.exceptions import InvalidCursorError
 from mini_crm.shared.dto.base import DTO
 
 
@@ -9,6 +16,39 @@ class PaginationMeta(DTO):
     total: int
 
 
+class CursorPaginationMeta(DTO):
+    """Pagination metadata for listings that support both page numbers and cursors.
+
+    ``total`` is only set when requested; ``has_more`` and ``next_cursor`` tell
+    whether more rows follow the returned page without needing it.
+    """
+
+    page: int | None = None
+    page_size: int
+    total: int | None = None
+    has_more: bool = False
+    next_cursor: str | None = None
+
+
 class PaginatedResponse(DTO):
     items: list[object]
     meta: PaginationMeta
+
+
+class Cursor(DTO):
+    """Opaque keyset cursor serialized as URL-safe base64 JSON."""
+
+    model_config = ConfigDict(frozen=True)
+
+    def encode(self) -> str:
+        raw = self.model_dump_json(exclude_none=True).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        padded = token + "=" * (-len(token) % 4)
+        try:
+            raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+            return cls.model_validate_json(raw)
+        except (ValueError, binascii.Error) as exc:
+            raise InvalidCursorError() from exc
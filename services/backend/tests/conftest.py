@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import os
 from collections.abc import AsyncGenerator
+from typing import Any
+from urllib.parse import urlsplit
 
+import pytest
 import pytest_asyncio
+import redis.asyncio as redis
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -13,12 +18,14 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from mini_crm.app.main import app
+from mini_crm.config.settings import get_settings
 from mini_crm.core.cache import RedisCache
 from mini_crm.core.db import Base
-from mini_crm.core.dependencies import get_db_session
+from mini_crm.core.dependencies import get_db_session, get_db_session_factory
 from mini_crm.modules.activities import models as activities_models  # noqa: F401
 from mini_crm.modules.auth import models as auth_models  # noqa: F401
 from mini_crm.modules.contacts import models as contacts_models  # noqa: F401
+from mini_crm.modules.contacts.services.suggest_index import ContactSuggestIndex
 from mini_crm.modules.deals import models as deals_models  # noqa: F401
 from mini_crm.modules.organizations import models as organizations_models  # noqa: F401
 from mini_crm.modules.tasks import models as tasks_models  # noqa: F401
@@ -33,12 +40,73 @@ async def async_engine() -> AsyncGenerator[AsyncEngine, None]:
     engine = create_async_engine(database_url, future=True)
 
     async with engine.begin() as conn:
+        # Contact search indexes use pg_trgm operator classes
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
     yield engine
     await engine.dispose()
 
 
+class QueryCounter:
+    """Records SQL statements sent to the database while active."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self) -> None:
+        self.statements.clear()
+
+    def __call__(self, _conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        self.statements.append(statement)
+
+
+@pytest_asyncio.fixture
+async def query_counter(async_engine: AsyncEngine) -> AsyncGenerator[QueryCounter, None]:
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
+
+
+# Redis database the tests run against, so flushing it never touches the app's keys
+TEST_REDIS_DB = 15
+
+
+def redis_test_url() -> str:
+    """TEST_REDIS_URL if set, else the configured Redis server with database TEST_REDIS_DB."""
+    explicit = os.getenv("TEST_REDIS_URL")
+    if explicit:
+        return explicit
+    return urlsplit(get_settings().redis_url)._replace(path=f"/{TEST_REDIS_DB}").geturl()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def redis_cache(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[RedisCache, None]:
+    """Point the cache at the test Redis database and start each test with it empty."""
+    url = redis_test_url()
+    if url == get_settings().redis_url:
+        raise ValueError("TEST_REDIS_URL must differ from REDIS_URL; the tests flush it")
+    cache = RedisCache.get_instance()
+    await cache.close()
+    monkeypatch.setattr(get_settings(), "redis_url", url)
+
+    client = redis.from_url(url)
+    try:
+        await client.flushdb()
+    except Exception:
+        pass  # Ignore cache errors in tests
+    finally:
+        await client.aclose()
+    yield cache
+    # Pooled connections belong to this test's event loop
+    await cache.close()
+
+
 @pytest_asyncio.fixture
 async def session_factory(
     async_engine: AsyncEngine,
@@ -67,16 +135,12 @@ async def api_client(
                 await session.rollback()
                 raise
 
-    # Clear cache before each test
-    cache = RedisCache.get_instance()
-    try:
-        await cache.delete("analytics:deals:summary:1")
-        await cache.delete("analytics:deals:funnel:1")
-    except Exception:
-        pass  # Ignore cache errors in tests
+    ContactSuggestIndex.get_instance().clear()
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_db_session_factory] = lambda: session_factory
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
     app.dependency_overrides.pop(get_db_session, None)
+    app.dependency_overrides.pop(get_db_session_factory, None)
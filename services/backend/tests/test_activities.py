@@ -3,12 +3,16 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 import pytest
+from conftest import QueryCounter
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from mini_crm.core.security import create_access_token
+from mini_crm.modules.activities.dto.schemas import ActivityCreate
+from mini_crm.modules.activities.repositories.sqlalchemy import SQLAlchemyActivityRepository
 from mini_crm.modules.auth.models import OrganizationMember, User
 from mini_crm.modules.contacts.models import Contact
+from mini_crm.modules.deals.domain.exceptions import DealNotFoundError
 from mini_crm.modules.deals.models import Deal
 from mini_crm.modules.organizations.models import Organization
 from mini_crm.shared.enums import ActivityType, DealStage, DealStatus, UserRole
@@ -182,3 +186,52 @@ async def test_create_activity_rejects_non_comment_types(
     )
     assert response.status_code == 400
     assert "Only comment activities can be created via API" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_activity_repository_create_many(db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    repository = SQLAlchemyActivityRepository(session=db_session)
+
+    created = await repository.create_many(
+        1,
+        [
+            (1, ActivityCreate(type=ActivityType.COMMENT, payload={"text": "first"})),
+            (1, ActivityCreate(type=ActivityType.STATUS_CHANGED, payload=None)),
+        ],
+        author_id=1,
+    )
+    assert [activity.type for activity in created] == [
+        ActivityType.COMMENT,
+        ActivityType.STATUS_CHANGED,
+    ]
+    assert created[0].payload == {"text": "first"}
+    assert all(activity.author_id == 1 for activity in created)
+
+    # Deals of other organizations are rejected
+    with pytest.raises(DealNotFoundError):
+        await repository.create_many(2, [(1, ActivityCreate(payload={"text": "x"}))])
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_activity_repository_create_is_single_statement(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    repository = SQLAlchemyActivityRepository(session=db_session)
+
+    query_counter.reset()
+    created = await repository.create(
+        organization_id=1,
+        deal_id=1,
+        payload=ActivityCreate(type=ActivityType.COMMENT, payload={"text": "hi"}),
+        author_id=1,
+    )
+
+    # Deal ownership is checked inside the INSERT ... SELECT ... RETURNING
+    assert query_counter.count == 1
+    assert created.id is not None
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from mini_crm.app.worker import AnalyticsWorker
+from mini_crm.config.settings import get_settings
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.fx import FxRateRegistry, FxRateTable
 from mini_crm.core.security import create_access_token
 from mini_crm.modules.analytics.repositories.sqlalchemy import SQLAlchemyAnalyticsRepository
 from mini_crm.modules.auth.models import OrganizationMember, User
@@ -73,6 +79,7 @@ async def seed_deal(
     stage: DealStage = DealStage.QUALIFICATION,
     amount: Decimal = Decimal("1000.00"),
     created_at: datetime | None = None,
+    currency: str = "USD",
 ) -> Deal:
     if created_at is None:
         created_at = datetime.now(tz=UTC)
@@ -82,7 +89,7 @@ async def seed_deal(
         owner_id=owner_id,
         title="Test Deal",
         amount=amount,
-        currency="USD",
+        currency=currency,
         status=status,
         stage=stage,
         created_at=created_at,
@@ -419,3 +426,306 @@ async def test_analytics_api_funnel(api_client: AsyncClient, db_session: AsyncSe
     assert (
         qualification["total"] == 1
     )  # Cumulative: 1 in Qualification (and no deals in later stages)
+
+
+@pytest.mark.asyncio
+async def test_deals_summary_breaks_down_by_currency(db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("100.00"),
+        currency="USD",
+    )
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("200.00"),
+        currency="EUR",
+    )
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.NEW,
+        amount=Decimal("50.00"),
+        currency="EUR",
+    )
+
+    repository = SQLAlchemyAnalyticsRepository(session=db_session)
+    summary = await repository.deals_summary(organization_id=1)
+
+    assert summary.total_deals == 3
+    assert summary.normalized is None
+    by_currency = {item.currency: item for item in summary.by_currency}
+    assert set(by_currency) == {"EUR", "USD"}
+    assert by_currency["EUR"].total_deals == 2
+    assert by_currency["EUR"].amounts_by_status.won == Decimal("200.00")
+    assert by_currency["EUR"].amounts_by_status.new == Decimal("50.00")
+    assert by_currency["USD"].deals_by_status.won == 1
+    assert by_currency["USD"].amounts_by_status.won == Decimal("100.00")
+
+
+@pytest.mark.asyncio
+async def test_deals_summary_normalizes_with_fx_rates(db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("100.00"),
+        currency="USD",
+    )
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("200.00"),
+        currency="EUR",
+    )
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("999.00"),
+        currency="JPY",
+    )
+
+    table = FxRateTable.build("USD", {"EUR": "1.10"})
+    repository = SQLAlchemyAnalyticsRepository(session=db_session)
+    summary = await repository.deals_summary(
+        organization_id=1, conversion=table.conversion_to("USD")
+    )
+
+    assert summary.normalized is not None
+    assert summary.normalized.currency == "USD"
+    assert summary.normalized.fx_version == table.version
+    assert summary.normalized.amounts_by_status.won == Decimal("320.00")
+    assert summary.normalized.unconverted_currencies == ["JPY"]
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_fx_rates_and_normalized_summary(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("100.00"),
+        currency="EUR",
+    )
+
+    rates_file = tmp_path / "fx_rates.json"
+    rates_file.write_text(json.dumps({"base": "USD", "rates": {"EUR": "1.20"}}))
+    monkeypatch.setattr(get_settings(), "fx_rates_file", str(rates_file))
+    registry = FxRateRegistry.get_instance()
+    registry.reset()
+    try:
+        rates_response = await api_client.get("/api/v1/analytics/fx-rates", headers=HEADERS)
+        assert rates_response.status_code == 200
+        assert Decimal(rates_response.json()["rates"]["EUR"]) == Decimal("1.20")
+        version = rates_response.json()["version"]
+
+        response = await api_client.get(
+            "/api/v1/analytics/deals/summary",
+            params={"normalize_to": "USD"},
+            headers=HEADERS,
+        )
+        assert response.status_code == 200
+        normalized = response.json()["normalized"]
+        assert normalized["fx_version"] == version
+        assert Decimal(normalized["amounts_by_status"]["won"]) == Decimal("120.00")
+
+        unknown_response = await api_client.get(
+            "/api/v1/analytics/deals/summary",
+            params={"normalize_to": "GBP"},
+            headers=HEADERS,
+        )
+        assert unknown_response.status_code == 400
+    finally:
+        registry.reset()
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_fx_rates_cannot_be_changed_by_tenants(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    # The table is shared by all organizations, so not even owners may replace it
+    response = await api_client.put(
+        "/api/v1/analytics/fx-rates",
+        json={"base_currency": "USD", "rates": {"EUR": "1.20"}},
+        headers=HEADERS,
+    )
+    assert response.status_code == 405
+
+
+async def seed_user(session: AsyncSession, user_id: int, email: str) -> None:
+    session.add(
+        User(
+            id=user_id,
+            email=email,
+            hashed_password="hashed",
+            name=email.split("@")[0],
+            created_at=datetime.now(tz=UTC),
+        )
+    )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_deals_by_owner_groups_and_sorts(db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    await seed_user(db_session, user_id=2, email="seller@example.com")
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    for status, amount in [
+        (DealStatus.WON, Decimal("1000.00")),
+        (DealStatus.LOST, Decimal("500.00")),
+        (DealStatus.NEW, Decimal("300.00")),
+    ]:
+        await seed_deal(
+            db_session, organization_id=1, contact_id=1, owner_id=1, status=status, amount=amount
+        )
+    for status, amount in [
+        (DealStatus.WON, Decimal("4000.00")),
+        (DealStatus.IN_PROGRESS, Decimal("700.00")),
+    ]:
+        await seed_deal(
+            db_session, organization_id=1, contact_id=1, owner_id=2, status=status, amount=amount
+        )
+    # Amounts in other currencies are converted, or reported when no rate is known
+    for currency, amount in [("EUR", Decimal("100.00")), ("JPY", Decimal("9999.00"))]:
+        await seed_deal(
+            db_session,
+            organization_id=1,
+            contact_id=1,
+            owner_id=1,
+            status=DealStatus.WON,
+            amount=amount,
+            currency=currency,
+        )
+
+    conversion = FxRateTable.build("USD", {"EUR": "1.10"}).conversion_to("USD")
+    repository = SQLAlchemyAnalyticsRepository(session=db_session)
+    items, total = await repository.deals_by_owner(1, conversion, page=1, page_size=10)
+
+    assert total == 2
+    assert [item.owner_id for item in items] == [2, 1]
+    seller, owner = items
+    assert seller.won_amount == Decimal("4000.00")
+    assert seller.open_pipeline == Decimal("700.00")
+    assert seller.win_rate_percent == 100.0
+    assert seller.unconverted_currencies == []
+    assert owner.total_deals == 5
+    assert owner.open_deals == 1
+    assert owner.won_amount == Decimal("1110.00")
+    assert owner.unconverted_currencies == ["JPY"]
+
+    items, total = await repository.deals_by_owner(
+        1, conversion, page=2, page_size=1, order_by="total_deals", order="desc"
+    )
+    assert total == 2
+    assert [item.owner_id for item in items] == [2]
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_deals_by_owner(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(
+        db_session,
+        organization_id=1,
+        contact_id=1,
+        owner_id=1,
+        status=DealStatus.WON,
+        amount=Decimal("2500.00"),
+    )
+
+    response = await api_client.get("/api/v1/analytics/deals/by-owner", headers=HEADERS)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["currency"] == "USD"
+    assert data["meta"] == {"page": 1, "page_size": 20, "total": 1}
+    assert data["items"][0]["owner_id"] == 1
+    assert data["items"][0]["won_amount"] == "2500.00"
+    assert data["items"][0]["win_rate_percent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_deals_by_owner_forbidden_for_member(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1, role=UserRole.MEMBER)
+
+    response = await api_client.get("/api/v1/analytics/deals/by-owner", headers=HEADERS)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_analytics_worker_refreshes_dirty_active_organizations(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    # Reading analytics marks the organization active and caches an empty summary
+    response = await api_client.get("/api/v1/analytics/deals/summary", headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()["total_deals"] == 0
+
+    worker = AnalyticsWorker(session_factory, RedisCache.get_instance())
+    assert await worker.run_once() == []
+
+    # Creating a deal marks the organization dirty; the worker then rewrites the cache
+    response = await api_client.post(
+        "/api/v1/deals",
+        json={"contact_id": 1, "title": "Deal", "amount": "100.00", "currency": "USD"},
+        headers=HEADERS,
+    )
+    assert response.status_code == 201
+    assert await worker.run_once() == [1]
+    assert await worker.run_once() == []
+
+    response = await api_client.get("/api/v1/analytics/deals/summary", headers=HEADERS)
+    assert response.json()["total_deals"] == 1
+    response = await api_client.get("/api/v1/analytics/deals/funnel", headers=HEADERS)
+    assert next(s for s in response.json()["stages"] if s["stage"] == "qualification")["total"] == 1
+
+    assert await worker.run_once(refresh_all=True) == [1]
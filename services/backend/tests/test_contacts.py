@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
+from conftest import QueryCounter
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from mini_crm.app.worker import ContactDuplicateWorker
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.importing import CsvRecordTooLargeError, split_csv_records
 from mini_crm.core.security import create_access_token
 from mini_crm.modules.auth.models import OrganizationMember, User
-from mini_crm.modules.contacts.dto.schemas import ContactCreate
+from mini_crm.modules.contacts.domain.services import ContactDomainService
+from mini_crm.modules.contacts.dto.schemas import (
+    ContactCreate,
+    ContactCursor,
+    ContactDealAmounts,
+    ContactDuplicatePair,
+    ContactSuggestion,
+)
 from mini_crm.modules.contacts.models import Contact
 from mini_crm.modules.contacts.repositories.sqlalchemy import SQLAlchemyContactRepository
+from mini_crm.modules.contacts.services.suggest_index import (
+    ContactSuggestIndex,
+    OrganizationSuggestIndex,
+)
 from mini_crm.modules.deals.models import Deal
 from mini_crm.modules.organizations.models import Organization
 from mini_crm.shared.enums import DealStage, DealStatus, UserRole
@@ -81,6 +99,23 @@ async def test_sqlalchemy_contact_repository(db_session: AsyncSession) -> None:
     assert items[0].name == "John"
 
 
+@pytest.mark.asyncio
+async def test_sqlalchemy_contact_repository_create_is_single_statement(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+
+    query_counter.reset()
+    created = await repository.create(
+        organization_id=1, owner_id=1, payload=ContactCreate(name="John", email="j@example.com")
+    )
+
+    # The generated id comes back through INSERT ... RETURNING
+    assert query_counter.count == 1
+    assert created.id == 1
+
+
 @pytest.mark.asyncio
 async def test_contact_crud_flow(api_client: AsyncClient, db_session: AsyncSession) -> None:
     await seed_user_and_org(db_session)
@@ -389,3 +424,712 @@ async def test_list_contacts_owner_filter_forbidden_for_member(
     )
     assert response.status_code == 403
     assert "Filtering by owner_id is not allowed for member role" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_without_total_reports_has_more(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    for index in range(3):
+        await api_client.post(
+            "/api/v1/contacts",
+            json={"name": f"Contact {index}", "email": f"c{index}@example.com"},
+            headers=HEADERS,
+        )
+
+    response = await api_client.get(
+        "/api/v1/contacts",
+        params={"include_total": "false", "page_size": 2},
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    meta = response.json()["meta"]
+    assert meta["total"] is None
+    assert meta["has_more"] is True
+
+    response = await api_client.get(
+        "/api/v1/contacts",
+        params={"page_size": 2, "page": 2},
+        headers=HEADERS,
+    )
+    meta = response.json()["meta"]
+    assert meta["total"] == 3
+    assert meta["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_export_contacts_streams_all_matching_rows(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    for name in ["Alice", "Bob", "Alina"]:
+        await api_client.post(
+            "/api/v1/contacts",
+            json={"name": name, "email": f"{name.lower()}@example.com"},
+            headers=HEADERS,
+        )
+
+    response = await api_client.get("/api/v1/contacts/export?search=ali", headers=HEADERS)
+    assert response.status_code == 200
+    header, *rows = response.text.splitlines()
+    assert header == "name,email,phone,id,owner_id"
+    assert rows == ["Alice,alice@example.com,,1,1", "Alina,alina@example.com,,3,1"]
+
+    response = await api_client.get("/api/v1/contacts/export?format=ndjson", headers=HEADERS)
+    assert response.status_code == 200
+    names = [json.loads(line)["name"] for line in response.text.splitlines()]
+    assert names == ["Alice", "Bob", "Alina"]
+
+
+@pytest.mark.asyncio
+async def test_import_contacts_from_csv(api_client: AsyncClient, db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await api_client.post(
+        "/api/v1/contacts",
+        json={"name": "Existing", "email": "taken@example.com"},
+        headers=HEADERS,
+    )
+
+    body = (
+        "Name,Email,Phone,Notes\n"
+        "Alice,alice@example.com,+1,first\n"
+        '"Smith, Bob",,+2,\n'
+        "Broken,not-an-email,,\n"
+        "Taken,TAKEN@example.com,,\n"
+        ",nobody@example.com,,\n"
+        "Alice Again,Alice@Example.com,,\n"
+        "Carol,carol@example.com,,\n"
+    )
+    response = await api_client.post(
+        "/api/v1/contacts/import",
+        content=body.encode(),
+        headers={**HEADERS, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["processed"] == 7
+    assert result["imported"] == 3
+    assert result["failed"] == 4
+    assert sorted(error["index"] for error in result["errors"]) == [2, 3, 4, 5]
+
+    list_response = await api_client.get("/api/v1/contacts", headers=HEADERS)
+    names = [item["name"] for item in list_response.json()["items"]]
+    assert names == ["Existing", "Alice", "Smith, Bob", "Carol"]
+
+
+@pytest.mark.asyncio
+async def test_import_contacts_deduplicates_across_batches(db_session: AsyncSession) -> None:
+    from mini_crm.modules.common.application.context import (
+        OrganizationContext,
+        RequestContext,
+        RequestUser,
+    )
+    from mini_crm.modules.contacts.application.use_cases import ImportContactsUseCase
+
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+    use_case = ImportContactsUseCase(repository=repository, batch_size=2)
+    context = RequestContext(
+        user=RequestUser(id=1, email="owner@example.com"),
+        organization=OrganizationContext(organization_id=1, role=UserRole.OWNER),
+    )
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"name,email\nA,a@example.com\nB,b@exa"
+        yield b"mple.com\nC,A@example.com\nD,d@example.com\n"
+
+    result = await use_case.execute(context, chunks())
+
+    assert (result.processed, result.imported, result.failed) == (4, 3, 1)
+    assert result.errors[0].index == 2
+    assert await repository.count(1) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_contacts_requires_name_column(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    response = await api_client.post(
+        "/api/v1/contacts/import",
+        content=b"email\na@example.com\n",
+        headers={**HEADERS, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_contacts_reports_malformed_records(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    body = (
+        'name,email\n5" tv,z@z.com\n"Broken"x,x@example.com\nBob,b@b.com\n"Multi\nline",m@m.com\n'
+    )
+    response = await api_client.post(
+        "/api/v1/contacts/import",
+        content=body.encode(),
+        headers={**HEADERS, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["processed"], result["imported"], result["failed"]) == (4, 3, 1)
+    assert result["errors"][0]["index"] == 1
+    list_response = await api_client.get("/api/v1/contacts", headers=HEADERS)
+    names = [item["name"] for item in list_response.json()["items"]]
+    assert names == ['5" tv', "Bob", "Multi\nline"]
+
+
+@pytest.mark.asyncio
+async def test_split_csv_records_caps_an_unterminated_quote() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b'name,email\n"Never closed,a@example.com\n'
+        for _ in range(10):
+            yield b"more,b@example.com\n"
+
+    records = split_csv_records(chunks(), max_record_chars=100)
+    assert await anext(records) == "name,email\n"
+    with pytest.raises(CsvRecordTooLargeError):
+        await anext(records)
+
+
+@pytest.mark.asyncio
+async def test_contact_search_ranks_by_similarity(db_session: AsyncSession) -> None:
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+    for name in ["Malice Corporation", "Bob", "Alice", "Alicent Hightower"]:
+        await repository.create(organization_id=1, owner_id=1, payload=ContactCreate(name=name))
+
+    items, total = await repository.list(organization_id=1, page=1, page_size=10, search="alice")
+
+    assert total == 3
+    assert [item.name for item in items] == ["Alice", "Alicent Hightower", "Malice Corporation"]
+
+
+def test_organization_suggest_index_matches_name_words_and_email() -> None:
+    index = OrganizationSuggestIndex.build(
+        [
+            ContactSuggestion(id=1, name="Alice Smith", email="alice@example.com"),
+            ContactSuggestion(id=2, name="Bob Alison", email="bob@example.com"),
+            ContactSuggestion(id=3, name="Carol", email="smithy@example.com"),
+        ],
+        version=0,
+    )
+
+    assert [item.id for item in index.search("ali", 10)] == [1, 2]
+    assert [item.id for item in index.search("SMITH", 10)] == [1, 3]
+    assert [item.id for item in index.search("ali", 1)] == [1]
+
+    index.remove(1)
+    index.add(ContactSuggestion(id=4, name="Alina", email=None))
+
+    assert [item.id for item in index.search("ali", 10)] == [4, 2]
+    assert index.search("alice", 10) == []
+
+
+def test_contact_suggest_index_evicts_least_recently_used() -> None:
+    suggest_index = ContactSuggestIndex.get_instance()
+    suggest_index.clear()
+    max_entries = suggest_index.max_entries
+    suggest_index.max_entries = 6
+    try:
+        suggest_index.put(1, [ContactSuggestion(id=1, name="Ann Lee")], version=0)
+        suggest_index.put(2, [ContactSuggestion(id=2, name="Bo Chu")], version=0)
+        assert suggest_index.get(1, version=0) is not None
+
+        suggest_index.put(3, [ContactSuggestion(id=3, name="Cy")], version=0)
+
+        assert suggest_index.get(2, version=0) is None
+        assert suggest_index.get(1, version=0) is not None
+        assert suggest_index.size == 4
+        # A newer version means another process changed the organization
+        assert suggest_index.get(1, version=1) is None
+        assert suggest_index.size == 1
+    finally:
+        suggest_index.max_entries = max_entries
+        suggest_index.clear()
+
+
+@pytest.mark.asyncio
+async def test_suggest_contacts_tracks_creates_and_deletes(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    for name, email in [("Alice Smith", "alice@example.com"), ("Bob Alison", None)]:
+        await api_client.post(
+            "/api/v1/contacts", json={"name": name, "email": email}, headers=HEADERS
+        )
+
+    response = await api_client.get("/api/v1/contacts/suggest?q=Ali", headers=HEADERS)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Alice Smith", "Bob Alison"]
+
+    created = await api_client.post(
+        "/api/v1/contacts", json={"name": "Alfred Ali"}, headers=HEADERS
+    )
+    await api_client.delete("/api/v1/contacts/1", headers=HEADERS)
+
+    response = await api_client.get("/api/v1/contacts/suggest?q=ali", headers=HEADERS)
+    assert [item["id"] for item in response.json()] == [created.json()["id"], 2]
+
+
+@pytest.mark.asyncio
+async def test_contact_write_bumps_suggest_version_after_commit(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    from mini_crm.app.main import app
+    from mini_crm.modules.contacts.api.router import get_contact_suggestion_tracker
+    from mini_crm.modules.contacts.application.suggestions import ContactSuggestionTracker
+
+    committed_contacts: list[int] = []
+
+    class RecordingTracker(ContactSuggestionTracker):
+        async def _bump(self, organization_id: int) -> int | None:
+            # A fresh session only sees the write once the request has committed
+            async with session_factory() as session:
+                committed_contacts.append(await session.scalar(select(func.count(Contact.id))) or 0)
+            return await super()._bump(organization_id)
+
+    app.dependency_overrides[get_contact_suggestion_tracker] = lambda: RecordingTracker(
+        RedisCache.get_instance(), ContactSuggestIndex.get_instance()
+    )
+    try:
+        await seed_user_and_org(db_session)
+        await seed_organization_member(db_session, user_id=1, organization_id=1)
+        cache = RedisCache.get_instance()
+
+        response = await api_client.post("/api/v1/contacts", json={"name": "Ann"}, headers=HEADERS)
+        assert response.status_code == 201
+        response = await api_client.post(
+            "/api/v1/contacts/bulk/delete", json={"ids": [response.json()["id"]]}, headers=HEADERS
+        )
+        assert response.status_code == 200
+        assert committed_contacts == [1, 0]
+        assert await cache.get("contacts:suggest:version:1") == b"2"
+
+        # A rejected write leaves the version alone
+        response = await api_client.delete("/api/v1/contacts/99", headers=HEADERS)
+        assert response.status_code == 404
+        assert committed_contacts == [1, 0]
+    finally:
+        app.dependency_overrides.pop(get_contact_suggestion_tracker, None)
+
+
+@pytest.mark.asyncio
+async def test_suggest_contacts_rebuilds_after_change_in_another_process(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await api_client.get("/api/v1/contacts/suggest?q=zo", headers=HEADERS)
+
+    # Written by another process: the shared version moves, this process' index does not
+    db_session.add(
+        Contact(organization_id=1, owner_id=1, name="Zoe", created_at=datetime.now(tz=UTC))
+    )
+    await db_session.commit()
+    await RedisCache.get_instance().incr("contacts:suggest:version:1")
+
+    response = await api_client.get("/api/v1/contacts/suggest?q=zo", headers=HEADERS)
+    assert [item["name"] for item in response.json()] == ["Zoe"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_contacts_falls_back_to_database_for_large_organizations(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    for name in ["Dana Ross", "Dan", "Eve"]:
+        await api_client.post("/api/v1/contacts", json={"name": name}, headers=HEADERS)
+
+    suggest_index = ContactSuggestIndex.get_instance()
+    max_contacts = suggest_index.max_contacts_per_organization
+    suggest_index.max_contacts_per_organization = 2
+    try:
+        response = await api_client.get("/api/v1/contacts/suggest?q=ro", headers=HEADERS)
+        assert [item["name"] for item in response.json()] == ["Dana Ross"]
+        response = await api_client.get("/api/v1/contacts/suggest?q=dan", headers=HEADERS)
+        assert [item["name"] for item in response.json()] == ["Dan", "Dana Ross"]
+    finally:
+        suggest_index.max_contacts_per_organization = max_contacts
+
+
+@pytest.mark.asyncio
+async def test_list_contacts_cursor_pagination(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    for name in ["Ann", "Bob", "Anabel", "Cid", "Hanna"]:
+        await api_client.post("/api/v1/contacts", json={"name": name}, headers=HEADERS)
+
+    response = await api_client.get("/api/v1/contacts?page_size=2", headers=HEADERS)
+    data = response.json()
+    assert data["meta"]["total"] == 5
+    seen = [item["id"] for item in data["items"]]
+
+    cursor = data["meta"]["next_cursor"]
+    while cursor is not None:
+        response = await api_client.get(
+            f"/api/v1/contacts?page_size=2&cursor={cursor}", headers=HEADERS
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["meta"]["total"] is None
+        assert data["meta"]["page"] is None
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["meta"]["next_cursor"]
+
+    assert seen == [1, 2, 3, 4, 5]
+
+    # A search walks by keyset in id order when asked to, from the first page on
+    response = await api_client.get(
+        "/api/v1/contacts?search=an&page_size=2&order_by=id", headers=HEADERS
+    )
+    data = response.json()
+    assert data["meta"]["total"] is None
+    assert [item["id"] for item in data["items"]] == [1, 3]
+    response = await api_client.get(
+        f"/api/v1/contacts?search=an&page_size=2&cursor={data['meta']['next_cursor']}",
+        headers=HEADERS,
+    )
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [5]
+    assert data["meta"]["next_cursor"] is None
+
+    # Without it the first search page is ranked and has no cursor to continue from
+    response = await api_client.get("/api/v1/contacts?search=an&page_size=2", headers=HEADERS)
+    assert response.json()["meta"]["next_cursor"] is None
+
+    response = await api_client.get("/api/v1/contacts?cursor=not-a-cursor", headers=HEADERS)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_contact_repository_guarded_delete_is_single_statement(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+    for name in ["Kept for deal", "Deleted", "Other owner"]:
+        await repository.create(organization_id=1, owner_id=1, payload=ContactCreate(name=name))
+    db_session.add(
+        Deal(
+            organization_id=1,
+            contact_id=1,
+            owner_id=1,
+            title="Open deal",
+            amount=Decimal("10.00"),
+            currency="USD",
+            status=DealStatus.NEW,
+            stage=DealStage.QUALIFICATION,
+            created_at=datetime.now(tz=UTC),
+            updated_at=datetime.now(tz=UTC),
+        )
+    )
+    await db_session.flush()
+
+    query_counter.reset()
+    outcomes = await repository.delete_many(1, [1, 2, 99])
+    assert query_counter.count == 1
+    assert sorted((o.id, o.deleted) for o in outcomes) == [(1, False), (2, True)]
+
+    outcomes = await repository.delete_many(1, [3], owner_id=2)
+    assert [(o.id, o.owner_id, o.deleted) for o in outcomes] == [(3, 1, False)]
+    assert await repository.count(1) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_contacts_reports_kept_contacts(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    db_session.add(
+        Deal(
+            organization_id=1,
+            contact_id=1,
+            owner_id=1,
+            title="Open deal",
+            amount=Decimal("10.00"),
+            currency="USD",
+            status=DealStatus.NEW,
+            stage=DealStage.QUALIFICATION,
+            created_at=datetime.now(tz=UTC),
+            updated_at=datetime.now(tz=UTC),
+        )
+    )
+    db_session.add(Contact(id=2, organization_id=1, owner_id=1, name="Jane"))
+    await db_session.commit()
+
+    response = await api_client.post(
+        "/api/v1/contacts/bulk/delete", json={"ids": [1, 2, 404]}, headers=HEADERS
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted"] == [2]
+    assert [(error["index"], "deals" in error["detail"]) for error in data["errors"]] == [
+        (0, True),
+        (2, False),
+    ]
+
+    response = await api_client.post(
+        "/api/v1/contacts/bulk/delete", json={"ids": [1, 1]}, headers=HEADERS
+    )
+    assert response.status_code == 422
+
+
+def test_group_duplicates_joins_pairs_transitively() -> None:
+    pairs = [
+        ContactDuplicatePair(contact_id=3, duplicate_id=7, matched_on="phone", score=0.5),
+        ContactDuplicatePair(contact_id=1, duplicate_id=3, matched_on="email", score=0.9),
+        ContactDuplicatePair(contact_id=4, duplicate_id=5, matched_on="email", score=1.0),
+    ]
+
+    groups = ContactDomainService.group_duplicates(pairs)
+
+    assert [(g.primary_id, g.duplicate_ids, g.matched_on, g.score) for g in groups] == [
+        (1, [3, 7], ["email", "phone"], 0.5),
+        (4, [5], ["email"], 1.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_contact_repository_finds_duplicates_within_blocks(
+    db_session: AsyncSession,
+) -> None:
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+    contacts = [
+        ("John Smith", "john@example.com", None),
+        ("Jon Smith", "JOHN@Example.com", None),
+        ("Accounts Team", "john@example.com", None),
+        ("Maria Garcia", None, "+1 (555) 010-2000"),
+        ("Maria Garcia Lopez", None, "555.010.2000"),
+        ("Someone Else", "else@example.com", "555-010-9999"),
+    ]
+    for name, email, phone in contacts:
+        db_session.add(Contact(organization_id=1, owner_id=1, name=name, email=email, phone=phone))
+    await db_session.flush()
+
+    pairs = await repository.find_duplicate_pairs(1, min_name_similarity=0.4, max_block_size=50)
+
+    assert sorted((p.contact_id, p.duplicate_id, p.matched_on) for p in pairs) == [
+        (1, 2, "email"),
+        (4, 5, "phone"),
+    ]
+    # A block too large to compare pairwise is still matched against its oldest contact
+    for _ in range(3):
+        db_session.add(
+            Contact(organization_id=1, owner_id=1, name="John Smith", email="john@example.com")
+        )
+    await db_session.flush()
+    pairs = await repository.find_duplicate_pairs(1, min_name_similarity=0.4, max_block_size=2)
+    assert sorted((p.contact_id, p.duplicate_id) for p in pairs) == [
+        (1, 2),
+        (1, 7),
+        (1, 8),
+        (1, 9),
+        (4, 5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_contact_duplicate_scan_and_merge(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    db_session.add_all(
+        [
+            Contact(id=1, organization_id=1, owner_id=1, name="Ada Lovelace", phone="555-0100"),
+            Contact(id=2, organization_id=1, owner_id=1, name="Ada Lovelace", email="ada@x.io"),
+            Contact(id=3, organization_id=1, owner_id=1, name="Ada  Lovelace", phone="5550100"),
+        ]
+    )
+    await db_session.flush()
+    for contact_id in (2, 3, 3):
+        db_session.add(
+            Deal(
+                organization_id=1,
+                contact_id=contact_id,
+                owner_id=1,
+                title="Deal",
+                amount=Decimal("10.00"),
+                currency="USD",
+                status=DealStatus.NEW,
+                stage=DealStage.QUALIFICATION,
+                created_at=datetime.now(tz=UTC),
+                updated_at=datetime.now(tz=UTC),
+            )
+        )
+    await db_session.commit()
+
+    response = await api_client.get("/api/v1/contacts/duplicates", headers=HEADERS)
+    assert response.status_code == 404
+
+    response = await api_client.post("/api/v1/contacts/duplicates/scan", headers=HEADERS)
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+
+    worker = ContactDuplicateWorker(session_factory, RedisCache.get_instance())
+    assert await worker.run_once() == [1]
+
+    report = (await api_client.get("/api/v1/contacts/duplicates", headers=HEADERS)).json()
+    assert report["status"] == "ready"
+    assert [(g["primary_id"], g["duplicate_ids"]) for g in report["groups"]] == [(1, [3])]
+
+    response = await api_client.post(
+        "/api/v1/contacts/merge", json={"primary_id": 1, "duplicate_ids": [2, 3]}, headers=HEADERS
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deals_moved"] == 3
+    assert data["contact"]["email"] == "ada@x.io"
+    assert data["contact"]["phone"] == "555-0100"
+
+    response = await api_client.get("/api/v1/deals", headers=HEADERS)
+    assert {deal["contact_id"] for deal in response.json()["items"]} == {1}
+    response = await api_client.get("/api/v1/contacts", headers=HEADERS)
+    assert [item["id"] for item in response.json()["items"]] == [1]
+
+    # The merge made the stored report stale, so it is rescanned
+    report = (await api_client.get("/api/v1/contacts/duplicates", headers=HEADERS)).json()
+    assert report["status"] == "pending"
+    assert report["groups"] == []
+    assert await worker.run_once() == [1]
+    report = (await api_client.get("/api/v1/contacts/duplicates", headers=HEADERS)).json()
+    assert report["status"] == "ready"
+    assert report["groups"] == []
+
+    response = await api_client.post(
+        "/api/v1/contacts/merge", json={"primary_id": 1, "duplicate_ids": [2]}, headers=HEADERS
+    )
+    assert response.status_code == 404
+
+
+def _deal(
+    contact_id: int,
+    amount: str,
+    deal_status: DealStatus,
+    organization_id: int = 1,
+    currency: str = "USD",
+) -> Deal:
+    return Deal(
+        organization_id=organization_id,
+        contact_id=contact_id,
+        owner_id=1,
+        title="Deal",
+        amount=Decimal(amount),
+        currency=currency,
+        status=deal_status,
+        stage=DealStage.QUALIFICATION,
+        created_at=datetime.now(tz=UTC),
+        updated_at=datetime.now(tz=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_contact_repository_reads_deal_stats_with_the_page(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    repository = SQLAlchemyContactRepository(session=db_session)
+    for name in ["Anna Bergman", "Anna Berg", "Boris"]:
+        await repository.create(organization_id=1, owner_id=1, payload=ContactCreate(name=name))
+    db_session.add_all(
+        [
+            _deal(1, "100.00", DealStatus.NEW),
+            _deal(1, "50.00", DealStatus.IN_PROGRESS),
+            _deal(1, "70.00", DealStatus.WON),
+            _deal(1, "30.00", DealStatus.LOST),
+            _deal(1, "40.00", DealStatus.NEW, currency="EUR"),
+            _deal(3, "20.00", DealStatus.WON),
+        ]
+    )
+    await db_session.flush()
+
+    query_counter.reset()
+    items, total = await repository.list(1, page=1, page_size=2, with_deal_stats=True)
+    assert query_counter.count == 1
+    assert total == 3
+    assert [item.id for item in items] == [1, 2]
+    assert items[0].deal_stats is not None
+    assert items[0].deal_stats.deal_count == 5
+    # Amounts in different currencies are never added together
+    assert [
+        (amounts.currency, amounts.open_amount, amounts.won_amount)
+        for amounts in items[0].deal_stats.amounts
+    ] == [("EUR", Decimal("40.00"), 0), ("USD", Decimal("150.00"), Decimal("70.00"))]
+    assert items[1].deal_stats is not None
+    assert items[1].deal_stats.deal_count == 0
+    assert items[1].deal_stats.amounts == []
+
+    # Similarity ranking survives the wrap around the page
+    items, _has_more = await repository.list_page(
+        1, page=1, page_size=5, search="Berg", with_deal_stats=True
+    )
+    assert [item.id for item in items] == [2, 1]
+
+    items, has_more = await repository.list_after(
+        1, cursor=ContactCursor(id=1), limit=5, with_deal_stats=True
+    )
+    assert not has_more
+    assert [(item.id, item.deal_stats and item.deal_stats.amounts) for item in items] == [
+        (2, []),
+        (3, [ContactDealAmounts(currency="USD", won_amount=Decimal("20.00"))]),
+    ]
+
+    contact = await repository.get_by_id(1, 3)
+    assert contact is not None
+    assert contact.deal_stats is None
+
+
+@pytest.mark.asyncio
+async def test_get_contact_with_deal_stats(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    db_session.add(Contact(id=1, organization_id=1, owner_id=1, name="Ada"))
+    await db_session.flush()
+    db_session.add_all([_deal(1, "10.00", DealStatus.NEW), _deal(1, "5.00", DealStatus.WON)])
+    await db_session.commit()
+
+    response = await api_client.get("/api/v1/contacts/1", headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()["deal_stats"] == {
+        "deal_count": 2,
+        "amounts": [{"currency": "USD", "open_amount": "10.00", "won_amount": "5.00"}],
+    }
+
+    response = await api_client.get("/api/v1/contacts/99", headers=HEADERS)
+    assert response.status_code == 404
+
+    response = await api_client.get("/api/v1/contacts", headers=HEADERS)
+    assert response.json()["items"][0]["deal_stats"] is None
+    response = await api_client.get(
+        "/api/v1/contacts", params={"include": "deal_stats"}, headers=HEADERS
+    )
+    assert response.json()["items"][0]["deal_stats"]["deal_count"] == 2
+    response = await api_client.get(
+        "/api/v1/contacts", params={"include": "deals"}, headers=HEADERS
+    )
+    assert response.status_code == 422
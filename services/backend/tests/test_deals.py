@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import UTC, datetime
 from decimal import Decimal
 
 import pytest
+from conftest import QueryCounter
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.pagination import CachedCounter
 from mini_crm.core.security import create_access_token
 from mini_crm.modules.auth.models import OrganizationMember, User
 from mini_crm.modules.contacts.models import Contact
 from mini_crm.modules.deals.dto.schemas import DealCreate, DealUpdate
+from mini_crm.modules.deals.models import Deal
 from mini_crm.modules.deals.repositories.sqlalchemy import SQLAlchemyDealRepository
 from mini_crm.modules.organizations.models import Organization
 from mini_crm.shared.enums import DealStage, DealStatus, UserRole
@@ -19,6 +27,13 @@ HEADERS = {
     "Authorization": f"Bearer {create_access_token(1)}",
     "X-Organization-Id": "1",
 }
+DEFAULT_FILTERS: dict[str, object] = {
+    "status": None,
+    "min_amount": None,
+    "max_amount": None,
+    "stage": None,
+    "owner_id": None,
+}
 
 
 async def seed_user_and_org(session: AsyncSession) -> None:
@@ -133,6 +148,35 @@ async def test_deal_repository_update(db_session: AsyncSession) -> None:
     assert updated.id == created.id
 
 
+@pytest.mark.asyncio
+async def test_deal_repository_write_statement_counts(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    repository = SQLAlchemyDealRepository(session=db_session)
+
+    query_counter.reset()
+    created = await repository.create(
+        organization_id=1,
+        owner_id=1,
+        payload=DealCreate(contact_id=1, title="Deal", amount=Decimal("10.00"), currency="USD"),
+    )
+    # Contact ownership check plus INSERT ... RETURNING
+    assert query_counter.count == 2
+    assert created.created_at is not None
+    assert created.updated_at is not None
+
+    query_counter.reset()
+    updated = await repository.update(
+        organization_id=1, deal_id=created.id, payload=DealUpdate(stage=DealStage.PROPOSAL)
+    )
+    # UPDATE ... RETURNING, including the refreshed updated_at
+    assert query_counter.count == 1
+    assert updated.stage == DealStage.PROPOSAL
+    assert updated.updated_at >= created.updated_at
+
+
 @pytest.mark.asyncio
 async def test_deal_repository_update_won_with_zero_amount(db_session: AsyncSession) -> None:
     from mini_crm.modules.activities.repositories.repository import InMemoryActivityRepository
@@ -840,3 +884,388 @@ async def test_deals_list_combined_filters(
     data = response.json()
     assert data["meta"]["total"] == 1
     assert data["items"][0]["title"] == "Deal 3"
+
+
+@pytest.mark.asyncio
+async def test_deals_list_cursor_pagination(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    # Duplicate amounts exercise the id tiebreaker
+    amounts = ["300.00", "100.00", "200.00", "100.00", "300.00"]
+    for index, amount in enumerate(amounts):
+        create_payload = {
+            "contact_id": 1,
+            "title": f"Deal {index}",
+            "amount": amount,
+            "currency": "USD",
+        }
+        await api_client.post("/api/v1/deals", json=create_payload, headers=HEADERS)
+
+    query = "/api/v1/deals?order_by=amount&order=desc&page_size=2"
+    response = await api_client.get(query, headers=HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["meta"]["total"] == 5
+    seen = [item["id"] for item in data["items"]]
+
+    cursor = data["meta"]["next_cursor"]
+    while cursor is not None:
+        response = await api_client.get(f"{query}&cursor={cursor}", headers=HEADERS)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["meta"]["total"] is None
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["meta"]["next_cursor"]
+
+    assert seen == [5, 1, 3, 4, 2]
+
+    # Keyset mode still applies the regular filters
+    response = await api_client.get("/api/v1/deals?min_amount=200.00&page_size=1", headers=HEADERS)
+    cursor = response.json()["meta"]["next_cursor"]
+    response = await api_client.get(
+        f"/api/v1/deals?min_amount=200.00&page_size=10&cursor={cursor}", headers=HEADERS
+    )
+    assert [item["id"] for item in response.json()["items"]] == [3, 5]
+
+
+@pytest.mark.asyncio
+async def test_deals_list_rejects_invalid_cursor(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    for index in range(2):
+        create_payload = {
+            "contact_id": 1,
+            "title": f"Deal {index}",
+            "amount": "100.00",
+            "currency": "USD",
+        }
+        await api_client.post("/api/v1/deals", json=create_payload, headers=HEADERS)
+
+    response = await api_client.get("/api/v1/deals?cursor=not-a-cursor", headers=HEADERS)
+    assert response.status_code == 400
+
+    response = await api_client.get("/api/v1/deals?page_size=1", headers=HEADERS)
+    cursor = response.json()["meta"]["next_cursor"]
+    response = await api_client.get(
+        f"/api/v1/deals?order_by=created_at&cursor={cursor}", headers=HEADERS
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_deals_list_without_total_and_estimated_total(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await RedisCache.get_instance().delete(CachedCounter.key("deals", 1, **DEFAULT_FILTERS))
+
+    async def create_deal(index: int) -> None:
+        create_payload = {
+            "contact_id": 1,
+            "title": f"Deal {index}",
+            "amount": "100.00",
+            "currency": "USD",
+        }
+        await api_client.post("/api/v1/deals", json=create_payload, headers=HEADERS)
+
+    for index in range(3):
+        await create_deal(index)
+
+    response = await api_client.get(
+        "/api/v1/deals?include_total=false&page_size=2", headers=HEADERS
+    )
+    assert response.status_code == 200
+    meta = response.json()["meta"]
+    assert meta["total"] is None
+    assert meta["has_more"] is True
+
+    response = await api_client.get(
+        "/api/v1/deals?include_total=false&page_size=2&page=2", headers=HEADERS
+    )
+    meta = response.json()["meta"]
+    assert len(response.json()["items"]) == 1
+    assert meta["has_more"] is False
+
+    response = await api_client.get("/api/v1/deals?total_mode=estimated", headers=HEADERS)
+    assert response.json()["meta"]["total"] == 3
+
+    # Estimated totals are served from cache until the entry expires
+    await create_deal(3)
+    response = await api_client.get("/api/v1/deals?total_mode=estimated", headers=HEADERS)
+    assert response.json()["meta"]["total"] == 3
+    assert len(response.json()["items"]) == 4
+
+    response = await api_client.get("/api/v1/deals", headers=HEADERS)
+    assert response.json()["meta"]["total"] == 4
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_deal_repository_list_total_beyond_last_page(
+    db_session: AsyncSession,
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    repository = SQLAlchemyDealRepository(session=db_session)
+
+    for index in range(3):
+        payload = DealCreate(contact_id=1, title=f"Deal {index}", amount=Decimal("10.00"))
+        await repository.create(organization_id=1, owner_id=1, payload=payload)
+
+    items, total = await repository.list(organization_id=1, page=2, page_size=2)
+    assert [item.title for item in items] == ["Deal 2"]
+    assert total == 3
+
+    items, total = await repository.list(organization_id=1, page=5, page_size=2)
+    assert items == []
+    assert total == 3
+
+    items, total = await repository.list(
+        organization_id=1, page=1, page_size=2, status=[DealStatus.WON]
+    )
+    assert items == []
+    assert total == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_deals_reports_per_item_errors(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    items = [
+        {"contact_id": 1, "title": "First", "amount": "100.00", "currency": "USD"},
+        {"contact_id": 999, "title": "Unknown contact", "amount": "200.00"},
+        {"contact_id": 1, "title": "Third", "amount": "300.00", "currency": "EUR"},
+    ]
+    response = await api_client.post("/api/v1/deals/bulk", json={"items": items}, headers=HEADERS)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert [deal["title"] for deal in data["created"]] == ["First", "Third"]
+    assert all(deal["owner_id"] == 1 for deal in data["created"])
+    assert data["created"][1]["currency"] == "EUR"
+    assert data["created"][0]["status"] == DealStatus.NEW.value
+    assert data["errors"] == [{"index": 1, "detail": "Contact with id 999 not found"}]
+
+    response = await api_client.get("/api/v1/deals", headers=HEADERS)
+    assert response.json()["meta"]["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_deals_rejects_empty_payload(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    response = await api_client.post("/api/v1/deals/bulk", json={"items": []}, headers=HEADERS)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_deals_applies_rules_per_deal(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+
+    items = [
+        {"contact_id": 1, "title": "Good", "amount": "100.00"},
+        {"contact_id": 1, "title": "Zero amount", "amount": "0"},
+        {"contact_id": 1, "title": "Also good", "amount": "50.00"},
+    ]
+    response = await api_client.post("/api/v1/deals/bulk", json={"items": items}, headers=HEADERS)
+    good, zero, also_good = (deal["id"] for deal in response.json()["created"])
+
+    response = await api_client.post(
+        "/api/v1/deals/bulk/transition",
+        json={"ids": [also_good, zero, 999, good], "status": "won", "stage": "closed"},
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [deal["id"] for deal in data["updated"]] == [also_good, good]
+    assert all(deal["status"] == "won" and deal["stage"] == "closed" for deal in data["updated"])
+    assert data["errors"] == [
+        {"index": 1, "detail": "Amount must be positive for won deals"},
+        {"index": 2, "detail": "Deal with id 999 not found"},
+    ]
+
+    response = await api_client.get(f"/api/v1/deals/{good}/activities", headers=HEADERS)
+    types = sorted(activity["type"] for activity in response.json())
+    assert types == ["stage_changed", "status_changed"]
+    response = await api_client.get(f"/api/v1/deals/{zero}/activities", headers=HEADERS)
+    assert response.json() == []
+
+    # Stage rollback stays forbidden for members, and members only touch their own deals
+    db_session.add(
+        User(
+            id=2,
+            email="member@example.com",
+            hashed_password="hashed",
+            name="Member",
+            created_at=datetime.now(tz=UTC),
+        )
+    )
+    await db_session.commit()
+    await seed_organization_member(db_session, user_id=2, organization_id=1, role=UserRole.MEMBER)
+    member_headers = {
+        "Authorization": f"Bearer {create_access_token(2)}",
+        "X-Organization-Id": "1",
+    }
+    response = await api_client.post(
+        "/api/v1/deals/bulk/transition",
+        json={"ids": [good], "stage": "proposal"},
+        headers=member_headers,
+    )
+    assert response.json()["errors"] == [
+        {"index": 0, "detail": "You can only update your own deals"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_transition_requires_status_or_stage(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+
+    response = await api_client.post(
+        "/api/v1/deals/bulk/transition", json={"ids": [1]}, headers=HEADERS
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_deals_streams_filtered_csv_and_ndjson(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    for amount in ["500.00", "1500.00", "2500.00"]:
+        await api_client.post(
+            "/api/v1/deals",
+            json={"contact_id": 1, "title": f"Deal {amount}", "amount": amount},
+            headers=HEADERS,
+        )
+
+    response = await api_client.get(
+        "/api/v1/deals/export?min_amount=1000&order_by=amount&order=desc", headers=HEADERS
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="deals.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Deal 2500.00", "Deal 1500.00"]
+    assert rows[0]["status"] == DealStatus.NEW.value
+
+    response = await api_client.get("/api/v1/deals/export?format=ndjson", headers=HEADERS)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [Decimal(line["amount"]) for line in lines] == [
+        Decimal("500.00"),
+        Decimal("1500.00"),
+        Decimal("2500.00"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_deals_owner_filter_member_forbidden(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1, role=UserRole.MEMBER)
+
+    response = await api_client.get("/api/v1/deals/export?owner_id=1", headers=HEADERS)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_deals_closes_session_when_request_is_rejected(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    from mini_crm.app.main import app
+    from mini_crm.core.dependencies import get_streaming_session
+
+    closed: list[bool] = []
+
+    class RecordingSession(AsyncSession):
+        async def close(self) -> None:
+            closed.append(True)
+            await super().close()
+
+    factory = async_sessionmaker(session_factory.kw["bind"], class_=RecordingSession)
+    app.dependency_overrides[get_streaming_session] = lambda: factory()
+    try:
+        await seed_user_and_org(db_session)
+        await seed_organization_member(
+            db_session, user_id=1, organization_id=1, role=UserRole.MEMBER
+        )
+
+        response = await api_client.get("/api/v1/deals/export?status=bogus", headers=HEADERS)
+        assert response.status_code == 400
+        response = await api_client.get("/api/v1/deals/export?owner_id=1", headers=HEADERS)
+        assert response.status_code == 403
+        assert closed == [True, True]
+    finally:
+        app.dependency_overrides.pop(get_streaming_session, None)
+
+
+@pytest.mark.asyncio
+async def test_deal_write_marks_analytics_dirty_after_commit(
+    api_client: AsyncClient,
+    db_session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    from mini_crm.app.main import app
+    from mini_crm.modules.analytics.application.tracking import AnalyticsActivityTracker
+    from mini_crm.modules.deals.api.router import get_analytics_tracker
+
+    committed_deals: list[int] = []
+
+    class FailingCache:
+        async def sadd(self, *_args: object) -> int:
+            raise ConnectionError("redis is down")
+
+    class RecordingTracker(AnalyticsActivityTracker):
+        async def mark_dirty(self, organization_id: int) -> None:
+            # A fresh session only sees the deal once the request has committed
+            async with session_factory() as session:
+                committed_deals.append(await session.scalar(select(func.count(Deal.id))) or 0)
+            await super().mark_dirty(organization_id)
+
+    app.dependency_overrides[get_analytics_tracker] = lambda: RecordingTracker(
+        FailingCache()  # type: ignore[arg-type]
+    )
+    try:
+        await seed_user_and_org(db_session)
+        await seed_organization_member(db_session, user_id=1, organization_id=1)
+        await seed_contact(db_session, organization_id=1, owner_id=1)
+
+        response = await api_client.post(
+            "/api/v1/deals",
+            json={"contact_id": 1, "title": "Deal", "amount": "100.00", "currency": "USD"},
+            headers=HEADERS,
+        )
+        # The tracker's Redis failure is logged, not surfaced to the client
+        assert response.status_code == 201
+        assert committed_deals == [1]
+    finally:
+        app.dependency_overrides.pop(get_analytics_tracker, None)
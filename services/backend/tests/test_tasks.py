@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from conftest import QueryCounter
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from mini_crm.app.worker import TaskReminderWorker
+from mini_crm.config.settings import Settings, get_settings
+from mini_crm.core.cache import RedisCache
+from mini_crm.core.identity import verified_aggregates
 from mini_crm.core.security import create_access_token
+from mini_crm.modules.activities.models import Activity
+from mini_crm.modules.activities.repositories.sqlalchemy import SQLAlchemyActivityRepository
 from mini_crm.modules.auth.models import OrganizationMember, User
+from mini_crm.modules.common.context import OrganizationContext, RequestContext, RequestUser
 from mini_crm.modules.contacts.models import Contact
 from mini_crm.modules.deals.models import Deal
+from mini_crm.modules.deals.repositories.sqlalchemy import SQLAlchemyDealRepository
 from mini_crm.modules.organizations.models import Organization
+from mini_crm.modules.tasks.application.use_cases import CreateTaskUseCase
+from mini_crm.modules.tasks.dto.schemas import TaskCreate
 from mini_crm.modules.tasks.models import Task
+from mini_crm.modules.tasks.repositories.sqlalchemy import SQLAlchemyTaskRepository
 from mini_crm.shared.enums import ActivityType, DealStage, DealStatus, UserRole
 
 HEADERS = {
@@ -337,6 +352,7 @@ async def test_list_tasks_filters_by_deal_and_only_open(
 
     tasks = [
         Task(
+            organization_id=1,
             deal_id=deal_one.id,
             title="Deal One Open",
             description=None,
@@ -344,6 +360,7 @@ async def test_list_tasks_filters_by_deal_and_only_open(
             is_done=False,
         ),
         Task(
+            organization_id=1,
             deal_id=deal_one.id,
             title="Deal One Done",
             description=None,
@@ -351,6 +368,7 @@ async def test_list_tasks_filters_by_deal_and_only_open(
             is_done=True,
         ),
         Task(
+            organization_id=1,
             deal_id=deal_two.id,
             title="Deal Two Open",
             description=None,
@@ -367,7 +385,7 @@ async def test_list_tasks_filters_by_deal_and_only_open(
         headers=HEADERS,
     )
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["title"] == "Deal One Open"
     assert data[0]["deal_id"] == deal_one.id
@@ -385,6 +403,7 @@ async def test_list_tasks_filters_by_due_range(
     now = datetime.now(tz=UTC)
     tasks = [
         Task(
+            organization_id=1,
             deal_id=deal.id,
             title="Past Task",
             description=None,
@@ -392,6 +411,7 @@ async def test_list_tasks_filters_by_due_range(
             is_done=False,
         ),
         Task(
+            organization_id=1,
             deal_id=deal.id,
             title="Window Task",
             description=None,
@@ -399,6 +419,7 @@ async def test_list_tasks_filters_by_due_range(
             is_done=False,
         ),
         Task(
+            organization_id=1,
             deal_id=deal.id,
             title="Future Task",
             description=None,
@@ -406,6 +427,7 @@ async def test_list_tasks_filters_by_due_range(
             is_done=False,
         ),
         Task(
+            organization_id=1,
             deal_id=deal.id,
             title="No Due Date",
             description=None,
@@ -424,6 +446,424 @@ async def test_list_tasks_filters_by_due_range(
         headers=HEADERS,
     )
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["title"] == "Window Task"
+
+
+@pytest.mark.asyncio
+async def test_sqlalchemy_task_repository_create_statement_count(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    repository = SQLAlchemyTaskRepository(session=db_session)
+
+    query_counter.reset()
+    created = await repository.create(
+        organization_id=1, payload=TaskCreate(deal_id=1, title="Call")
+    )
+
+    # The deal ownership check is folded into INSERT ... SELECT ... RETURNING
+    assert query_counter.count == 1
+    assert created.id is not None
+
+
+@pytest.mark.asyncio
+async def test_create_task_use_case_checks_deal_once(
+    db_session: AsyncSession, query_counter: QueryCounter
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    use_case = CreateTaskUseCase(
+        SQLAlchemyTaskRepository(db_session),
+        SQLAlchemyDealRepository(db_session),
+        SQLAlchemyActivityRepository(db_session),
+    )
+    user = RequestUser(id=1, email="owner@example.com")
+    payload = TaskCreate(deal_id=1, title="Call")
+
+    # The task insert verifies the deal; the activity insert reuses that check
+    query_counter.reset()
+    owner = RequestContext(user=user, organization=OrganizationContext(1, UserRole.OWNER))
+    await use_case.execute(owner, payload)
+    assert query_counter.count == 2
+    assert "deals" not in query_counter.statements[-1]
+
+    # Members load the deal to check its owner; both inserts then reuse it
+    query_counter.reset()
+    member = RequestContext(user=user, organization=OrganizationContext(1, UserRole.MEMBER))
+    await use_case.execute(member, payload)
+    assert query_counter.count == 3
+    assert all("deals" not in statement for statement in query_counter.statements[1:])
+
+    # What was verified is forgotten once the transaction ends
+    await db_session.commit()
+    assert not verified_aggregates(db_session).contains(Deal, organization_id=1, ids=[1])
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_pages_by_cursor(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1, role=UserRole.OWNER)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+
+    now = datetime.now(tz=UTC)
+    due_dates = [
+        now + timedelta(days=3),
+        None,
+        now + timedelta(days=1),
+        None,
+        now + timedelta(days=1),
+    ]
+    db_session.add_all(
+        Task(
+            organization_id=1,
+            deal_id=deal.id,
+            title=f"Task {position}",
+            due_date=due_date,
+            is_done=position == 4,
+            created_at=now - timedelta(minutes=position),
+        )
+        for position, due_date in enumerate(due_dates)
+    )
+    await db_session.commit()
+
+    async def walk(params: dict[str, str]) -> list[str]:
+        titles: list[str] = []
+        cursor = None
+        while True:
+            page_params = {**params, "page_size": "2"}
+            if cursor is not None:
+                page_params["cursor"] = cursor
+            response = await api_client.get("/api/v1/tasks", params=page_params, headers=HEADERS)
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) <= 2
+            assert data["meta"]["has_more"] is (data["meta"]["next_cursor"] is not None)
+            titles.extend(task["title"] for task in data["items"])
+            cursor = data["meta"]["next_cursor"]
+            if cursor is None:
+                return titles
+
+    # Newest first by default
+    assert await walk({}) == [f"Task {position}" for position in range(5)]
+    # Soonest due first, ties by id, and undated tasks last; pages cross into them
+    assert await walk({"order_by": "due_date"}) == [
+        "Task 2",
+        "Task 4",
+        "Task 0",
+        "Task 1",
+        "Task 3",
+    ]
+    assert await walk({"order_by": "due_date", "only_open": "true"}) == [
+        "Task 2",
+        "Task 0",
+        "Task 1",
+        "Task 3",
+    ]
+
+    response = await api_client.get("/api/v1/tasks", params={"page_size": "2"}, headers=HEADERS)
+    cursor = response.json()["meta"]["next_cursor"]
+    response = await api_client.get(
+        "/api/v1/tasks", params={"order_by": "due_date", "cursor": cursor}, headers=HEADERS
+    )
+    assert response.status_code == 400
+    response = await api_client.get("/api/v1/tasks", params={"cursor": "garbage"}, headers=HEADERS)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_task_reminder_worker_reminds_due_tasks_once(
+    db_session: AsyncSession, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+
+    now = datetime.now(tz=UTC)
+    due_dates = {
+        "Due Hour Ago": (now - timedelta(hours=1), False),
+        "Due Minute Ago": (now - timedelta(minutes=1), False),
+        "Done": (now - timedelta(hours=1), True),
+        "Long Overdue": (now - timedelta(days=3), False),
+        "Future": (now + timedelta(hours=1), False),
+        "No Due Date": (None, False),
+    }
+    db_session.add_all(
+        Task(organization_id=1, deal_id=deal.id, title=title, due_date=due_date, is_done=done)
+        for title, (due_date, done) in due_dates.items()
+    )
+    await db_session.commit()
+
+    # One task per batch, so the worker has to keep claiming until the backlog is empty
+    settings = get_settings().model_copy(update={"task_reminder_batch_size": 1})
+    worker = TaskReminderWorker(session_factory, RedisCache.get_instance(), settings)
+    assert await worker.run_once() == 2
+    assert await worker.run_once() == 0
+
+    activities = (
+        await db_session.scalars(select(Activity).where(Activity.type == ActivityType.TASK_DUE))
+    ).all()
+    assert sorted(activity.payload["task_title"] for activity in activities) == [
+        "Due Hour Ago",
+        "Due Minute Ago",
+    ]
+    assert {activity.organization_id for activity in activities} == {1}
+
+
+@pytest.mark.asyncio
+async def test_task_reminder_worker_stops_on_an_empty_batch(
+    session_factory: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TASK_REMINDER_BATCH_SIZE", "0")
+    with pytest.raises(ValidationError):
+        Settings()  # type: ignore[call-arg]
+
+    # Even a batch size that slipped past validation cannot make the loop spin
+    settings = get_settings().model_copy(update={"task_reminder_batch_size": 0})
+    worker = TaskReminderWorker(session_factory, RedisCache.get_instance(), settings)
+    assert await asyncio.wait_for(worker.run_once(), timeout=5) == 0
+
+
+@pytest.mark.asyncio
+async def test_claim_due_reminders_skips_tasks_claimed_concurrently(
+    db_session: AsyncSession, session_factory: async_sessionmaker[AsyncSession]
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+
+    now = datetime.now(tz=UTC)
+    db_session.add_all(
+        Task(
+            organization_id=1,
+            deal_id=deal.id,
+            title=f"Task {minutes}",
+            due_date=now - timedelta(minutes=minutes),
+        )
+        for minutes in (1, 2, 3)
+    )
+    await db_session.commit()
+    due_after = now - timedelta(days=1)
+
+    async with session_factory() as first, session_factory() as second:
+        first_claim = await SQLAlchemyTaskRepository(first).claim_due_reminders(due_after, now, 1)
+        # The first claim is still open; its row is skipped instead of waited on
+        second_claim = await SQLAlchemyTaskRepository(second).claim_due_reminders(
+            due_after, now, 10
+        )
+        await first.commit()
+        await second.commit()
+
+    assert [task.title for _organization_id, task in first_claim] == ["Task 3"]
+    assert [task.title for _organization_id, task in second_claim] == ["Task 2", "Task 1"]
+    repository = SQLAlchemyTaskRepository(db_session)
+    assert await repository.claim_due_reminders(due_after, now, 10) == []
+
+
+async def seed_member_with_deal(session: AsyncSession) -> tuple[dict[str, str], Deal]:
+    """Add member user 2 to organization 1 with a deal of their own."""
+    now = datetime.now(tz=UTC)
+    session.add(
+        User(
+            id=2,
+            email="member@example.com",
+            hashed_password="hashed",
+            name="Member",
+            created_at=now,
+        )
+    )
+    await session.commit()
+    await seed_organization_member(session, user_id=2, organization_id=1, role=UserRole.MEMBER)
+    deal = Deal(
+        id=2,
+        organization_id=1,
+        contact_id=1,
+        owner_id=2,
+        title="Member Deal",
+        amount=100,
+        currency="USD",
+        status=DealStatus.NEW,
+        stage=DealStage.QUALIFICATION,
+        created_at=now,
+        updated_at=now,
+    )
+    session.add(deal)
+    await session.commit()
+    member_headers = {
+        "Authorization": f"Bearer {create_access_token(2)}",
+        "X-Organization-Id": "1",
+    }
+    return member_headers, deal
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tasks_reports_per_item_errors(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    foreign_deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    member_headers, own_deal = await seed_member_with_deal(db_session)
+
+    tomorrow = (datetime.now(tz=UTC) + timedelta(days=1)).isoformat()
+    items = [
+        {"deal_id": own_deal.id, "title": "Call", "due_date": tomorrow},
+        {"deal_id": foreign_deal.id, "title": "Foreign"},
+        {"deal_id": 999, "title": "Missing"},
+        {
+            "deal_id": own_deal.id,
+            "title": "Past",
+            "due_date": (datetime.now(tz=UTC) - timedelta(days=2)).isoformat(),
+        },
+        {"deal_id": own_deal.id, "title": "Email"},
+    ]
+    response = await api_client.post(
+        "/api/v1/tasks/bulk", json={"items": items}, headers=member_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["title"] for task in data["created"]] == ["Call", "Email"]
+    assert data["errors"] == [
+        {"index": 1, "detail": "You can only create tasks for your own deals"},
+        {"index": 2, "detail": "Deal with id 999 not found"},
+        {"index": 3, "detail": "due_date cannot be in the past"},
+    ]
+
+    response = await api_client.get(f"/api/v1/deals/{own_deal.id}/activities", headers=HEADERS)
+    titles = sorted(activity["payload"]["task_title"] for activity in response.json())
+    assert titles == ["Call", "Email"]
+
+    response = await api_client.post("/api/v1/tasks/bulk", json={"items": []}, headers=HEADERS)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_complete_and_reschedule_tasks(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    foreign_deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+    member_headers, own_deal = await seed_member_with_deal(db_session)
+
+    items = [
+        {"deal_id": own_deal.id, "title": "Own"},
+        {"deal_id": foreign_deal.id, "title": "Foreign"},
+    ]
+    response = await api_client.post("/api/v1/tasks/bulk", json={"items": items}, headers=HEADERS)
+    own, foreign = (task["id"] for task in response.json()["created"])
+
+    response = await api_client.post(
+        "/api/v1/tasks/bulk/complete", json={"ids": [foreign, 404, own]}, headers=member_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(task["id"], task["is_done"]) for task in data["updated"]] == [(own, True)]
+    assert data["errors"] == [
+        {"index": 0, "detail": "You can only change tasks of your own deals"},
+        {"index": 1, "detail": "Task with id 404 not found"},
+    ]
+
+    due_date = datetime.now(tz=UTC) + timedelta(days=3)
+    response = await api_client.post(
+        "/api/v1/tasks/bulk/reschedule",
+        json={"ids": [foreign, own], "due_date": due_date.isoformat()},
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["id"] for task in data["updated"]] == [foreign, own]
+    assert {datetime.fromisoformat(task["due_date"]) for task in data["updated"]} == {due_date}
+    assert [task["is_done"] for task in data["updated"]] == [False, True]
+    assert data["errors"] == []
+
+    response = await api_client.post(
+        "/api/v1/tasks/bulk/reschedule",
+        json={"ids": [own], "due_date": (due_date - timedelta(days=10)).isoformat()},
+        headers=HEADERS,
+    )
+    assert response.status_code == 400
+
+    response = await api_client.post(
+        "/api/v1/tasks/bulk/complete", json={"ids": [own, own]}, headers=HEADERS
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_task_agenda_counts_and_lists_tasks_per_day(
+    api_client: AsyncClient, db_session: AsyncSession
+) -> None:
+    await seed_user_and_org(db_session)
+    await seed_organization_member(db_session, user_id=1, organization_id=1)
+    await seed_contact(db_session, organization_id=1, owner_id=1)
+    deal = await seed_deal(db_session, organization_id=1, contact_id=1, owner_id=1)
+
+    today = datetime.now(tz=UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday, tomorrow = today - timedelta(days=1), today + timedelta(days=1)
+    tasks = {
+        "Overdue": (yesterday + timedelta(hours=9), False),
+        "Done": (yesterday + timedelta(hours=10), True),
+        "Late Evening": (yesterday + timedelta(hours=23, minutes=30), False),
+        "Morning": (tomorrow + timedelta(hours=8), False),
+        "Noon": (tomorrow + timedelta(hours=12), False),
+        "Afternoon": (tomorrow + timedelta(hours=15), True),
+        "Out Of Range": (tomorrow + timedelta(days=5), False),
+    }
+    db_session.add_all(
+        Task(organization_id=1, deal_id=deal.id, title=title, due_date=due_date, is_done=done)
+        for title, (due_date, done) in tasks.items()
+    )
+    await db_session.commit()
+
+    params = {
+        "from": yesterday.isoformat(),
+        "to": (tomorrow + timedelta(days=1)).isoformat(),
+        "per_day": 2,
+    }
+    response = await api_client.get("/api/v1/tasks/agenda", params=params, headers=HEADERS)
+    assert response.status_code == 200
+    days = [
+        (
+            day["day"],
+            day["open_count"],
+            day["done_count"],
+            day["overdue_count"],
+            [task["title"] for task in day["tasks"]],
+        )
+        for day in response.json()
+    ]
+    assert days == [
+        (yesterday.date().isoformat(), 2, 1, 2, ["Overdue", "Done"]),
+        (tomorrow.date().isoformat(), 2, 1, 0, ["Morning", "Noon"]),
+    ]
+
+    # Days follow the requested timezone: 23:30 UTC is already the next day in Berlin
+    response = await api_client.get(
+        "/api/v1/tasks/agenda",
+        params={**params, "timezone": "Europe/Berlin", "per_day": 5},
+        headers=HEADERS,
+    )
+    assert [(day["day"], [task["title"] for task in day["tasks"]]) for day in response.json()][
+        :2
+    ] == [
+        (yesterday.date().isoformat(), ["Overdue", "Done"]),
+        (today.date().isoformat(), ["Late Evening"]),
+    ]
+
+    for invalid in (
+        {**params, "to": params["from"]},
+        {**params, "to": (yesterday + timedelta(days=90)).isoformat()},
+        {**params, "timezone": "Mars/Olympus"},
+    ):
+        response = await api_client.get("/api/v1/tasks/agenda", params=invalid, headers=HEADERS)
+        assert response.status_code == 400